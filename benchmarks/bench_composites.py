@@ -0,0 +1,71 @@
+"""Per-tick cost of regulating trees of composite pools"""
+import pytest
+
+from cobald.controller.linear import LinearController
+from cobald.composite.array import ArrayPool
+from cobald.composite.factory import FactoryPool
+from cobald.composite.uniform import UniformComposite
+from cobald.composite.weighted import WeightedComposite
+
+pytest.importorskip("pytest_benchmark")
+
+COMPOSITES = {
+    "uniform": UniformComposite,
+    "weighted": WeightedComposite,
+    "weighted-incremental": lambda *children: WeightedComposite(
+        *children, incremental=True
+    ),
+}
+
+
+def make_tree(composite, leaf_pool, depth: int, width: int):
+    """Create a balanced tree of ``width**depth`` leaf pools"""
+    if depth == 0:
+        return leaf_pool(demand=1, supply=1)
+    return composite(
+        *(make_tree(composite, leaf_pool, depth - 1, width) for _ in range(width))
+    )
+
+
+@pytest.mark.parametrize("composite", sorted(COMPOSITES))
+@pytest.mark.parametrize("depth, width", [(1, 10), (1, 1000), (2, 32), (3, 10)])
+def test_composite_tree(tick, leaf_pool, composite, depth, width):
+    root = make_tree(COMPOSITES[composite], leaf_pool, depth, width)
+    controller = LinearController(root)
+    tick(lambda: controller.regulate(1), rounds=100)
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+@pytest.mark.parametrize("size", [1000, 50000])
+def test_array_pool(tick, use_numpy, size):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    pool = ArrayPool(size, weight="supply", use_numpy=use_numpy)
+    pool.update(supply=1, utilisation=0.5, allocation=0.7)
+    controller = LinearController(pool)
+
+    def regulate():
+        controller.regulate(1)
+        pool.update(utilisation=0.5)
+
+    tick(regulate, rounds=100)
+
+
+@pytest.mark.parametrize("incremental", [False, True])
+@pytest.mark.parametrize("size", [1000, 10000])
+def test_factory_shrink(tick, leaf_pool, incremental, size):
+    children = [
+        leaf_pool(demand=1, supply=1, utilisation=index / size) for index in range(size)
+    ]
+    pool = FactoryPool(*children, factory=leaf_pool, incremental=incremental)
+
+    def release_one():
+        pool._shrink(target=size - 1)
+        # revive the released child to shrink the same pool again
+        (child,) = pool._mortuary
+        pool._mortuary.discard(child)
+        child.demand = 1
+        pool._hatchery.add(child)
+        pool.report(child)
+
+    tick(release_one, rounds=100)
@@ -0,0 +1,47 @@
+"""Per-tick cost of controllers regulating a single pool"""
+import pytest
+
+from cobald.controller.linear import LinearController
+from cobald.controller.relative_supply import RelativeSupplyController
+from cobald.controller.stepwise import stepwise
+from cobald.controller.switch import DemandSwitch
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize("utilisation", [0.1, 0.5, 0.9])
+def test_linear(tick, leaf_pool, utilisation):
+    pool = leaf_pool(demand=100, supply=100, utilisation=utilisation)
+    controller = LinearController(pool)
+    tick(lambda: controller.regulate(1))
+
+
+@pytest.mark.parametrize("utilisation", [0.1, 0.5, 0.9])
+def test_relative_supply(tick, leaf_pool, utilisation):
+    pool = leaf_pool(demand=100, supply=100, utilisation=utilisation)
+    controller = RelativeSupplyController(pool)
+    tick(lambda: controller.regulate(1))
+
+
+@pytest.mark.parametrize("bands", [1, 10, 100])
+def test_stepwise(tick, leaf_pool, bands):
+    @stepwise
+    def control(pool, interval):
+        return pool.demand
+
+    for band in range(1, bands):
+        control.add(lambda pool, interval: pool.demand, supply=band * 10)
+    # select a band in the middle to avoid trivial best cases
+    pool = leaf_pool(demand=bands * 5, supply=bands * 5)
+    controller = control(pool)
+    tick(lambda: controller.regulate(1))
+
+
+@pytest.mark.parametrize("slaves", [1, 10, 100])
+def test_demand_switch(tick, leaf_pool, slaves):
+    pool = leaf_pool(demand=slaves * 5, supply=slaves * 5)
+    thresholds = []
+    for index in range(1, slaves):
+        thresholds.extend((index * 10, LinearController(None)))
+    controller = DemandSwitch(pool, LinearController(None), *thresholds)
+    tick(lambda: controller.regulate(1))
@@ -0,0 +1,45 @@
+"""Per-tick cost of regulating a pool through stacks of decorators"""
+import logging
+
+import pytest
+
+from cobald.controller.linear import LinearController
+from cobald.decorator.buffer import Buffer
+from cobald.decorator.logger import Logger
+from cobald.decorator.standardiser import Standardiser
+
+pytest.importorskip("pytest_benchmark")
+
+DECORATORS = {
+    "standardiser": lambda target: Standardiser(target, minimum=0, maximum=1000),
+    "buffer": Buffer,
+    "logger": lambda target: Logger(target, name="benchmark.logger"),
+}
+
+
+@pytest.fixture(autouse=True)
+def quiet_logger():
+    logger = logging.getLogger("benchmark.logger")
+    level = logger.level
+    logger.setLevel(logging.WARNING)
+    yield
+    logger.setLevel(level)
+
+
+@pytest.mark.parametrize("decorator", sorted(DECORATORS))
+@pytest.mark.parametrize("depth", [1, 4, 16])
+def test_decorator_stack(tick, leaf_pool, decorator, depth):
+    top = leaf_pool(demand=100, supply=100, allocation=0.9, utilisation=0.9)
+    stack = []
+    for _ in range(depth):
+        top = DECORATORS[decorator](top)
+        stack.append(top)
+    controller = LinearController(top)
+    # buffers forward demand on their own tick
+    regulated = [controller] + [item for item in stack if hasattr(item, "regulate")]
+
+    def regulate():
+        for item in regulated:
+            item.regulate(1)
+
+    tick(regulate)
@@ -0,0 +1,47 @@
+"""Delay from registering a payload until it starts on an idle runner"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+import trio
+
+from cobald.daemon.runners.meta_runner import MetaRunner
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize(
+    "flavour", [threading, asyncio, trio], ids=lambda module: module.__name__
+)
+def test_payload_latency(benchmark, flavour):
+    started = threading.Event()
+
+    if flavour is threading:
+
+        def payload():
+            started.set()
+
+    else:
+
+        async def payload():
+            started.set()
+
+    def idle():
+        # give the runner time to become idle
+        time.sleep(0.05)
+        started.clear()
+
+    def register():
+        runner.register_payload(payload, flavour=flavour)
+        assert started.wait(timeout=5)
+
+    runner = MetaRunner()
+    thread = threading.Thread(target=runner.run, daemon=True)
+    thread.start()
+    try:
+        benchmark.pedantic(register, setup=idle, rounds=20)
+    finally:
+        runner.stop()
+        thread.join(timeout=5)
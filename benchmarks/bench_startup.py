@@ -0,0 +1,49 @@
+"""Wall time from launching the daemon until the first controller tick"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+from startup_probe import write_config
+
+pytest.importorskip("pytest_benchmark")
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def launch(*args: str):
+    """Run the daemon until it is terminated by a probe"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, (BENCHMARK_DIR, env.get("PYTHONPATH")))
+    )
+    subprocess.run(
+        [sys.executable, "-m", "cobald.daemon", *args],
+        env=env,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+@pytest.mark.parametrize("pipelines", [1, 100, 1000])
+def test_first_tick(benchmark, tmp_path, pipelines):
+    config = tmp_path / "startup.yaml"
+    write_config(config, pipelines)
+    benchmark.pedantic(
+        launch, args=(str(config), "--log-level", "WARNING"), rounds=5, iterations=1
+    )
+
+
+@pytest.mark.parametrize("pipelines", [1, 100, 1000])
+def test_first_tick_cached(benchmark, tmp_path, pipelines):
+    config = tmp_path / "startup.yaml"
+    write_config(config, pipelines)
+    args = (str(config), "--log-level", "WARNING", "--config-cache", str(tmp_path))
+    launch(*args)
+    benchmark.pedantic(launch, args=args, rounds=5, iterations=1)
+
+
+def test_help(benchmark):
+    benchmark.pedantic(launch, args=("--help",), rounds=5, iterations=1)
@@ -0,0 +1,83 @@
+"""
+Benchmarks of the per-tick cost and memory of pipelines
+
+Benchmarks are only collected when explicitly requested, so that they do not
+slow down the regular test suite:
+
+.. code:: bash
+
+    python -m pytest benchmarks/ --benchmark-autosave
+    python -m pytest benchmarks/ --benchmark-compare --benchmark-compare-fail=mean:10%
+"""
+from pathlib import Path
+import tracemalloc
+
+import pytest
+
+from cobald.interfaces import Pool
+
+BENCHMARK_DIR = Path(__file__).parent.resolve()
+
+
+def _requested(config, file_path: Path) -> bool:
+    """Whether benchmarks were explicitly selected on the command line"""
+    requested = False
+    for arg in config.args:
+        path = Path(config.invocation_params.dir, arg.split("::")[0]).resolve()
+        if path == file_path:
+            # pytest always collects files given explicitly
+            return False
+        if path == BENCHMARK_DIR or BENCHMARK_DIR in path.parents:
+            requested = True
+    return requested
+
+
+def pytest_collect_file(file_path: Path, parent):
+    if (
+        file_path.suffix == ".py"
+        and file_path.name.startswith("bench_")
+        and _requested(parent.config, file_path.resolve())
+    ):
+        return pytest.Module.from_parent(parent, path=file_path)
+
+
+class BenchmarkPool(Pool):
+    """Leaf pool with static metrics and negligible overhead"""
+
+    demand, supply, allocation, utilisation = 0, 0, 0, 0
+
+    def __init__(self, demand=1.0, supply=1.0, allocation=0.5, utilisation=0.5):
+        self.demand = demand
+        self.supply = supply
+        self.allocation = allocation
+        self.utilisation = utilisation
+
+
+@pytest.fixture
+def leaf_pool():
+    """Factory for leaf pools"""
+    return BenchmarkPool
+
+
+@pytest.fixture
+def tick(benchmark):
+    """
+    Benchmark a ``tick`` callable, recording its memory use as well
+
+    The peak memory allocated by ``rounds`` ticks is stored as
+    ``peak_memory`` in the ``extra_info`` of the benchmark,
+    so that memory can be compared between runs like timings.
+    """
+
+    def run_ticks(tick_callable, rounds: int = 1000):
+        tracemalloc.start()
+        try:
+            for _ in range(rounds):
+                tick_callable()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        benchmark.extra_info["peak_memory"] = peak
+        return benchmark(tick_callable)
+
+    return run_ticks
@@ -0,0 +1,49 @@
+"""
+Pools to measure the startup time of the daemon
+
+A :py:class:`ProbePool` terminates the daemon as soon as any controller
+changes its demand, i.e. on the first controller tick.
+"""
+import os
+from typing import List
+
+from cobald.interfaces import Pool
+
+
+class ProbePool(Pool):
+    """Pool that terminates the process when its demand is first set"""
+
+    supply, allocation, utilisation = 1.0, 0.0, 0.0
+
+    @property
+    def demand(self):
+        return 1.0
+
+    @demand.setter
+    def demand(self, value):
+        os._exit(0)
+
+
+class Fleet(Pool):
+    """Pool keeping several independent ``pipelines`` alive"""
+
+    demand, supply, allocation, utilisation = 0.0, 0.0, 0.0, 0.0
+
+    def __init__(self, pipelines: List[list]):
+        self.pipelines = pipelines
+
+
+def write_config(path, pipelines: int):
+    """Write a YAML configuration with a number of ``pipelines`` to ``path``"""
+    pipeline = (
+        "      - pipeline:\n"
+        "          - !LinearController\n"
+        "            low_utilisation: 0.5\n"
+        "            interval: 3600\n"
+        "          - __type__: startup_probe.ProbePool\n"
+    )
+    with open(path, "w") as config:
+        config.write("pipeline:\n")
+        config.write("  - __type__: startup_probe.Fleet\n")
+        config.write("    pipelines:\n")
+        config.write(pipeline * pipelines)
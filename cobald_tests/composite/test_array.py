@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+from ..mock.pool import FullMockPool
+
+from cobald.composite import array
+from cobald.composite.array import ArrayPool
+from cobald.composite.uniform import UniformComposite
+from cobald.composite.weighted import WeightedComposite
+
+
+BACKENDS = [
+    False,
+    pytest.param(
+        True,
+        marks=pytest.mark.skipif(array.numpy is None, reason="requires numpy"),
+    ),
+]
+
+
+def make_pools(size: int, use_numpy: bool, weight: str):
+    """Create an ArrayPool and an equivalent composite of regular pools"""
+    array_pool = ArrayPool(size, weight=weight, use_numpy=use_numpy)
+    children = [FullMockPool() for _ in range(size)]
+    rng = random.Random(size)
+    for child, slot in zip(children, array_pool.children):
+        child.supply = slot.supply = rng.randint(0, 10)
+        child.utilisation = slot.utilisation = rng.random()
+        child.allocation = slot.allocation = rng.random()
+    if weight == "uniform":
+        composite = UniformComposite(*children)
+    else:
+        composite = WeightedComposite(*children, weight=weight)
+    return array_pool, composite
+
+
+class TestArrayPool(object):
+    def test_init(self):
+        with pytest.raises(AssertionError):
+            ArrayPool(weight="ShouldFail")
+
+    @pytest.mark.parametrize("use_numpy", BACKENDS)
+    @pytest.mark.parametrize(
+        "weight", ["uniform", "supply", "utilisation", "allocation"]
+    )
+    def test_equivalent(self, use_numpy, weight):
+        """Test that aggregation and distribution match regular composites"""
+        array_pool, composite = make_pools(100, use_numpy, weight)
+        for demand in (0, 50, 1234.5):
+            array_pool.demand = composite.demand = demand
+            assert array_pool.snapshot() == pytest.approx(composite.snapshot())
+            assert [child.demand for child in array_pool.children] == pytest.approx(
+                [child.demand for child in composite.children]
+            )
+
+    @pytest.mark.parametrize("use_numpy", BACKENDS)
+    @pytest.mark.parametrize("weight", ["uniform", "supply"])
+    def test_empty(self, use_numpy, weight):
+        pool = ArrayPool(weight=weight, use_numpy=use_numpy)
+        pool.demand = 10
+        assert pool.snapshot() == (0, 10, 1.0, 1.0)
+        pool.resize(2)
+        assert pool.supply == 0
+        pool.demand = 10
+        assert [child.demand for child in pool.children] == [5, 5]
+
+    @pytest.mark.parametrize("use_numpy", BACKENDS)
+    def test_update(self, use_numpy):
+        pool = ArrayPool(4, use_numpy=use_numpy)
+        pool.update(supply=[1, 2, 3, 4], utilisation=0.5, allocation=1)
+        assert pool.snapshot() == (10, 0, 0.5, 1)
+        pool.children[0].supply = 11
+        assert pool.supply == 20
+        with pytest.raises((AssertionError, ValueError)):
+            pool.update(supply=[1, 2])
+
+    @pytest.mark.parametrize("use_numpy", BACKENDS)
+    def test_resize(self, use_numpy):
+        pool = ArrayPool(2, use_numpy=use_numpy)
+        pool.update(supply=[1, 2])
+        pool.resize(4)
+        assert [child.supply for child in pool.children] == [1, 2, 0, 0]
+        assert pool.supply == 3
+        pool.resize(1)
+        assert len(pool.children) == 1
+        assert pool.supply == 1
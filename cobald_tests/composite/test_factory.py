@@ -0,0 +1,141 @@
+import pytest
+import trio
+import trio.testing
+
+from ..mock.pool import FullMockPool
+
+from cobald.composite.factory import FactoryPool
+
+
+def make_children(count: int):
+    return [
+        FullMockPool(demand=1, supply=1, utilisation=(index % 97) / 97)
+        for index in range(count)
+    ]
+
+
+class TestFactoryPool(object):
+    @pytest.mark.parametrize("incremental", [False, True])
+    def test_shrink(self, incremental):
+        children = make_children(10)
+        pool = FactoryPool(*children, factory=FullMockPool, incremental=incremental)
+        pool._shrink(target=7)
+        # the least utilised children are released first
+        assert sorted(pool._hatchery, key=children.index) == children[3:]
+        assert all(child.demand == 0 for child in children[:3])
+        pool._shrink(target=7)
+        assert len(pool._hatchery) == 7
+
+    @pytest.mark.parametrize("incremental", [False, True])
+    def test_grow(self, incremental):
+        pool = FactoryPool(
+            factory=lambda: FullMockPool(demand=2, supply=2),
+            incremental=incremental,
+            spawn_limit=4,
+        )
+
+        async def grow(target):
+            pool.demand = target
+            async with trio.open_nursery() as nursery:
+                pool._grow(target=target, nursery=nursery)
+                # demand of spawning children counts towards the target
+                pool._grow(target=target, nursery=nursery)
+
+        # the demand of children is unknown before spawning one,
+        # the remaining children are spawned once it is known
+        trio.run(grow, 5)
+        assert len(pool._hatchery) == 3
+        trio.run(grow, 5)
+        assert len(pool._hatchery) == 3
+
+    def test_grow_async(self):
+        spawning, max_spawning = 0, 0
+
+        async def factory():
+            nonlocal spawning, max_spawning
+            spawning += 1
+            max_spawning = max(spawning, max_spawning)
+            await trio.sleep(10)
+            spawning -= 1
+            return FullMockPool(demand=1, supply=1)
+
+        pool = FactoryPool(factory=factory, spawn_limit=2)
+
+        async def grow(target):
+            async with trio.open_nursery() as nursery:
+                pool._grow(target=target, nursery=nursery)
+
+        clock = trio.testing.MockClock(autojump_threshold=0)
+        trio.run(grow, 1, clock=clock)
+        trio.run(grow, 6, clock=clock)
+        assert len(pool._hatchery) == 6
+        assert max_spawning == 2
+
+    def test_grow_first_tick(self):
+        async def factory():
+            await trio.sleep(10)
+            return FullMockPool(demand=1, supply=1)
+
+        pool = FactoryPool(factory=factory, spawn_limit=5)
+
+        async def grow(target):
+            pool.demand = target
+            async with trio.open_nursery() as nursery:
+                pool._grow(target=target, nursery=nursery)
+            return trio.current_time()
+
+        clock = trio.testing.MockClock(autojump_threshold=0)
+        # the first child is spawned alone, the rest once its demand is known
+        assert trio.run(grow, 6, clock=clock) == 20
+        assert len(pool._hatchery) == 6
+
+    def test_grow_demand_drop(self):
+        async def factory():
+            await trio.sleep(10)
+            return FullMockPool(demand=1, supply=1)
+
+        pool = FactoryPool(factory=factory, spawn_limit=5)
+
+        async def grow():
+            pool.demand = 6
+            async with trio.open_nursery() as nursery:
+                pool._grow(target=6, nursery=nursery)
+                # demand drops while the first child is spawned
+                await trio.sleep(5)
+                pool.demand = 2
+
+        trio.run(grow, clock=trio.testing.MockClock(autojump_threshold=0))
+        # only the demand still wanted is spawned
+        assert len(pool._hatchery) == 2
+
+    def test_report(self):
+        children = make_children(10)
+        pool = FactoryPool(*children, factory=FullMockPool, incremental=True)
+        # children are reaped based on their reported state
+        children[0].utilisation = 1.0
+        pool.report(children[0])
+        children[5].demand = 0
+        pool.report(children[5])
+        pool._shrink(target=8)
+        assert children[0] in pool._hatchery
+        assert not {children[1], children[5]} & set(pool._hatchery)
+        # disabled children may still report
+        pool.report(children[1])
+
+    def test_shrink_many(self):
+        """Incremental and full inspection release the same victims"""
+        released = {}
+        for incremental in (False, True):
+            children = [
+                FullMockPool(demand=1, supply=1, utilisation=1 - index / 10_000)
+                for index in range(10_000)
+            ]
+            pool = FactoryPool(*children, factory=FullMockPool, incremental=incremental)
+            for target in range(9_999, 9_989, -1):
+                pool._shrink(target=target)
+            assert len(pool._hatchery) == 9_990
+            released[incremental] = [
+                index for index, child in enumerate(children) if child.demand == 0
+            ]
+        # only the least utilised children are released
+        assert released[False] == released[True] == list(range(9_990, 10_000))
@@ -1,4 +1,6 @@
 import pytest
+import trio
+import trio.testing
 
 from ..mock.pool import FullMockPool
 
@@ -106,3 +108,86 @@ class TestWeightedComposite(object):
         assert composite.supply == len(children)
         assert composite.allocation == 0
         assert composite.utilisation == 0
+
+    @pytest.mark.parametrize("weight", ["supply", "allocation", "utilisation"])
+    def test_snapshot(self, weight):
+        pools = [
+            FullMockPool(demand=10, supply=100, allocation=0.9, utilisation=0.8),
+            FullMockPool(demand=20, supply=200, allocation=0.6, utilisation=0.3),
+        ]
+        composite = WeightedComposite(*pools, weight=weight)
+        state = composite.snapshot()
+        assert state.supply == composite.supply
+        assert state.demand == composite.demand
+        assert state.utilisation == composite.utilisation
+        assert state.allocation == composite.allocation
+
+    def test_snapshot_cache(self):
+        pools = [FullMockPool(supply=100), FullMockPool(supply=200)]
+        composite = WeightedComposite(*pools)
+
+        async def tick():
+            assert composite.supply == 300
+            # cached metrics are reused within a tick...
+            pools[0].supply = 0
+            assert composite.supply == 300
+            # ...until demand is set
+            composite.demand = 100
+            assert composite.supply == 200
+            pools[1].supply = 100
+            assert composite.supply == 200
+            # ...or the next tick
+            await trio.sleep(1)
+            assert composite.supply == 100
+
+        trio.run(tick, clock=trio.testing.MockClock(autojump_threshold=0))
+        # metrics are not cached outside of the event loop
+        pools[0].supply = 100
+        assert composite.supply == 200
+
+    @pytest.mark.parametrize("weight", ["supply", "allocation", "utilisation"])
+    def test_incremental(self, weight):
+        pools = [
+            FullMockPool(demand=10, supply=100, allocation=0.9, utilisation=0.8),
+            FullMockPool(demand=20, supply=200, allocation=0.6, utilisation=0.3),
+        ]
+        composite = WeightedComposite(*pools, weight=weight, incremental=True)
+        reference = WeightedComposite(*pools, weight=weight)
+        assert composite.snapshot() == reference.snapshot()
+        # changes are only visible after reporting them
+        pools[0].supply, pools[0].utilisation = 50, 0.5
+        assert composite.supply == 300
+        composite.report(pools[0])
+        assert composite.supply == 250
+        assert composite.utilisation == pytest.approx(reference.utilisation)
+        assert composite.allocation == pytest.approx(reference.allocation)
+        reference.demand = 90
+        expected_demands = [pool.demand for pool in pools]
+        composite.demand = 90
+        assert [pool.demand for pool in pools] == pytest.approx(expected_demands)
+        with pytest.raises(ValueError):
+            composite.report(FullMockPool())
+
+    def test_incremental_children(self):
+        composite = WeightedComposite(incremental=True)
+        assert composite.supply == 0
+        assert composite.utilisation == composite.allocation == 1
+        composite.children = [FullMockPool(supply=1, utilisation=0, allocation=0)]
+        assert composite.supply == 1
+        assert composite.utilisation == composite.allocation == 0
+
+    @pytest.mark.parametrize("weight", ["supply", "allocation", "utilisation"])
+    def test_incremental_drift(self, weight):
+        pools = [
+            FullMockPool(supply=value, allocation=value, utilisation=value)
+            for value in (0.1, 0.2, 0.3)
+        ]
+        composite = WeightedComposite(*pools, weight=weight, incremental=True)
+        # rounding errors of the running sums must not hide that all weights are 0
+        for pool in pools:
+            pool.supply = pool.allocation = pool.utilisation = 0
+            composite.report(pool)
+        assert composite.supply == 0
+        assert composite.utilisation == composite.allocation == 1
+        composite.demand = 9
+        assert [pool.demand for pool in pools] == [3, 3, 3]
@@ -1,6 +1,13 @@
 from types import FunctionType
 
-from cobald.controller.stepwise import Stepwise, UnboundStepwise, stepwise
+import pytest
+
+from cobald.controller.stepwise import (
+    Stepwise,
+    UnboundStepwise,
+    RangeSelector,
+    stepwise,
+)
 
 from ..mock.pool import FullMockPool
 
@@ -38,3 +45,50 @@ class TestStepwise:
         assert isinstance(control.s() >> FullMockPool(), Stepwise)
         assert isinstance(control(FullMockPool(), interval=10), Stepwise)
         assert isinstance(control.s(interval=10) >> FullMockPool(), Stepwise)
+
+    def test_regulate(self):
+        @stepwise
+        def control(pool, interval):
+            return 10
+
+        @control.add(supply=10)
+        def scale(pool, interval):
+            return pool.demand + interval
+
+        pool = FullMockPool()
+        controller = control(pool)
+        controller.regulate(1)
+        assert pool.demand == 10
+        pool.supply = 10
+        controller.regulate(2)
+        assert pool.demand == 12
+
+
+class TestRangeSelector:
+    def test_select(self):
+        rules = [(threshold, str(threshold)) for threshold in range(10, 1000, 10)]
+        selector = RangeSelector("base", *reversed(rules))
+        # repeated and interleaved lookups must not be affected by memoisation
+        for supply in (*range(-5, 1005), *range(1005, -5, -1), 0, 500, 0, 999):
+            if supply < 0:
+                expected = None
+            elif supply < 10:
+                expected = "base"
+            else:
+                expected = str(min(supply // 10 * 10, 990))
+            assert selector.get_rule(supply) == expected
+        assert selector.get_rule(9.99) == "base"
+        assert selector.get_rule(10.0) == "10"
+        assert selector.get_rule(float("inf")) == "990"
+
+    def test_base_only(self):
+        selector = RangeSelector("base")
+        assert selector.get_rule(0) == "base"
+        assert selector.get_rule(1e12) == "base"
+        assert selector.get_rule(-1) is None
+
+    def test_duplicate(self):
+        with pytest.raises(ValueError):
+            RangeSelector("base", (10, "a"), (10, "b"))
+        with pytest.raises(ValueError):
+            RangeSelector("base", (0, "a"))
@@ -1,7 +1,10 @@
-from ..mock.pool import MockPool
+import pytest
+
+from ..mock.pool import MockPool, FullMockPool
 
 from cobald.controller.linear import LinearController
 from cobald.controller.switch import DemandSwitch
+from cobald.utility import InvariantError
 
 
 class TestSwitchController(object):
@@ -20,3 +23,30 @@ class TestSwitchController(object):
             assert pool.demand == expected_demand
             switch_controller.regulate(1)
             expected_demand += 2
+
+    def test_select_many(self):
+        pool = FullMockPool()
+        slaves = [LinearController(pool) for _ in range(50)]
+        thresholds = [(index * 10, slave) for index, slave in enumerate(slaves, 1)]
+        default = LinearController(pool)
+        switch_controller = DemandSwitch(
+            pool, default, *(item for pair in reversed(thresholds) for item in pair)
+        )
+        for demand in (*range(-5, 600), *range(600, -5, -1)):
+            expected = slaves[min(demand // 10, 50) - 1] if demand >= 10 else default
+            index = switch_controller._select(demand)
+            assert switch_controller._controllers[index] is expected
+
+    def test_hysteresis(self):
+        pool = MockPool()
+        low, high = LinearController(pool, rate=1), LinearController(pool, rate=2)
+        switch_controller = DemandSwitch(pool, low, 10, high, hysteresis=2)
+        controllers = switch_controller._controllers
+        # switching up requires passing the threshold by the hysteresis
+        for demand, expected in ((9, low), (10, low), (11.9, low), (12, high)):
+            assert controllers[switch_controller._select(demand)] is expected
+        # switching down requires passing the threshold by the hysteresis
+        for demand, expected in ((10, high), (8, high), (7.9, low), (9, low)):
+            assert controllers[switch_controller._select(demand)] is expected
+        with pytest.raises(InvariantError):
+            DemandSwitch(pool, low, 10, high, hysteresis=-1)
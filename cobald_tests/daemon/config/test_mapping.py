@@ -5,6 +5,9 @@ import pytest
 
 from collections import Counter
 from cobald.daemon.config.mapping import Translator, ConfigurationError
+from cobald.daemon.config.mapping import SectionPlugin, load_documents
+from cobald.daemon.config.mapping import load_configuration
+from cobald.daemon.plugins import PluginRequirements
 
 
 def fqdn(obj):
@@ -144,3 +147,16 @@ class TestTranslate(object):
             translator.translate_hierarchy(
                 {"__type__": "%s%s" % (Construct.fqdn, random.getrandbits(32))}
             )
+
+
+class TestLoadDocuments(object):
+    def test_per_document(self):
+        plugins = (
+            SectionPlugin("first", digest=len, requirements=PluginRequirements()),
+            SectionPlugin("second", digest=len, requirements=PluginRequirements()),
+        )
+        documents = [{"first": [1]}, None, {"first": [1, 2], "second": [1, 2, 3]}]
+        outputs = load_documents(documents, plugins)
+        # outputs are lists even for sections of only one document
+        assert outputs == {plugins[0]: [1, 2], plugins[1]: [3]}
+        assert load_configuration({"second": [1]}, plugins) == {plugins[1]: 1}
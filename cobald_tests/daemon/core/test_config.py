@@ -1,10 +1,18 @@
 from tempfile import NamedTemporaryFile
+import json
 
 import pytest
 import copy
 
+import yaml
+from entrypoints import EntryPoint
+
 from cobald.daemon.config.mapping import ConfigurationError
+from cobald.daemon.config import yaml as yaml_module
+from cobald.daemon.config.yaml import load_configuration as load_yaml_configuration
+from cobald.daemon.core import config as config_module
 from cobald.daemon.core.config import load, COBalDLoader, yaml_constructor
+from cobald.daemon.core.config import add_constructor_plugins, load_section_plugins
 from cobald.controller.linear import LinearController
 
 from ...mock.pool import MockPool
@@ -37,12 +45,17 @@ COBalDLoader.add_constructor(
 )
 
 
-def get_config_section(config: dict, section: str):
+def get_config_sections(config: dict, section: str) -> list:
     return next(
         content for plugin, content in config.items() if plugin.section == section
     )
 
 
+def get_config_section(config: dict, section: str):
+    (content,) = get_config_sections(config, section)
+    return content
+
+
 class TestYamlConfig:
     def test_load(self):
         """Load a valid YAML config"""
@@ -61,6 +74,63 @@ class TestYamlConfig:
                 assert True
             assert True
 
+    def test_load_documents(self):
+        """Load a YAML config of several documents"""
+        with NamedTemporaryFile(suffix=".yaml") as config:
+            with open(config.name, "w") as write_stream:
+                write_stream.write(
+                    "pipeline:\n"
+                    "  - !LinearController {low_utilisation: 0.4}\n"
+                    "  - !MockPool\n"
+                    "---\n"
+                    "__config_test: {value: 1}\n"
+                    "---\n"
+                    "pipeline:\n"
+                    "  - !LinearController {low_utilisation: 0.3}\n"
+                    "  - !MockPool\n"
+                )
+            with load(config.name) as config:
+                pipelines = get_config_sections(config, "pipeline")
+                assert [pipeline[0].low_utilisation for pipeline in pipelines] == [
+                    0.4,
+                    0.3,
+                ]
+                assert get_config_section(config, "__config_test") == {"value": 1}
+
+    def test_load_pure_python(self):
+        """Load the same YAML config with and without libyaml"""
+
+        class PureLoader(yaml.SafeLoader):
+            yaml_constructors = COBalDLoader.yaml_constructors.copy()
+
+        with NamedTemporaryFile(suffix=".yaml") as config:
+            with open(config.name, "w") as write_stream:
+                write_stream.write(
+                    """
+                    pipeline:
+                        - !MockPool
+                    __config_test:
+                        lazy: !TagTrackerLazy
+                            nested: [{leaf: "value"}]
+                        eager: !TagTrackerEager
+                            nested: [{leaf: "value"}]
+                    """
+                )
+            contents = [
+                load_yaml_configuration(
+                    config.name,
+                    loader=loader,
+                    plugins=load_section_plugins("cobald.config.sections"),
+                )
+                for loader in (COBalDLoader, PureLoader)
+            ]
+        accelerated, pure = (
+            get_config_section(content, "__config_test") for content in contents
+        )
+        for key in ("lazy", "eager"):
+            assert accelerated[key].orig_kwargs == pure[key].orig_kwargs
+            assert accelerated[key].final_kwargs == pure[key].final_kwargs
+
     def test_load_invalid(self):
         """Load a invalid YAML config (invalid keyword argument)"""
         with NamedTemporaryFile(suffix=".yaml") as config:
@@ -253,3 +323,181 @@ class TestYamlConfig:
                 assert args == ()
                 assert kwargs["top"] == "top level value"
                 assert kwargs["nested"] == [{"leaf": "leaf level value"}]
+
+
+class RecordingEntryPoint(EntryPoint):
+    """Entry point counting how often it is loaded"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.loads = 0
+
+    def load(self):
+        self.loads += 1
+        return super().load()
+
+
+class TestPluginDiscovery:
+    def test_lazy_constructors(self, monkeypatch):
+        """Plugins of YAML !Tags are only loaded when used"""
+        used = RecordingEntryPoint("UsedTag", __name__, "TagTracker")
+        unused = RecordingEntryPoint("UnusedTag", "cobald_tests.mock.pool", "MockPool")
+        discoveries = []
+
+        def get_entrypoints(group):
+            discoveries.append(group)
+            return [used, unused]
+
+        monkeypatch.setattr(config_module, "get_entrypoints", get_entrypoints)
+
+        class LazyLoader(yaml.SafeLoader):
+            pass
+
+        for _ in range(2):
+            add_constructor_plugins("cobald_tests.lazy_constructors", LazyLoader)
+        assert discoveries == ["cobald_tests.lazy_constructors"]
+        assert used.loads == unused.loads == 0
+        tags = yaml.load("[!UsedTag {value: 2}, !UsedTag {value: 3}]", LazyLoader)
+        assert [tag.final_kwargs for tag in tags] == [{"value": 2}, {"value": 3}]
+        assert used.loads == 1
+        assert unused.loads == 0
+
+    def test_cached_sections(self):
+        """Section plugins are only loaded once while nothing is installed"""
+        first = load_section_plugins("cobald.config.sections")
+        assert load_section_plugins("cobald.config.sections") is first
+        assert {plugin.section for plugin in first} >= {"pipeline"}
+
+    def test_install_invalidates(self, tmp_path, monkeypatch):
+        """Installing a distribution discovers plugins again"""
+        discoveries = []
+
+        def get_entrypoints(group):
+            discoveries.append(group)
+            return []
+
+        monkeypatch.setattr(config_module, "get_entrypoints", get_entrypoints)
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        class InstallLoader(yaml.SafeLoader):
+            pass
+
+        group = "cobald_tests.install_constructors"
+        for _ in range(2):
+            add_constructor_plugins(group, InstallLoader)
+            load_section_plugins(group)
+        assert len(discoveries) == 2
+        (tmp_path / "cobald_fake-1.0.dist-info").mkdir()
+        add_constructor_plugins(group, InstallLoader)
+        load_section_plugins(group)
+        assert len(discoveries) == 4
+        # upgrading replaces the versioned metadata
+        (tmp_path / "cobald_fake-1.0.dist-info").rename(
+            tmp_path / "cobald_fake-1.1.dist-info"
+        )
+        load_section_plugins(group)
+        assert len(discoveries) == 5
+
+
+class TestConfigCache:
+    config = """
+    pipeline:
+        - !LinearController
+          low_utilisation: 0.9
+          high_allocation: 1.1
+        - !MockPool
+    """
+
+    def write(self, path, content):
+        with open(path, "w") as write_stream:
+            write_stream.write(content)
+
+    def test_cached_load(self, tmp_path, monkeypatch):
+        """Load a configuration from the cache without parsing it"""
+        config_path, cache_dir = str(tmp_path / "config.yaml"), tmp_path / "cache"
+        self.write(config_path, self.config)
+        with load(config_path, cache_dir=str(cache_dir)) as config:
+            assert isinstance(
+                get_config_section(config, "pipeline")[0], LinearController
+            )
+        assert len(list(cache_dir.iterdir())) == 1
+
+        def no_parsing(self):
+            raise AssertionError("configuration parsed despite cache")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(COBalDLoader, "get_node", no_parsing)
+            with load(config_path, cache_dir=str(cache_dir)) as config:
+                pipeline = get_config_section(config, "pipeline")
+                assert isinstance(pipeline[0], LinearController)
+                assert isinstance(pipeline[1], MockPool)
+                assert pipeline[0].low_utilisation == 0.9
+        # changing the configuration invalidates the cache
+        self.write(config_path, self.config.replace("0.9", "0.8"))
+        with load(config_path, cache_dir=str(cache_dir)) as config:
+            assert get_config_section(config, "pipeline")[0].low_utilisation == 0.8
+        assert len(list(cache_dir.iterdir())) == 2
+
+    def test_broken_cache(self, tmp_path):
+        """Ignore and replace broken cache entries"""
+        config_path, cache_dir = str(tmp_path / "config.yaml"), tmp_path / "cache"
+        self.write(config_path, self.config)
+        with load(config_path, cache_dir=str(cache_dir)):
+            pass
+        (cache_entry,) = cache_dir.iterdir()
+        cache_entry.write_bytes(b"not json")
+        with load(config_path, cache_dir=str(cache_dir)) as config:
+            assert get_config_section(config, "pipeline")[0].low_utilisation == 0.9
+        assert cache_entry.read_bytes() != b"not json"
+
+    @pytest.mark.parametrize("mode", (0o620, 0o602))
+    def test_untrusted_cache(self, tmp_path, monkeypatch, mode):
+        """Ignore cache entries that others may have written"""
+        config_path, cache_dir = str(tmp_path / "config.yaml"), tmp_path / "cache"
+        self.write(config_path, self.config)
+        with load(config_path, cache_dir=str(cache_dir)):
+            pass
+        (cache_entry,) = cache_dir.iterdir()
+        cache_entry.chmod(mode)
+        parsed = []
+        get_node = COBalDLoader.get_node
+
+        def count_parsing(self):
+            parsed.append(True)
+            return get_node(self)
+
+        with monkeypatch.context() as patch:
+            patch.setattr(COBalDLoader, "get_node", count_parsing)
+            with load(config_path, cache_dir=str(cache_dir)) as config:
+                assert get_config_section(config, "pipeline")[0].low_utilisation == 0.9
+        assert parsed
+        assert cache_entry.stat().st_mode & 0o022 == 0
+
+    def test_cached_aliases(self, tmp_path):
+        """Restore shared nodes from the cache"""
+        config_path, cache_dir = str(tmp_path / "config.yaml"), tmp_path / "cache"
+        self.write(
+            config_path,
+            """
+            pipeline:
+                - !LinearController
+                  low_utilisation: &low 0.5
+                  high_allocation: *low
+                - !MockPool
+            """,
+        )
+        for _ in range(2):
+            with load(config_path, cache_dir=str(cache_dir)) as config:
+                controller = get_config_section(config, "pipeline")[0]
+                assert controller.low_utilisation == 0.5
+                assert controller.high_allocation == 0.5
+
+    def test_recursive_nodes(self):
+        """Cache recursive YAML nodes as plain data"""
+        documents = list(yaml.compose_all("&loop {loop: *loop}\n---\n[1, 2]"))
+        data = json.loads(json.dumps(yaml_module._dump_nodes(documents)))
+        mapping, sequence = yaml_module._load_nodes(data)
+        ((key, value),) = mapping.value
+        assert key.value == "loop" and value is mapping
+        assert [item.value for item in sequence.value] == ["1", "2"]
+        assert sequence.flow_style
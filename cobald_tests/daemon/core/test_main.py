@@ -0,0 +1,22 @@
+import subprocess
+import sys
+
+
+def test_help_without_runtime():
+    """Test that the command line is parsed without loading the runtime"""
+    script = (
+        "import sys\n"
+        "from cobald.daemon.core.main import cli_run\n"
+        "sys.argv = ['cobald', '--help']\n"
+        "try:\n"
+        "    cli_run()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "loaded = {name.partition('.')[0] for name in sys.modules}\n"
+        "heavy = {'trio', 'yaml', 'entrypoints', 'toposort'}\n"
+        "assert not loaded & heavy, loaded & heavy\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], check=True, stdout=subprocess.PIPE
+    ).stdout
+    assert b"CONFIGURATION" in output
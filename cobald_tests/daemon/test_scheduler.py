@@ -0,0 +1,140 @@
+import pytest
+import trio
+import trio.testing
+
+from cobald.daemon.scheduler import TickScheduler, resolve_scheduler
+from cobald.controller.linear import LinearController
+
+from ..mock.pool import MockPool
+
+
+class Recorder(object):
+    """Regulated object recording the time and interval of ticks"""
+
+    def __init__(self, delay: float = 0, clock: trio.testing.MockClock = None):
+        self.ticks = []
+        self.delay = delay
+        self.clock = clock
+
+    def regulate(self, interval):
+        self.ticks.append((trio.current_time(), interval))
+        if self.delay:
+            self.clock.jump(self.delay)
+
+
+def run_scheduler(scheduler: TickScheduler, duration: float, clock, setup=None):
+    async def main():
+        async with trio.open_nursery() as nursery:
+            nursery.start_soon(scheduler.run)
+            if setup is not None:
+                await trio.sleep(0)
+                await setup()
+            await trio.sleep(duration)
+            nursery.cancel_scope.cancel()
+
+    trio.run(main, clock=clock)
+
+
+class TestTickScheduler(object):
+    def test_ticks(self):
+        clock = trio.testing.MockClock(autojump_threshold=0)
+        scheduler = TickScheduler()
+        fast, slow = Recorder(), Recorder()
+        scheduler.register(fast, 1)
+        scheduler.register(slow, 3)
+        run_scheduler(scheduler, 10.5, clock)
+        assert [when for when, _ in fast.ticks] == list(range(1, 11))
+        assert [when for when, _ in slow.ticks] == [3, 6, 9]
+        assert all(interval == 1 for _, interval in fast.ticks)
+        assert all(interval == 3 for _, interval in slow.ticks)
+
+    def test_cancel(self):
+        clock = trio.testing.MockClock(autojump_threshold=0)
+        scheduler = TickScheduler()
+        recorder = Recorder()
+        tick = scheduler.register(recorder, 1)
+
+        async def cancel():
+            await trio.sleep(2.5)
+            tick.cancel()
+
+        run_scheduler(scheduler, 10, clock, setup=cancel)
+        assert len(recorder.ticks) == 2
+
+    def test_drift(self):
+        """Slow ticks do not shift later deadlines"""
+        clock = trio.testing.MockClock(autojump_threshold=0)
+        scheduler = TickScheduler()
+        slow, fast = Recorder(delay=0.25, clock=clock), Recorder()
+        scheduler.register(slow, 1)
+        scheduler.register(fast, 1)
+        run_scheduler(scheduler, 4.5, clock)
+        assert [when for when, _ in slow.ticks] == [1, 2, 3, 4]
+        # ticks of the same batch see the delay of earlier ones...
+        assert [when for when, _ in fast.ticks] == [1.25, 2.25, 3.25, 4.25]
+        # ...and report the actual time elapsed
+        assert [interval for _, interval in fast.ticks] == [1, 1, 1, 1]
+
+    def test_slow_sibling(self):
+        """A slow tick does not distort the ticks of its siblings"""
+        clock = trio.testing.MockClock(autojump_threshold=0)
+        scheduler = TickScheduler()
+        slow, sibling = Recorder(delay=0.5, clock=clock), Recorder()
+        scheduler.register(slow, 1)
+        scheduler.register(sibling, 1)
+
+        async def speed_up():
+            await trio.sleep(1.75)
+            slow.delay = 0
+
+        run_scheduler(scheduler, 2.75, clock, setup=speed_up)
+        assert [when for when, _ in slow.ticks] == [1, 2, 3, 4]
+        # the sibling is not run again to catch up with its delayed tick...
+        assert [when for when, _ in sibling.ticks] == [1.5, 2, 3, 4]
+        # ...and reports the time elapsed since it actually ran
+        assert [interval for _, interval in sibling.ticks] == [1, 0.5, 1, 1]
+
+    def test_skip(self):
+        """Ticks missed due to delays are skipped"""
+        clock = trio.testing.MockClock(autojump_threshold=0)
+        scheduler = TickScheduler()
+        recorder = Recorder(delay=2.5, clock=clock)
+        scheduler.register(recorder, 1)
+        run_scheduler(scheduler, 10.5, clock)
+        assert [when for when, _ in recorder.ticks] == [1, 4, 7, 10]
+        assert [interval for _, interval in recorder.ticks] == [1, 3, 3, 3]
+
+    @pytest.mark.parametrize("align", [True, False])
+    def test_align(self, align):
+        clock = trio.testing.MockClock(autojump_threshold=0)
+        scheduler = TickScheduler(align=align)
+        early, late = Recorder(), Recorder()
+        scheduler.register(early, 2)
+
+        async def register_late():
+            await trio.sleep(1.5)
+            scheduler.register(late, 2)
+
+        run_scheduler(scheduler, 7, clock, setup=register_late)
+        assert [when for when, _ in early.ticks] == [2, 4, 6, 8]
+        if align:
+            assert [when for when, _ in late.ticks] == [2, 4, 6, 8]
+        else:
+            assert [when for when, _ in late.ticks] == [3.5, 5.5, 7.5]
+
+    def test_shared(self):
+        assert TickScheduler.shared("test_shared") is TickScheduler.shared(
+            "test_shared"
+        )
+        assert TickScheduler.shared("test_shared") is not TickScheduler.shared()
+        assert resolve_scheduler("test_shared") is TickScheduler.shared("test_shared")
+        assert resolve_scheduler(None) is None
+
+    def test_controller(self):
+        clock = trio.testing.MockClock(autojump_threshold=0)
+        scheduler = TickScheduler()
+        pool = MockPool()
+        pool.utilisation = pool.allocation = 1.0
+        controller = LinearController(pool, rate=1, interval=2, scheduler=scheduler)
+        run_scheduler(scheduler, 9, clock, setup=controller.run)
+        assert pool.demand == 8
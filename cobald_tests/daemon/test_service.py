@@ -1,3 +1,5 @@
+import subprocess
+import sys
 import threading
 import time
 import random
@@ -9,6 +11,7 @@ import logging
 import pytest
 
 from cobald.daemon.runners.service import ServiceRunner, service
+from cobald.daemon.runners.virtual_time import VirtualClock
 
 
 logging.getLogger().level = 10
@@ -19,9 +22,12 @@ class TerminateRunner(Exception):
 
 
 @contextlib.contextmanager
-def accept(payload: ServiceRunner, name=None):
+def accept(payload: ServiceRunner, name=None, clock=None):
     thread = threading.Thread(
-        target=payload.accept, name=name or str(payload), daemon=True
+        target=payload.accept,
+        kwargs={"clock": clock},
+        name=name or str(payload),
+        daemon=True,
     )
     thread.start()
     if not payload.running.wait(1):
@@ -47,14 +53,14 @@ class TestServiceRunner(object):
 
     def test_unique_reaper(self):
         """Assert that no two runners may fetch services"""
-        with accept(ServiceRunner(accept_delay=0.1), name="outer"):
+        with accept(ServiceRunner(), name="outer"):
             with pytest.raises(RuntimeError):
-                with accept(ServiceRunner(accept_delay=0.1), name="inner"):
+                with accept(ServiceRunner(), name="inner"):
                     pass
 
     def test_service(self):
         """Test running service classes automatically"""
-        runner = ServiceRunner(accept_delay=0.1)
+        runner = ServiceRunner()
         replies = []
 
         @service(flavour=threading)
@@ -75,6 +81,94 @@ class TestServiceRunner(object):
             assert b.done.wait(timeout=5), "service thread completed"
             assert len(replies) == 2, "post-registered service ran"
 
+    def test_lazy_runtime(self):
+        """Test that importing the daemon does not create the runtime or runners"""
+        script = (
+            "import threading, cobald.daemon\n"
+            "assert 'runtime' not in vars(cobald.daemon)\n"
+            "from cobald.daemon import runtime\n"
+            "assert cobald.daemon.runtime is runtime\n"
+            "assert not runtime._meta_runner.runners\n"
+            "assert threading.active_count() == 1\n"
+        )
+        subprocess.run([sys.executable, "-c", script], check=True)
+
+    def test_lazy_runtime_threads(self):
+        """Test that threads racing to create the runtime share one runtime"""
+        script = (
+            "import threading, cobald.daemon\n"
+            "runtimes, barrier = [], threading.Barrier(8)\n"
+            "def fetch():\n"
+            "    barrier.wait()\n"
+            "    runtimes.append(cobald.daemon.runtime)\n"
+            "threads = [threading.Thread(target=fetch) for _ in range(8)]\n"
+            "for thread in threads:\n"
+            "    thread.start()\n"
+            "for thread in threads:\n"
+            "    thread.join()\n"
+            "assert len(runtimes) == 8\n"
+            "assert all(runtime is cobald.daemon.runtime for runtime in runtimes)\n"
+        )
+        subprocess.run([sys.executable, "-c", script], check=True)
+
+    def test_lazy_runners(self):
+        """Test that only the runners of used flavours are started"""
+        runner = ServiceRunner()
+        with accept(runner, name="test_lazy_runners"):
+            assert set(runner._meta_runner.runners) == {trio, threading}
+
+    def test_service_adopt_latency(self):
+        """Test that new services are adopted without waiting for a poll"""
+        runner = ServiceRunner()
+
+        @service(flavour=threading)
+        class Service(object):
+            def __init__(self):
+                self.done = threading.Event()
+
+            def run(self):
+                self.done.set()
+
+        with accept(runner, name="test_service_adopt_latency"):
+            time.sleep(0.1)
+            for _ in range(10):
+                start = time.monotonic()
+                a = Service()
+                assert a.done.wait(timeout=5), "service thread completed"
+                assert time.monotonic() - start < 1
+
+    def test_accept_delay(self):
+        """Test that the unused accept_delay is deprecated"""
+        with pytest.warns(DeprecationWarning):
+            runner = ServiceRunner(accept_delay=60)
+        assert runner.accept_delay == 60
+
+    def test_virtual_time(self):
+        """Test running services in virtual time"""
+        runner = ServiceRunner()
+
+        @service(flavour=trio)
+        class Service(object):
+            def __init__(self):
+                self.done = threading.Event()
+
+            async def run(self):
+                await trio.sleep(86400)
+                self.done.set()
+
+        with accept(runner, name="test_virtual_time", clock=VirtualClock()):
+            a = Service()
+            assert a.done.wait(timeout=5), "service slept in virtual time"
+
+    def test_virtual_time_replace(self):
+        """Test that switching to virtual time releases the previous runners"""
+        runner = ServiceRunner()
+        previous = runner._meta_runner
+        event_loop = previous._runner(asyncio).event_loop
+        with accept(runner, name="test_virtual_time_replace", clock=VirtualClock()):
+            assert runner._meta_runner is not previous
+        assert event_loop.is_closed()
+
     def test_execute(self):
         """Test running payloads synchronously"""
         default = random.random()
@@ -85,7 +179,7 @@ class TestServiceRunner(object):
         async def co_pingpong(what=default):
             return what
 
-        runner = ServiceRunner(accept_delay=0.1)
+        runner = ServiceRunner()
         with accept(runner, name="test_execute"):
             # do not pass in values - receive default
             assert runner.execute(sub_pingpong, flavour=threading) == default
@@ -111,7 +205,7 @@ class TestServiceRunner(object):
         async def co_pingpong(what=default):
             reply_store.append(what)
 
-        runner = ServiceRunner(accept_delay=0.1)
+        runner = ServiceRunner()
         with accept(runner, name="test_adopt"):
             # do not pass in values - receive default
             assert runner.adopt(sub_pingpong, flavour=threading) is None
@@ -0,0 +1,68 @@
+import trio
+import trio.testing
+
+from cobald.interfaces import refresh_pool
+from cobald.decorator.adapter import SyncAdapter, AsyncAdapter
+
+from ..mock.pool import FullMockPool, RemoteMockPool
+
+
+def run_for(async_fn, duration=None):
+    clock = trio.testing.MockClock(autojump_threshold=0)
+
+    async def main():
+        if duration is None:
+            return await async_fn()
+        with trio.move_on_after(duration):
+            await async_fn()
+        return trio.current_time()
+
+    return trio.run(main, clock=clock), clock
+
+
+class TestSyncAdapter(object):
+    def test_periodic(self):
+        pool = RemoteMockPool(supply=3.0, latency=1.0)
+        adapter = SyncAdapter(pool, interval=5.0)
+        assert adapter.supply == 0
+        run_for(adapter.run, duration=12.0)
+        # refreshes start at 0, 5 and 10 and finish after 1 second
+        assert pool.refreshes == 3
+        assert adapter.supply == 3.0
+
+    def test_slow_refresh(self):
+        pool = RemoteMockPool(latency=4.0)
+        adapter = SyncAdapter(pool, interval=1.0)
+        run_for(adapter.run, duration=10.0)
+        # refreshes do not overlap even if they take longer than the interval
+        assert pool.refreshes == 2
+        assert pool.peak_active == 1
+
+    def test_timeout(self):
+        pool = RemoteMockPool(latency=4.0)
+        adapter = SyncAdapter(pool, interval=5.0, timeout=2.0)
+        run_for(adapter.run, duration=7.0)
+        # timed out refreshes leave the pool with its stale metrics
+        assert pool.refreshes == 0
+        assert adapter.stale == 1
+
+
+class TestAsyncAdapter(object):
+    def test_refresh(self):
+        pool = FullMockPool()
+        pool.supply = 2
+        adapter = AsyncAdapter(pool)
+        assert adapter.supply == 2
+        run_for(adapter.refresh)
+        pool.supply = 4
+        assert adapter.supply == 2
+        run_for(lambda: refresh_pool(adapter))
+        assert adapter.supply == 4
+
+    def test_demand(self):
+        pool = FullMockPool()
+        adapter = AsyncAdapter(pool)
+        run_for(adapter.refresh)
+        adapter.demand = 5
+        assert pool.demand == 5
+        assert adapter.demand == 5
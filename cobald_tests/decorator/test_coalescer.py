@@ -0,0 +1,56 @@
+import pytest
+
+from cobald.decorator.coalescer import Coalescer
+
+from ..mock.pool import RecordingPool, run_changes
+
+
+class TestCoalescer(object):
+    def test_suppress(self):
+        pool = RecordingPool()
+        coalescer = Coalescer(pool, window=1)
+        run_changes(coalescer, [(1, 0), (5, 2), (10, 2), (20, 0)])
+        assert pool.changes == [(6, 2), (21, 0)]
+        assert coalescer.writes == 2
+        assert coalescer.suppressed == 2
+        assert coalescer.coalesced == 0
+
+    def test_trailing(self):
+        pool = RecordingPool()
+        coalescer = Coalescer(pool, window=1)
+        run_changes(coalescer, [(1, 1), (1.5, 2), (2, 3), (10, 4)])
+        assert pool.changes == [(3, 3), (11, 4)]
+        assert coalescer.demand == 4
+        assert coalescer.coalesced == 2
+
+    def test_leading(self):
+        pool = RecordingPool()
+        coalescer = Coalescer(pool, window=1, leading=True, trailing=False)
+        run_changes(coalescer, [(1, 1), (1.5, 2), (2, 3), (10, 4)])
+        assert pool.changes == [(1, 1), (10, 4)]
+        assert coalescer.coalesced == 2
+        coalescer = Coalescer(RecordingPool(), window=1, leading=True)
+        run_changes(coalescer, [(1, 1), (1.5, 2), (2, 3), (10, 4)])
+        assert coalescer.target.changes == [(1, 1), (3, 3), (10, 4)]
+
+    def test_revert(self):
+        pool = RecordingPool()
+        coalescer = Coalescer(pool, window=1)
+        run_changes(coalescer, [(1, 1), (1.5, 0)])
+        assert pool.changes == []
+        assert coalescer.suppressed == 1
+        assert coalescer.coalesced == 1
+
+    def test_max_latency(self):
+        changes = [(0.3 + 0.4 * step, step + 1) for step in range(40)]
+        pool = RecordingPool()
+        coalescer = Coalescer(pool, window=1, max_latency=5)
+        run_changes(coalescer, changes)
+        # a burst of frequent changes is applied at most every 5 seconds
+        assert [when for when, _ in pool.changes] == pytest.approx(
+            [5.3, 10.5, 15.7, 16.9]
+        )
+        assert pool.changes[-1][1] == 40
+        coalescer = Coalescer(RecordingPool(), window=1, max_latency=None)
+        run_changes(coalescer, changes)
+        assert coalescer.target.changes == [(pytest.approx(16.9), 40)]
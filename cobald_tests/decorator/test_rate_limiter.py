@@ -0,0 +1,53 @@
+import pytest
+
+from cobald.decorator.rate_limiter import RateLimiter
+
+from ..mock.pool import RecordingPool, run_changes
+
+
+class TestRateLimiter(object):
+    def test_rate(self):
+        pool = RecordingPool()
+        limiter = RateLimiter(pool, rate=0.5)
+        run_changes(limiter, [(when / 4, when) for when in range(1, 41)])
+        times = [when for when, _ in pool.changes]
+        assert times == [0.25, 2.25, 4.25, 6.25, 8.25, 10.25]
+        # intermediate changes are merged, the final demand is applied
+        assert pool.demand == 40
+        assert limiter.demand == 40
+        assert limiter.writes == 6
+        assert limiter.coalesced == 34
+
+    def test_burst(self):
+        pool = RecordingPool()
+        limiter = RateLimiter(pool, rate=1, burst=3)
+        run_changes(limiter, [(when / 10, when) for when in range(10, 50)])
+        times = [when for when, _ in pool.changes]
+        # an initial burst of three writes, then one write per second
+        assert times[:5] == pytest.approx([1.0, 1.1, 1.2, 2.0, 3.0])
+
+    def test_delta(self):
+        pool = RecordingPool()
+        limiter = RateLimiter(pool, rate=None, delta=2, burst=5)
+        run_changes(limiter, [(1, 3), (10, 23), (30, 20)])
+        # large changes are applied in steps of the accumulated budget
+        assert pool.changes == [(1, 3), (10, 13), (15, 23), (30, 20)]
+        # each step is a write, but no change is replaced
+        assert limiter.writes == 4
+        assert limiter.coalesced == 0
+
+    def test_unchanged(self):
+        pool = RecordingPool()
+        limiter = RateLimiter(pool, rate=1)
+        run_changes(limiter, [(1, 0), (1.5, 2), (1.6, 0)])
+        assert pool.changes == [(1.5, 2), (2.5, 0)]
+        assert limiter.writes == 2
+        assert limiter.coalesced == 0
+
+    def test_validation(self):
+        with pytest.raises(ValueError):
+            RateLimiter(RecordingPool(), rate=0)
+        with pytest.raises(ValueError):
+            RateLimiter(RecordingPool(), delta=-1)
+        with pytest.raises(ValueError):
+            RateLimiter(RecordingPool(), burst=0)
@@ -73,3 +73,14 @@ class TestStandardiser(object):
             assert pool.demand == maximum
             standardiser.demand = maximum - abs(maximum)
             assert pool.demand == maximum - abs(maximum)
+
+    def test_snapshot(self):
+        pool = FullMockPool(demand=0, supply=10, allocation=0.75, utilisation=0.25)
+        standardiser = Standardiser(pool, granularity=4)
+        standardiser.demand = 6
+        state = standardiser.snapshot()
+        assert pool.demand == 4
+        assert state.demand == standardiser.demand == 6
+        assert state.supply == pool.supply
+        assert state.utilisation == pool.utilisation
+        assert state.allocation == pool.allocation
@@ -0,0 +1,73 @@
+import subprocess
+import sys
+
+import trio
+import trio.testing
+
+from cobald.interfaces import refresh_pool
+from cobald.composite.uniform import UniformComposite
+from cobald.decorator.standardiser import Standardiser
+
+from ..mock.pool import FullMockPool, RemoteMockPool
+
+
+def run_refresh(pool, **kwargs):
+    """Refresh ``pool`` in virtual time, returning the stale pools and time taken"""
+
+    async def refresh():
+        stale = await refresh_pool(pool, **kwargs)
+        return stale, trio.current_time()
+
+    return trio.run(refresh, clock=trio.testing.MockClock(autojump_threshold=0))
+
+
+class TestRefresh(object):
+    def test_concurrent(self):
+        children = [RemoteMockPool(supply=2.0, latency=i + 1) for i in range(200)]
+        composite = UniformComposite(*children)
+        stale, elapsed = run_refresh(composite)
+        assert stale == 0
+        assert all(child.refreshes == 1 for child in children)
+        # refreshing takes as long as the slowest child, not the sum of all
+        assert elapsed == 200
+        assert composite.supply == 400.0
+
+    def test_limited(self):
+        children = [RemoteMockPool(supply=2.0) for _ in range(10)]
+        composite = UniformComposite(*children)
+        assert composite.supply == 0
+        stale, elapsed = run_refresh(
+            Standardiser(composite), limiter=trio.CapacityLimiter(5)
+        )
+        assert max(child.peak_active for child in children) == 1
+        # ten children at five in parallel need two rounds of refreshes
+        assert elapsed == 2.0
+        # refreshed metrics are visible via the composite
+        assert composite.supply == 20.0
+
+    def test_timeout(self):
+        fast, slow = RemoteMockPool(supply=2.0), RemoteMockPool(latency=60)
+        slow.supply = 3.0
+        composite = UniformComposite(fast, slow)
+        stale, elapsed = run_refresh(composite, timeout=10)
+        assert stale == 1
+        assert elapsed == 10
+        assert fast.refreshes == 1 and slow.refreshes == 0
+        # the slow child keeps its stale supply
+        assert composite.supply == 5.0
+
+    def test_failure(self):
+        good, bad = RemoteMockPool(), RemoteMockPool(error=OSError("unreachable"))
+        stale, _ = run_refresh(UniformComposite(good, bad))
+        assert stale == 1
+        assert good.refreshes == 1 and bad.refreshes == 0
+
+    def test_synchronous(self):
+        pool = UniformComposite(FullMockPool(), Standardiser(FullMockPool()))
+        assert run_refresh(pool) == (0, 0)
+
+
+def test_import_without_trio():
+    """Test that defining pools does not require loading trio"""
+    script = "import sys, cobald.interfaces\nassert 'trio' not in sys.modules\n"
+    subprocess.run([sys.executable, "-c", script], check=True)
@@ -1,4 +1,7 @@
-from cobald.interfaces import Pool
+import trio
+import trio.testing
+
+from cobald.interfaces import Pool, AsyncPool, PoolDecorator
 
 
 class MockPool(Pool):
@@ -43,3 +46,61 @@ class FullMockPool(Pool):
         self.supply = supply
         self.allocation = allocation
         self.utilisation = utilisation
+
+
+class RemoteMockPool(AsyncPool):
+    """Pool whose metrics take ``latency`` seconds to refresh"""
+
+    demand, supply, allocation, utilisation = 0, 0, 0, 0
+
+    def __init__(self, supply=1.0, latency=1.0, error=None):
+        self.remote_supply = supply
+        self.latency = latency
+        self.error = error
+        self.refreshes = 0
+        self.active = 0
+        self.peak_active = 0
+
+    async def refresh(self):
+        self.active += 1
+        self.peak_active = max(self.active, self.peak_active)
+        try:
+            await trio.sleep(self.latency)
+            if self.error is not None:
+                raise self.error
+        finally:
+            self.active -= 1
+        self.refreshes += 1
+        self.supply = self.remote_supply
+
+
+class RecordingPool(Pool):
+    """Pool recording the time of each change to its demand"""
+
+    supply, allocation, utilisation = 0, 0.5, 0.5
+
+    def __init__(self):
+        self.changes = []
+
+    @property
+    def demand(self):
+        return self.changes[-1][1] if self.changes else 0
+
+    @demand.setter
+    def demand(self, value):
+        self.changes.append((trio.current_time(), value))
+
+
+def run_changes(decorator: PoolDecorator, changes, duration: float = 100):
+    """Apply ``changes`` of ``(time, demand)`` to ``decorator`` in virtual time"""
+
+    async def main():
+        async with trio.open_nursery() as nursery:
+            nursery.start_soon(decorator.run)
+            for when, demand in changes:
+                await trio.sleep_until(when)
+                decorator.demand = demand
+            await trio.sleep_until(duration)
+            nursery.cancel_scope.cancel()
+
+    trio.run(main, clock=trio.testing.MockClock(autojump_threshold=0))
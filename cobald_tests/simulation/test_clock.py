@@ -0,0 +1,42 @@
+from cobald.simulation.clock import SimulationClock
+
+
+class Recorder(object):
+    def __init__(self, clock: SimulationClock):
+        self.clock = clock
+        self.ticks = []
+
+    def regulate(self, interval):
+        self.ticks.append((self.clock.time, interval))
+
+
+class TestSimulationClock(object):
+    def test_schedule(self):
+        clock = SimulationClock()
+        calls = []
+        clock.schedule(2, calls.append, 2)
+        clock.schedule(1, calls.append, 1)
+        clock.delay(1, calls.append, "1b")
+        cancelled = clock.schedule(1.5, calls.append, 1.5)
+        cancelled.cancel()
+        assert clock.run() == 2
+        assert calls == [1, "1b", 2]
+
+    def test_until(self):
+        clock = SimulationClock()
+        calls = []
+        clock.schedule(5, calls.append, 5)
+        assert clock.run(until=3) == 3
+        assert calls == []
+        assert clock.run(until=10) == 10
+        assert calls == [5]
+
+    def test_every(self):
+        clock = SimulationClock()
+        recorder = Recorder(clock)
+        ticker = clock.every(2, recorder)
+        clock.run(until=7)
+        assert recorder.ticks == [(2, 2), (4, 2), (6, 2)]
+        ticker.cancel()
+        clock.run(until=20)
+        assert len(recorder.ticks) == 3
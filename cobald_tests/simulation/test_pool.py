@@ -0,0 +1,55 @@
+from cobald.simulation.clock import SimulationClock
+from cobald.simulation.pool import SimulatedPool
+from cobald.simulation.trace import Job
+
+
+class TestSimulatedPool(object):
+    def test_spawn(self):
+        clock = SimulationClock()
+        pool = SimulatedPool(spawn_latency=10, demand=2)
+        pool.bind(clock)
+        assert pool.supply == 0 and pool.booting == 2
+        clock.run(until=10)
+        assert pool.supply == 2 and pool.booting == 0
+        # booting resources are cancelled first, then idle ones released
+        pool.demand = 4
+        pool.demand = 3
+        assert pool.booting == 1
+        pool.demand = 1
+        assert pool.supply == 1 and pool.booting == 0
+        clock.run(until=100)
+        assert pool.supply == 1
+
+    def test_jobs(self):
+        clock = SimulationClock()
+        pool = SimulatedPool(demand=1)
+        pool.bind(clock)
+        clock.run(until=0)
+        pool.submit(Job(submit=0, duration=10, cpu=0.5))
+        pool.submit(Job(submit=0, duration=10))
+        assert pool.allocation == 1 and pool.utilisation == 0.5
+        assert pool.queued == 1
+        clock.run(until=10)
+        assert pool.completed == 1 and pool.queued == 0
+        assert pool.utilisation == 1.0
+        clock.run(until=20)
+        assert pool.completed == 2
+        assert pool.wait_time == 10
+        assert pool.allocation == 0
+
+    def test_drain(self):
+        clock = SimulationClock()
+        pool = SimulatedPool(demand=2)
+        pool.bind(clock)
+        clock.run(until=0)
+        pool.submit(Job(submit=0, duration=10))
+        pool.submit(Job(submit=0, duration=20))
+        # busy resources are drained, not killed
+        pool.demand = 0
+        assert pool.supply == 2
+        clock.run(until=10)
+        assert pool.supply == 1
+        # draining resources are kept when demand increases again
+        pool.demand = 1
+        clock.run(until=30)
+        assert pool.supply == 1 and pool.completed == 2
@@ -0,0 +1,50 @@
+from tempfile import NamedTemporaryFile
+
+import pytest
+
+from cobald.controller.linear import LinearController
+from cobald.simulation import Simulation, SimulatedPool, Job, poisson_trace, simulate
+from cobald.simulation.cli import cli_run
+
+
+class TestSimulation(object):
+    def test_pipeline(self):
+        pool = SimulatedPool(spawn_latency=60)
+        pipeline = [LinearController(pool, rate=0.1, interval=10), pool]
+        trace = list(poisson_trace(rate=0.05, until=86400, mean_duration=600, seed=1))
+        report = Simulation(pipeline, trace).run()
+        assert report.duration >= 86400
+        assert report.completed == len(trace)
+        # about 0.05 * 600 = 30 resources are required on average
+        assert 20 < report.mean_supply < 60
+        assert 0 < report.over_provisioning < 1
+        assert report.oscillation > 0
+
+    def test_invalid(self):
+        pool = SimulatedPool()
+        with pytest.raises(TypeError):
+            Simulation([pool, LinearController(pool)], [])
+
+    def test_config(self, capsys):
+        with NamedTemporaryFile(suffix=".yaml") as config, NamedTemporaryFile(
+            suffix=".csv"
+        ) as trace:
+            with open(config.name, "w") as write_stream:
+                write_stream.write(
+                    """
+                    pipeline:
+                        - !LinearController
+                          interval: 5
+                        - !SimulatedPool
+                          spawn_latency: 30
+                    """
+                )
+            with open(trace.name, "w") as write_stream:
+                write_stream.write("submit,duration,cpu\n")
+                for minute in range(60):
+                    write_stream.write("%d,300,0.9\n" % (minute * 60))
+            report = simulate(config.name, [Job(0, 3600)], until=3600)
+            assert report.duration == 3600
+            cli_run([config.name, trace.name])
+        output = capsys.readouterr().out
+        assert "completed:" in output and "over_provisioning:" in output
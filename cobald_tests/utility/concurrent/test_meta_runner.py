@@ -1,10 +1,14 @@
+import logging
 import threading
 import pytest
+import sys
 import time
+import types
 import asyncio
 
 import trio
 
+from cobald.daemon.runners import async_tools
 from cobald.daemon.runners.base_runner import OrphanedReturn
 from cobald.daemon.runners.meta_runner import MetaRunner
 
@@ -77,6 +81,107 @@ class TestMetaRunner(object):
             runner.run_payload(with_raise, flavour=flavour)
         runner.stop()
 
+    @pytest.mark.parametrize("flavour", (threading, asyncio, trio))
+    @pytest.mark.parametrize("awaiter", (asyncio, trio))
+    def test_submit(self, flavour, awaiter):
+        """Test awaiting payloads of any flavour from coroutines"""
+        if flavour is threading:
+
+            def with_return():
+                time.sleep(0.01)
+                return "expected return value"
+
+            def with_raise():
+                raise KeyError("expected exception")
+
+        else:
+
+            async def with_return():
+                await flavour.sleep(0.01)
+                return "expected return value"
+
+            async def with_raise():
+                raise KeyError("expected exception")
+
+        async def await_return():
+            return await runner.submit(with_return, flavour=flavour)
+
+        async def await_raise():
+            return await runner.submit(with_raise, flavour=flavour)
+
+        runner = MetaRunner()
+        run_in_thread(runner.run, name="test_submit %s" % flavour)
+        assert runner.submit(with_return, flavour=flavour).result(timeout=5) == (
+            "expected return value"
+        )
+        assert runner.run_payload(await_return, flavour=awaiter) == (
+            "expected return value"
+        )
+        with pytest.raises(KeyError):
+            runner.run_payload(await_raise, flavour=awaiter)
+        runner.stop()
+
+    @pytest.mark.parametrize("version_info", ((3, 6), sys.version_info))
+    def test_detect_asyncio(self, monkeypatch, version_info):
+        """Test detecting asyncio as used to await payloads on all Pythons"""
+        monkeypatch.setattr(
+            async_tools, "sys", types.SimpleNamespace(version_info=version_info)
+        )
+
+        async def in_asyncio():
+            return async_tools._in_asyncio()
+
+        assert not async_tools._in_asyncio()
+        event_loop = asyncio.new_event_loop()
+        try:
+            assert event_loop.run_until_complete(in_asyncio())
+        finally:
+            event_loop.close()
+        assert not trio.run(in_asyncio)
+
+    @pytest.mark.parametrize("flavour", (threading, asyncio, trio))
+    def test_payload_idle(self, flavour):
+        """Test that payloads registered on an idle runner are started"""
+        started = threading.Event()
+
+        if flavour is threading:
+
+            def payload():
+                started.set()
+
+        else:
+
+            async def payload():
+                started.set()
+
+        runner = MetaRunner()
+        run_in_thread(runner.run, name="test_payload_idle %s" % flavour)
+        for _ in range(3):
+            # give the runner time to become idle
+            time.sleep(0.05)
+            started.clear()
+            runner.register_payload(payload, flavour=flavour)
+            assert started.wait(timeout=5)
+        runner.stop()
+
+    def test_fail_on_cancel(self, caplog):
+        """Test that payloads failing on shutdown do not break the runner"""
+
+        async def stubborn():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                raise RuntimeError("failed while cancelled") from None
+
+        runner = MetaRunner()
+        runner.register_payload(stubborn, flavour=asyncio)
+        run_in_thread(runner.run, name="test_fail_on_cancel")
+        time.sleep(0.1)
+        runner.stop()
+        assert not [
+            record for record in caplog.records if record.levelno >= logging.ERROR
+        ]
+
     @pytest.mark.parametrize("flavour", (threading,))
     def test_return_subroutine(self, flavour):
         """Test that returning from subroutines aborts runners"""
@@ -157,3 +262,30 @@ class TestMetaRunner(object):
         with pytest.raises(RuntimeError) as exc:
             runner.run()
         assert isinstance(exc.value.__cause__, TerminateRunner)
+
+    def test_lazy_runners(self):
+        """Test that only runners of used flavours are created and started"""
+        runner = MetaRunner()
+        assert not runner.runners
+        started = threading.Event()
+
+        async def t_coroutine():
+            started.set()
+            await trio.sleep(10)
+
+        runner.register_payload(t_coroutine, flavour=trio)
+        assert set(runner.runners) == {trio}
+        threads = threading.active_count()
+        run_in_thread(runner.run, name="test_lazy_runners")
+        assert started.wait(1)
+        assert set(runner.runners) == {trio, threading}
+        # the meta runner thread and the trio runner thread
+        assert threading.active_count() - threads == 2
+
+        async def a_coroutine():
+            return "asyncio started on demand"
+
+        result = runner.run_payload(a_coroutine, flavour=asyncio)
+        assert result == "asyncio started on demand"
+        assert set(runner.runners) == {trio, asyncio, threading}
+        runner.stop()
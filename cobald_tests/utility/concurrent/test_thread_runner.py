@@ -0,0 +1,52 @@
+import threading
+import time
+
+import pytest
+
+from cobald.daemon.runners.thread_runner import ThreadRunner
+
+
+class TestThreadRunner(object):
+    def test_submit(self):
+        runner = ThreadRunner(max_workers=2)
+        assert runner.submit(lambda: "expected value").result(timeout=1) == (
+            "expected value"
+        )
+
+        def with_raise():
+            raise KeyError("expected exception")
+
+        with pytest.raises(KeyError):
+            runner.submit(with_raise).result(timeout=1)
+
+    def test_submit_bounded(self):
+        runner = ThreadRunner(max_workers=2)
+        lock = threading.Lock()
+        running, max_running = 0, 0
+
+        def payload():
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(running, max_running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+            return threading.current_thread()
+
+        futures = [runner.submit(payload) for _ in range(10)]
+        threads = {future.result(timeout=1) for future in futures}
+        assert max_running == 2
+        assert len(threads) == 2
+
+    def test_reap(self):
+        runner = ThreadRunner()
+        thread = threading.Thread(target=runner.run, daemon=True)
+        thread.start()
+        for _ in range(5):
+            runner.register_payload(lambda: time.sleep(0.01))
+        time.sleep(0.1)
+        assert not runner._threads
+        runner.stop()
+        thread.join(timeout=1)
+        assert not thread.is_alive()
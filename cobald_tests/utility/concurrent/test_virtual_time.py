@@ -0,0 +1,66 @@
+import asyncio
+import threading
+import time
+
+import pytest
+import trio
+
+from cobald.daemon.runners.meta_runner import MetaRunner
+from cobald.daemon.runners.virtual_time import VirtualClock, VirtualTimeEventLoop
+
+
+class TestVirtualTime(object):
+    def test_asyncio_loop(self):
+        event_loop = VirtualTimeEventLoop()
+
+        async def sleep_day():
+            start = event_loop.time()
+            for _ in range(24):
+                await asyncio.sleep(3600)
+            return event_loop.time() - start
+
+        start = time.monotonic()
+        try:
+            assert event_loop.run_until_complete(sleep_day()) == pytest.approx(86400)
+        finally:
+            event_loop.close()
+        assert time.monotonic() - start < 5
+
+    def test_asyncio_io(self):
+        """Virtual time does not jump ahead of pending callbacks"""
+        event_loop = VirtualTimeEventLoop(autojump_threshold=0.2)
+        wakeups = []
+
+        async def wait_wakeup():
+            loop_thread = threading.Thread(
+                target=lambda: event_loop.call_soon_threadsafe(wakeups.append, 1)
+            )
+            loop_thread.start()
+            await asyncio.sleep(3600)
+            loop_thread.join()
+
+        try:
+            event_loop.run_until_complete(wait_wakeup())
+        finally:
+            event_loop.close()
+        assert wakeups == [1]
+
+    @pytest.mark.parametrize("flavour", (asyncio, trio))
+    def test_meta_runner(self, flavour):
+        """Coroutines sleep in virtual time"""
+
+        async def sleep_day():
+            for _ in range(24):
+                await flavour.sleep(3600)
+            return "done"
+
+        runner = MetaRunner(clock=VirtualClock())
+        thread = threading.Thread(target=runner.run, daemon=True)
+        thread.start()
+        start = time.monotonic()
+        try:
+            assert runner.submit(sleep_day, flavour=flavour).result(timeout=5) == "done"
+        finally:
+            runner.stop()
+            thread.join(timeout=5)
+        assert time.monotonic() - start < 5
@@ -42,9 +42,13 @@ if __name__ == "__main__":
                     ("LinearController", "cobald.controller.linear"),
                     ("RelativeSupplyController", "cobald.controller.relative_supply"),
                     ("Buffer", "cobald.decorator.buffer"),
+                    ("Coalescer", "cobald.decorator.coalescer"),
                     ("Limiter", "cobald.decorator.limiter"),
                     ("Logger", "cobald.decorator.logger"),
+                    ("RateLimiter", "cobald.decorator.rate_limiter"),
                     ("Standardiser", "cobald.decorator.standardiser"),
+                    ("SyncAdapter", "cobald.decorator.adapter"),
+                    ("SimulatedPool", "cobald.simulation.pool"),
                     ("__yaml_tag_test", "cobald.daemon.plugins"),
                 )
             ],
@@ -56,14 +60,16 @@ if __name__ == "__main__":
         # >>> Dependencies
         install_requires=[
             "pyyaml",
-            "trio>=0.4.0",
+            "trio>=0.15",
             "entrypoints",
             "toposort",
             "typing_extensions",
         ],
         extras_require={
             "docs": ["sphinx", "sphinx_rtd_theme"],
+            "numpy": ["numpy"],
             "test": TESTS_REQUIRE,
+            "bench": ["pytest>=7.0", "pytest-benchmark"],
             "contrib": [
                 "flake8",
                 "flake8-bugbear",
@@ -0,0 +1,293 @@
+"""
+Composition of many homogeneous pools with metrics stored in arrays
+
+The metrics of all children of an :py:class:`ArrayPool` are kept in one array
+per metric. Aggregating metrics and distributing demand are whole-array
+operations instead of one property access per child.
+If :py:mod:`numpy` is available, metrics are stored in :py:class:`numpy.ndarray`;
+otherwise, the standard library :py:class:`array.array` is used.
+"""
+from typing import List, Optional, Sequence, Union
+import array
+
+from typing_extensions import Literal
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from ..interfaces import Pool, PoolState, CompositePool
+from .weighted import WeightedComposite
+
+
+Metric = Union[float, Sequence[float]]
+
+
+class _ArrayBackend(object):
+    """Array operations using the standard library :py:mod:`array`"""
+
+    @staticmethod
+    def zeros(size: int):
+        return array.array("d", bytes(8 * size))
+
+    @staticmethod
+    def resize(values, size: int):
+        if size < len(values):
+            del values[size:]
+        else:
+            values.frombytes(bytes(8 * (size - len(values))))
+        return values
+
+    @staticmethod
+    def total(values) -> float:
+        return sum(values)
+
+    @staticmethod
+    def dot(values, weights) -> float:
+        return sum(value * weight for value, weight in zip(values, weights))
+
+    @staticmethod
+    def assign(values, new: Metric):
+        if isinstance(new, (int, float)):
+            values[:] = array.array("d", [new]) * len(values)
+        else:
+            assert len(new) == len(values), "metric size must match the pool size"
+            values[:] = array.array("d", new)
+
+    @staticmethod
+    def assign_scaled(values, weights, scale: float):
+        values[:] = array.array("d", [weight * scale for weight in weights])
+
+
+class _NumpyBackend(object):
+    """Array operations using :py:mod:`numpy`"""
+
+    @staticmethod
+    def zeros(size: int):
+        return numpy.zeros(size)
+
+    @staticmethod
+    def resize(values, size: int):
+        if size < len(values):
+            return values[:size].copy()
+        return numpy.concatenate((values, numpy.zeros(size - len(values))))
+
+    @staticmethod
+    def total(values) -> float:
+        return float(values.sum())
+
+    @staticmethod
+    def dot(values, weights) -> float:
+        return float(numpy.dot(values, weights))
+
+    @staticmethod
+    def assign(values, new: Metric):
+        values[:] = new
+
+    @staticmethod
+    def assign_scaled(values, weights, scale: float):
+        numpy.multiply(weights, scale, out=values)
+
+
+class ArraySlot(Pool):
+    """
+    View of a single child of an :py:class:`ArrayPool`
+
+    All metrics are read from and written to the arrays of the pool.
+    """
+
+    __slots__ = ("_pool", "_index")
+
+    def __init__(self, pool: "ArrayPool", index: int):
+        self._pool = pool
+        self._index = index
+
+    @property
+    def demand(self):
+        return self._pool._demands[self._index]
+
+    @demand.setter
+    def demand(self, value):
+        self._pool._demands[self._index] = value
+
+    @property
+    def supply(self):
+        return self._pool._supplies[self._index]
+
+    @supply.setter
+    def supply(self, value):
+        self._pool._supplies[self._index] = value
+        self._pool._invalidate_snapshot()
+
+    @property
+    def utilisation(self):
+        return self._pool._utilisations[self._index]
+
+    @utilisation.setter
+    def utilisation(self, value):
+        self._pool._utilisations[self._index] = value
+        self._pool._invalidate_snapshot()
+
+    @property
+    def allocation(self):
+        return self._pool._allocations[self._index]
+
+    @allocation.setter
+    def allocation(self, value):
+        self._pool._allocations[self._index] = value
+        self._pool._invalidate_snapshot()
+
+    def __repr__(self):
+        return "<%s %d of %r>" % (self.__class__.__name__, self._index, self._pool)
+
+
+class ArrayPool(CompositePool):
+    """
+    Composition of homogeneous pools, with metrics of all children stored in arrays
+
+    :param size: the initial number of children
+    :param weight: the metric of children by which to weight them,
+                   or ``"uniform"`` to weight all children the same
+    :param use_numpy: whether to store metrics in :py:mod:`numpy` arrays,
+                      or :py:const:`None` to use :py:mod:`numpy` if available
+
+    The children are :py:class:`ArraySlot` views on the arrays.
+    Their metrics can be set individually via the views,
+    or for all children at once via :py:meth:`update`.
+    Metrics are aggregated and demand is distributed like for a
+    :py:class:`~.UniformComposite` or :py:class:`~.WeightedComposite`,
+    depending on ``weight``.
+    """
+
+    @property
+    def children(self) -> List[ArraySlot]:
+        return self._slots
+
+    @property
+    def demand(self):
+        return self._demand
+
+    @demand.setter
+    def demand(self, value):
+        self._demand = value
+        self._invalidate_snapshot()
+        size = len(self._slots)
+        if not size:
+            return
+        backend = self._backend
+        if self._weight != "uniform":
+            weights = self._weights()
+            total_weight = backend.total(weights)
+            if total_weight:
+                backend.assign_scaled(self._demands, weights, value / total_weight)
+                return
+        backend.assign(self._demands, value / size)
+
+    @property
+    def supply(self):
+        return self.snapshot().supply
+
+    @property
+    def utilisation(self):
+        return self.snapshot().utilisation
+
+    @property
+    def allocation(self):
+        return self.snapshot().allocation
+
+    def _weights(self):
+        return {
+            "supply": self._supplies,
+            "utilisation": self._utilisations,
+            "allocation": self._allocations,
+        }[self._weight]
+
+    def _aggregate(self) -> PoolState:
+        backend, size = self._backend, len(self._slots)
+        supply = backend.total(self._supplies)
+        if self._weight == "uniform":
+            if size:
+                utilisation = backend.total(self._utilisations) / size
+                allocation = backend.total(self._allocations) / size
+            else:
+                utilisation, allocation = 1.0, 1.0
+        else:
+            weights = self._weights()
+            total_weight = backend.total(weights)
+            if total_weight:
+                utilisation = backend.dot(self._utilisations, weights) / total_weight
+                allocation = backend.dot(self._allocations, weights) / total_weight
+            else:
+                utilisation = allocation = WeightedComposite._undefined_fitness(supply)
+        return PoolState(
+            supply=supply,
+            demand=self._demand,
+            utilisation=utilisation,
+            allocation=allocation,
+        )
+
+    def update(
+        self,
+        *,
+        supply: Optional[Metric] = None,
+        utilisation: Optional[Metric] = None,
+        allocation: Optional[Metric] = None,
+    ):
+        """
+        Set the metrics of all children at once
+
+        Each metric may be either a single value for all children,
+        or a sequence of one value per child.
+        """
+        backend = self._backend
+        for values, new in (
+            (self._supplies, supply),
+            (self._utilisations, utilisation),
+            (self._allocations, allocation),
+        ):
+            if new is not None:
+                backend.assign(values, new)
+        self._invalidate_snapshot()
+
+    def resize(self, size: int):
+        """Change the number of children, adding children without any resources"""
+        assert size >= 0, "size must not be negative"
+        backend = self._backend
+        self._demands = backend.resize(self._demands, size)
+        self._supplies = backend.resize(self._supplies, size)
+        self._utilisations = backend.resize(self._utilisations, size)
+        self._allocations = backend.resize(self._allocations, size)
+        if size < len(self._slots):
+            del self._slots[size:]
+        else:
+            self._slots.extend(
+                ArraySlot(self, index) for index in range(len(self._slots), size)
+            )
+        self._invalidate_snapshot()
+
+    def __init__(
+        self,
+        size: int = 0,
+        *,
+        weight: Literal["uniform", "supply", "utilisation", "allocation"] = "uniform",
+        use_numpy: Optional[bool] = None,
+    ):
+        assert weight in (
+            "uniform",
+            "supply",
+            "utilisation",
+            "allocation",
+        ), "weight must be either uniform, supply, utilisation or allocation"
+        if use_numpy is None:
+            use_numpy = numpy is not None
+        assert not use_numpy or numpy is not None, "use_numpy requires numpy"
+        self._backend = _NumpyBackend if use_numpy else _ArrayBackend
+        self._weight = weight
+        self._demand = 0.0
+        self._demands = self._backend.zeros(0)
+        self._supplies = self._backend.zeros(0)
+        self._utilisations = self._backend.zeros(0)
+        self._allocations = self._backend.zeros(0)
+        self._slots = []  # type: List[ArraySlot]
+        self.resize(size)
@@ -1,10 +1,88 @@
-from typing import Callable
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+from typing import Union
+import functools
+import heapq
+import inspect
+import itertools
 import weakref
 
 import trio
 
-from cobald.interfaces import Pool, CompositePool
+from cobald.interfaces import Pool, PoolState, CompositePool
 from cobald.daemon import service
+from cobald.daemon.scheduler import TickScheduler, resolve_scheduler
+
+
+def _is_async_callable(factory: Callable) -> bool:
+    """Check whether calling ``factory`` provides an awaitable"""
+    while isinstance(factory, functools.partial):
+        factory = factory.func
+    return inspect.iscoroutinefunction(factory) or inspect.iscoroutinefunction(
+        getattr(factory, "__call__", None)
+    )
+
+
+class _VictimIndex(object):
+    """
+    Priority queue of children ordered by how little used resources they supply
+
+    Each child is ranked by its ``supply * utilisation``; updating a child
+    invalidates its previous entry, which is lazily discarded when popped.
+    """
+
+    def __init__(self, children: Iterable[Pool] = ()):
+        self._counter = itertools.count()
+        self._entries = {
+            child: self._entry(child, child.snapshot()) for child in children
+        }  # type: Dict[Pool, list]
+        self._heap = list(self._entries.values())
+        heapq.heapify(self._heap)
+        #: total demand of all indexed children
+        self.demand = sum(entry[3].demand for entry in self._heap)
+        #: indexed children without any demand
+        self.depleted = {
+            child for child, entry in self._entries.items() if entry[3].demand <= 0
+        }  # type: Set[Pool]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, child: Pool):
+        return child in self._entries
+
+    def _entry(self, child: Pool, state: PoolState) -> list:
+        return [state.supply * state.utilisation, next(self._counter), child, state]
+
+    def update(self, child: Pool, state: PoolState):
+        """Add a ``child`` or replace its previous ``state``"""
+        self.discard(child)
+        entry = self._entries[child] = self._entry(child, state)
+        heapq.heappush(self._heap, entry)
+        self.demand += state.demand
+        if state.demand <= 0:
+            self.depleted.add(child)
+        if len(self._heap) > 2 * len(self._entries) + 32:
+            self._heap = [entry for entry in self._heap if entry[2] is not None]
+            heapq.heapify(self._heap)
+
+    def discard(self, child: Pool):
+        """Remove a ``child`` if it is indexed"""
+        entry = self._entries.pop(child, None)
+        if entry is not None:
+            entry[2] = None
+            self.demand -= entry[3].demand
+            self.depleted.discard(child)
+
+    def pop(self) -> Tuple[Pool, PoolState]:
+        """Remove and return the child supplying the least used resources"""
+        while self._heap:
+            *_, child, state = heapq.heappop(self._heap)
+            if child is not None:
+                del self._entries[child]
+                self.demand -= state.demand
+                self.depleted.discard(child)
+                return child, state
+        raise IndexError("pop from empty %s" % self.__class__.__name__)
 
 
 @service(flavour=trio)
@@ -12,8 +90,13 @@ class FactoryPool(CompositePool):
     """
     Composition that adds and removes pools to satisfy demand
 
-    :param factory: a callable that produces a new :py:class:`~.Pool`
+    :param factory: a callable or coroutine function that produces a new
+                    :py:class:`~.Pool`
     :param interval: how often to adjust the number of children
+    :param spawn_limit: how many children may be spawned concurrently
+    :param incremental: whether children :py:meth:`report` their changes
+    :param scheduler: a :py:class:`~.TickScheduler` or the name of a shared one
+                      to adjust children, instead of a separate timer
 
     Adjustment uses two extensions that children must respond to adequately:
 
@@ -22,6 +105,21 @@ class FactoryPool(CompositePool):
     * When disabled via ``demand=0``, children shall shut down
       and free any resources and tasks.
 
+    Spawning children does not block other activities of the daemon:
+    a coroutine ``factory`` is awaited concurrently, and a regular ``factory``
+    is called in a worker thread.
+    At most ``spawn_limit`` children are spawned at once. While children are
+    spawned, their expected demand is counted as provided already. Since the
+    demand of children is unknown before the first one is spawned, the first
+    child is spawned alone and the remaining demand is spawned once it is done.
+
+    .. note::
+
+        A regular ``factory`` must be thread-safe: it must not use
+        :py:mod:`trio` or modify state of the daemon and other pools
+        without synchronisation. Use a coroutine ``factory`` to spawn
+        children in the event loop of the daemon instead.
+
     Once spawned, children are free to adjust their demand if required.
     A child may disable itself permanently by setting its own ``demand = 0``.
     The :py:class:`FactoryPool` inspects the demand for all its children
@@ -35,6 +133,11 @@ class FactoryPool(CompositePool):
     It is the responsibility of children to report their status accordingly.
     For example, if a child shuts down and does not allocate its ``supply`` further,
     it should scale its reported ``allocation`` accordingly.
+
+    In ``incremental`` mode, the :py:class:`FactoryPool` does not inspect its
+    children before spawning or disabling children.
+    Instead, children must :py:meth:`report` whenever their state changes,
+    and children to disable are selected from an index of the reported states.
     """
 
     @property
@@ -50,85 +153,184 @@ class FactoryPool(CompositePool):
         # we may spend an arbitrary time spawning Drones,
         # just acknowledge demand and defer any actions
         self._demand = value
+        self._invalidate_snapshot()
 
     @property
     def supply(self):
-        return sum(child.supply for child in self.children)
+        return self.snapshot().supply
 
     @property
     def utilisation(self):
-        active_children = [child for child in self.children if child.supply > 0]
-        try:
-            return sum(child.utilisation for child in active_children) / len(
-                active_children
-            )
-        except ZeroDivisionError:
-            return 1.0
+        return self.snapshot().utilisation
 
     @property
     def allocation(self):
-        active_children = [child for child in self.children if child.supply > 0]
+        return self.snapshot().allocation
+
+    def _aggregate(self) -> PoolState:
+        supply, active_children, utilisation, allocation = 0, 0, 0, 0
+        for child in self.children:
+            state = child.snapshot()
+            supply += state.supply
+            if state.supply > 0:
+                active_children += 1
+                utilisation += state.utilisation
+                allocation += state.allocation
         try:
-            return sum(child.allocation for child in active_children) / len(
-                active_children
-            )
+            utilisation /= active_children
+            allocation /= active_children
         except ZeroDivisionError:
-            return 1.0
+            utilisation, allocation = 1.0, 1.0
+        return PoolState(
+            supply=supply,
+            demand=self._demand,
+            utilisation=utilisation,
+            allocation=allocation,
+        )
 
     def __init__(
-        self, *children: Pool, factory: Callable[[], Pool], interval: float = 30
+        self,
+        *children: Pool,
+        factory: Callable[[], Union[Pool, Awaitable[Pool]]],
+        interval: float = 30,
+        spawn_limit: int = 1,
+        incremental: bool = False,
+        scheduler: Union[TickScheduler, str, None] = None,
     ):
         self._demand = sum(child.demand for child in children)
         #: children fulfilling our demand
         self._hatchery = set(children)
         #: children shutting down
         self._mortuary = weakref.WeakSet()
+        #: state of children fulfilling our demand in incremental mode
+        self._victims = (
+            _VictimIndex(self._hatchery) if incremental else None
+        )  # type: Optional[_VictimIndex]
         self.factory = factory
         self.interval = interval
+        self.scheduler = resolve_scheduler(scheduler)
+        self._async_factory = _is_async_callable(factory)
+        self._spawn_limit = trio.CapacityLimiter(spawn_limit)
+        #: expected demand of children currently being spawned
+        self._spawning_demand = 0
+        #: demand of the most recently spawned child
+        self._spawn_estimate = None  # type: Optional[float]
+        #: nursery for spawning children while running
+        self._nursery = None  # type: Optional[trio.Nursery]
+
+    def report(self, child: Pool, state: Optional[PoolState] = None):
+        """
+        Update the state of a ``child`` in ``incremental`` mode
+
+        :param child: the child whose state has changed
+        :param state: the new state of ``child``, or :py:const:`None`
+                      to fetch it via :py:meth:`~.Pool.snapshot`
+
+        Reports of children that are already disabled are ignored.
+        """
+        if self._victims is None or child not in self._hatchery:
+            return
+        self._victims.update(child, child.snapshot() if state is None else state)
+        self._invalidate_snapshot()
 
     async def run(self):
-        while True:
-            await trio.sleep(self.interval)
-            # freeze target demand in case another thread updates us
-            supply, demand = self.supply, self.demand
-            if supply > demand:
-                self._shrink(target=demand)
-            else:
-                self._grow(target=demand)
+        async with trio.open_nursery() as nursery:
+            self._nursery = nursery
+            try:
+                if self.scheduler is not None:
+                    self.scheduler.register(self, self.interval)
+                    await trio.sleep_forever()
+                while True:
+                    await trio.sleep(self.interval)
+                    self.regulate(self.interval)
+            finally:
+                self._nursery = None
+
+    def regulate(self, interval):
+        """Spawn or disable children to match the demand"""
+        # freeze target demand in case another thread updates us
+        state = self.snapshot()
+        supply, demand = state.supply, state.demand
+        if supply > demand:
+            self._shrink(target=demand - self._spawning_demand)
+        else:
+            self._grow(target=demand, nursery=self._nursery)
+        self._invalidate_snapshot()
 
     def _shrink(self, target: float):
         # we can only reap children that are not already shutting down
         # prefer reaping children that supply few used resources
-        hit_list = sorted(
-            self._hatchery, key=lambda child: child.supply * child.utilisation
+        victims = (
+            self._victims if self._victims is not None else _VictimIndex(self._hatchery)
         )
-        excess_demand = sum(child.demand for child in hit_list) - target
-        for child in hit_list:
-            if excess_demand <= 0:
-                break
+        excess_demand = victims.demand - target
+        spared = []  # type: List[Tuple[Pool, PoolState]]
+        while excess_demand > 0 and victims:
+            child, state = victims.pop()
             # reap child
-            if child.demand <= excess_demand:
-                excess_demand -= child.demand
+            if state.demand <= excess_demand:
+                excess_demand -= state.demand
                 self._release_child(child)
+            else:
+                spared.append((child, state))
+        if self._victims is not None:
+            for child, state in spared:
+                self._victims.update(child, state)
         self._reap_children()
 
-    def _grow(self, target: float):
-        missing_demand = target - sum(child.demand for child in self.children)
+    def _grow(self, target: float, nursery: trio.Nursery):
+        if self._victims is None:
+            missing_demand = target - sum(child.demand for child in self.children)
+        else:
+            missing_demand = target - self._victims.demand
+        missing_demand -= self._spawning_demand
+        if missing_demand > 0 and self._spawn_estimate is None:
+            # without any spawned child, assume the next one satisfies all demand
+            # and spawn whatever is still missing once its demand is known
+            self._spawning_demand += missing_demand
+            nursery.start_soon(self._spawn_child, missing_demand, nursery)
+            missing_demand = 0
         while missing_demand > 0:
-            new_child = self.factory()
-            self._hatchery.add(new_child)
-            assert (
-                new_child.demand > 0
-            ), "factory must produce children with initial demand"
-            missing_demand -= new_child.demand
+            expected_demand = self._spawn_estimate
+            self._spawning_demand += expected_demand
+            nursery.start_soon(self._spawn_child, expected_demand)
+            missing_demand -= expected_demand
         self._reap_children()
 
+    async def _spawn_child(
+        self, expected_demand: float, nursery: Optional[trio.Nursery] = None
+    ):
+        try:
+            if self._async_factory:
+                async with self._spawn_limit:
+                    new_child = await self.factory()
+            else:
+                new_child = await trio.to_thread.run_sync(
+                    self.factory, limiter=self._spawn_limit
+                )
+        finally:
+            self._spawning_demand -= expected_demand
+        assert new_child.demand > 0, "factory must produce children with initial demand"
+        self._hatchery.add(new_child)
+        if self._victims is not None:
+            self._victims.update(new_child, new_child.snapshot())
+        self._spawn_estimate = new_child.demand
+        self._invalidate_snapshot()
+        if nursery is not None:
+            # demand may have changed while spawning, only grow to the current one
+            self._grow(target=self._demand, nursery=nursery)
+
     def _reap_children(self):
-        for child in list(self._hatchery):
-            if child.demand <= 0:
-                self._release_child(child)
+        if self._victims is None:
+            depleted = [child for child in self._hatchery if child.demand <= 0]
+        else:
+            depleted = list(self._victims.depleted)
+        for child in depleted:
+            self._release_child(child)
 
     def _release_child(self, child: Pool):
         child.demand = 0
         self._hatchery.discard(child)
         self._mortuary.add(child)
+        if self._victims is not None:
+            self._victims.discard(child)
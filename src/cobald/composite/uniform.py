@@ -1,4 +1,4 @@
-from ..interfaces import Pool, CompositePool
+from ..interfaces import Pool, PoolState, CompositePool
 
 
 class UniformComposite(CompositePool):
@@ -15,29 +15,41 @@ class UniformComposite(CompositePool):
     @demand.setter
     def demand(self, value):
         self._demand = value
+        self._invalidate_snapshot()
         child_count = len(self.children)
         for pool in self.children:
             pool.demand = value / child_count
 
     @property
     def supply(self):
-        return sum(child.supply for child in self.children)
+        return self.snapshot().supply
 
     @property
     def utilisation(self):
-        try:
-            return sum(child.utilisation for child in self.children) / len(
-                self.children
-            )
-        except ZeroDivisionError:
-            return 1.0
+        return self.snapshot().utilisation
 
     @property
     def allocation(self):
+        return self.snapshot().allocation
+
+    def _aggregate(self) -> PoolState:
+        supply, utilisation, allocation = 0, 0, 0
+        for child in self.children:
+            state = child.snapshot()
+            supply += state.supply
+            utilisation += state.utilisation
+            allocation += state.allocation
         try:
-            return sum(child.allocation for child in self.children) / len(self.children)
+            utilisation /= len(self.children)
+            allocation /= len(self.children)
         except ZeroDivisionError:
-            return 1.0
+            utilisation, allocation = 1.0, 1.0
+        return PoolState(
+            supply=supply,
+            demand=self._demand,
+            utilisation=utilisation,
+            allocation=allocation,
+        )
 
     def __init__(self, *children: Pool):
         self._demand = sum(child.demand for child in children)
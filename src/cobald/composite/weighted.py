@@ -1,6 +1,8 @@
+from typing import Dict, List, Optional
+
 from typing_extensions import Literal
 
-from ..interfaces import Pool, CompositePool
+from ..interfaces import Pool, PoolState, CompositePool
 
 
 class WeightedComposite(CompositePool):
@@ -24,9 +26,33 @@ class WeightedComposite(CompositePool):
 
     The latter rule expresses that the total fitness of a Pool is 0 either if the
     fitness of all its children is 0, or there are no children.
+
+    In ``incremental`` mode, the composite does not inspect its children on its own.
+    Instead, children must :py:meth:`report` whenever their state changes;
+    the composite keeps running sums of the reported states, so that
+    reading metrics is independent of the number of children.
+    The ``children`` should only be replaced as a whole in this mode,
+    which also reads the current state of all children.
+
+    Note that neither the composite nor its children call :py:meth:`report`
+    automatically. Whoever changes the state of a child, such as the child
+    itself or the code feeding it new metrics, is responsible for reporting it;
+    unreported changes are not reflected by the composite.
+
+    :param weight: the metric of children by which to weight them
+    :param incremental: whether children :py:meth:`report` their changes
     """
 
-    children = []
+    @property
+    def children(self) -> List[Pool]:
+        return self._children
+
+    @children.setter
+    def children(self, value: List[Pool]):
+        self._children = value
+        if self._states is not None:
+            self._states = {child: child.snapshot() for child in value}
+            self._rebuild_aggregates()
 
     @property
     def demand(self):
@@ -35,44 +61,116 @@ class WeightedComposite(CompositePool):
     @demand.setter
     def demand(self, value):
         self._demand = value
-        child_count = len(self.children)
-        for pool in self.children:
+        self._invalidate_snapshot()
+        children = self.children
+        if self._states is not None:
+            weights = [getattr(self._states[child], self._weight) for child in children]
+            total_weight = self._total_weight
+        else:
+            weights = [getattr(child, self._weight) for child in children]
+            total_weight = sum(weights)
+        for pool, weight in zip(children, weights):
             try:
-                pool.demand = value * getattr(pool, self._weight) / self._total_weight
+                pool.demand = value * weight / total_weight
             except ZeroDivisionError:
-                pool.demand = value / child_count
+                pool.demand = value / len(children)
+
+    def report(self, child: Pool, state: Optional[PoolState] = None):
+        """
+        Update the state of a ``child`` in ``incremental`` mode
+
+        :param child: the child whose state has changed
+        :param state: the new state of ``child``, or :py:const:`None`
+                      to fetch it via :py:meth:`~.Pool.snapshot`
+        """
+        if self._states is None:
+            return
+        state = child.snapshot() if state is None else state
+        try:
+            self._add_state(self._states[child], sign=-1)
+        except KeyError:
+            raise ValueError("%r is not a child of %r" % (child, self)) from None
+        self._states[child] = state
+        self._add_state(state, sign=1)
+        self._invalidate_snapshot()
+
+    def _add_state(self, state: PoolState, sign: int):
+        """Add (``sign=1``) or remove (``sign=-1``) a child ``state`` from the sums"""
+        weight = getattr(state, self._weight)
+        self._supply += sign * state.supply
+        self._total_weight += sign * weight
+        self._utilisation += sign * state.utilisation * weight
+        self._allocation += sign * state.allocation * weight
+        # Adding and removing floats leaves rounding errors in the sums, which
+        # would turn the zero weight fallback into a division by almost zero.
+        # Counting the children that contribute is exact, so sums without any
+        # contributions are reset to exactly zero.
+        self._supplied += sign * (state.supply != 0)
+        self._weighted += sign * (weight != 0)
+        if not self._supplied:
+            self._supply = 0
+        if not self._weighted:
+            self._total_weight = self._utilisation = self._allocation = 0
+
+    def _rebuild_aggregates(self):
+        """Recompute all running sums from the known states of all children"""
+        self._supply = self._total_weight = self._utilisation = self._allocation = 0
+        #: number of children with non-zero supply and weight, respectively
+        self._supplied = self._weighted = 0
+        for state in self._states.values():
+            self._add_state(state, sign=1)
+        self._invalidate_snapshot()
 
     @property
     def supply(self):
-        return sum(child.supply for child in self.children)
+        return self.snapshot().supply
 
     @property
     def utilisation(self):
-        try:
-            return (
-                sum(
-                    child.utilisation * getattr(child, self._weight)
-                    for child in self.children
-                )
-                / self._total_weight
-            )
-        except ZeroDivisionError:
-            return self._undefined_fitness()
+        return self.snapshot().utilisation
 
     @property
     def allocation(self):
+        return self.snapshot().allocation
+
+    def _aggregate(self) -> PoolState:
+        if self._states is not None:
+            return self._aggregate_incremental()
+        supply, total_weight, utilisation, allocation = 0, 0, 0, 0
+        for child in self.children:
+            state = child.snapshot()
+            weight = getattr(state, self._weight)
+            supply += state.supply
+            total_weight += weight
+            utilisation += state.utilisation * weight
+            allocation += state.allocation * weight
         try:
-            return (
-                sum(
-                    child.allocation * getattr(child, self._weight)
-                    for child in self.children
-                )
-                / self._total_weight
-            )
+            utilisation /= total_weight
+            allocation /= total_weight
         except ZeroDivisionError:
-            return self._undefined_fitness()
-
-    def _undefined_fitness(self) -> float:
+            utilisation = allocation = self._undefined_fitness(supply)
+        return PoolState(
+            supply=supply,
+            demand=self._demand,
+            utilisation=utilisation,
+            allocation=allocation,
+        )
+
+    def _aggregate_incremental(self) -> PoolState:
+        try:
+            utilisation = self._utilisation / self._total_weight
+            allocation = self._allocation / self._total_weight
+        except ZeroDivisionError:
+            utilisation = allocation = self._undefined_fitness(self._supply)
+        return PoolState(
+            supply=self._supply,
+            demand=self._demand,
+            utilisation=utilisation,
+            allocation=allocation,
+        )
+
+    @staticmethod
+    def _undefined_fitness(supply: float) -> float:
         """Fitness (allocation/utilisation) to return when weighting is zero"""
         # There are two separate causes why we end up here:
         # 1. supply == 0 and there is nothing that can contribute to the weight
@@ -85,16 +183,13 @@ class WeightedComposite(CompositePool):
         # eventually get real data once children exist.
         #
         # See also issues #75, #18
-        return 0.0 if self.supply > 0 else 1.0
-
-    @property
-    def _total_weight(self):
-        return sum(getattr(child, self._weight) for child in self.children)
+        return 0.0 if supply > 0 else 1.0
 
     def __init__(
         self,
         *children: Pool,
         weight: Literal["supply", "utilisation", "allocation"] = "supply",
+        incremental: bool = False,
     ):
         assert weight in (
             "supply",
@@ -103,4 +198,8 @@ class WeightedComposite(CompositePool):
         ), "weight must be either supply, utilisation or allocation"
         self._weight = weight
         self._demand = sum(child.demand for child in children)
+        #: last reported state of each child in incremental mode
+        self._states = (
+            {} if incremental else None
+        )  # type: Optional[Dict[Pool, PoolState]]
         self.children = list(children)
@@ -1,8 +1,11 @@
+from typing import Union
+
 import trio
 
 from cobald.interfaces import Pool, Controller
 
 from cobald.daemon import service
+from cobald.daemon.scheduler import TickScheduler, resolve_scheduler
 
 
 @service(flavour=trio)
@@ -15,26 +18,39 @@ class LinearController(Controller):
     :param high_allocation: pool allocation above which resources are increased
     :param rate: maximum change of demand in resources per second
     :param interval: interval between adjustments in seconds
+    :param scheduler: a :py:class:`~.TickScheduler` or the name of a shared one
+                      to run adjustments, instead of a separate timer
     """
 
     def __init__(
-        self, target: Pool, low_utilisation=0.5, high_allocation=0.5, rate=1, interval=1
+        self,
+        target: Pool,
+        low_utilisation=0.5,
+        high_allocation=0.5,
+        rate=1,
+        interval=1,
+        scheduler: Union[TickScheduler, str, None] = None,
     ):
         super().__init__(target=target)
         assert rate > 0
         self.rate = rate
         self.interval = interval
+        self.scheduler = resolve_scheduler(scheduler)
         assert low_utilisation <= high_allocation
         self.low_utilisation = low_utilisation
         self.high_allocation = high_allocation
 
     async def run(self):
+        if self.scheduler is not None:
+            self.scheduler.register(self, self.interval)
+            return
         while True:
             self.regulate(self.interval)
             await trio.sleep(self.interval)
 
     def regulate(self, interval):
-        if self.target.utilisation < self.low_utilisation:
-            self.target.demand -= interval * self.rate
-        elif self.target.allocation > self.high_allocation:
-            self.target.demand += interval * self.rate
+        state = self.target.snapshot()
+        if state.utilisation < self.low_utilisation:
+            self.target.demand = state.demand - interval * self.rate
+        elif state.allocation > self.high_allocation:
+            self.target.demand = state.demand + interval * self.rate
@@ -1,8 +1,11 @@
+from typing import Union
+
 import trio
 
 from cobald.interfaces import Pool, Controller
 
 from cobald.daemon import service
+from cobald.daemon.scheduler import TickScheduler, resolve_scheduler
 
 
 @service(flavour=trio)
@@ -16,6 +19,8 @@ class RelativeSupplyController(Controller):
     :param low_scale: scale of ``target.supply`` when decreasing resources
     :param high_scale: scale of ``target.supply`` when increasing resources
     :param interval: interval between adjustments in seconds
+    :param scheduler: a :py:class:`~.TickScheduler` or the name of a shared one
+                      to run adjustments, instead of a separate timer
     """
 
     def __init__(
@@ -26,9 +31,11 @@ class RelativeSupplyController(Controller):
         low_scale=0.9,
         high_scale=1.1,
         interval=1,
+        scheduler: Union[TickScheduler, str, None] = None,
     ):
         super().__init__(target=target)
         self.interval = interval
+        self.scheduler = resolve_scheduler(scheduler)
         assert low_utilisation <= high_allocation
         self.low_utilisation = low_utilisation
         self.high_allocation = high_allocation
@@ -39,14 +46,18 @@ class RelativeSupplyController(Controller):
         self.high_scale = high_scale
 
     async def run(self):
+        if self.scheduler is not None:
+            self.scheduler.register(self, self.interval)
+            return
         while True:
             self.regulate(self.interval)
             await trio.sleep(self.interval)
 
     def regulate(self, interval):
-        if self.target.utilisation < self.low_utilisation:
-            self.target.demand = self.target.supply * self.low_scale
-        elif self.target.allocation > self.high_allocation:
-            self.target.demand = self.target.supply * self.high_scale
+        state = self.target.snapshot()
+        if state.utilisation < self.low_utilisation:
+            self.target.demand = state.supply * self.low_scale
+        elif state.allocation > self.high_allocation:
+            self.target.demand = state.supply * self.high_scale
         else:
-            self.target.demand = self.target.supply
+            self.target.demand = state.supply
@@ -1,11 +1,14 @@
+from bisect import bisect_right
 from functools import partial
 from itertools import chain
-from typing import Callable, Tuple, Optional, TypeVar, List, Set, Dict, overload
+from typing import Callable, Tuple, Optional, TypeVar, List, Set, Sequence, Union
+from typing import overload
 
 import trio
 
 from ..interfaces import Pool, Controller, Partial
 from ..daemon import service
+from ..daemon.scheduler import TickScheduler, resolve_scheduler
 
 C = TypeVar("C", bound="Controller")
 
@@ -30,31 +33,49 @@ class RangeSelector(object):
 
     :param base: base rule that has no lower bound
     :param rules: lower bound and its control rule
+
+    Rules are looked up by bisecting their sorted lower bounds.
+    The range of the most recently selected rule is remembered, so that
+    repeatedly selecting from the same range does not search again.
     """
 
     def __init__(self, base: ControlRule, *rules: Tuple[float, ControlRule]):
-        self._lookup = self._compile_lookup(base, rules)
-
-    def get_rule(self, supply: float):
-        for (low, high), rule in self._lookup.items():
-            if low <= supply < high:
-                return rule
+        self._thresholds, self._rules = self._compile_lookup(base, rules)
+        #: lower bound, upper bound and rule of the most recent lookup
+        self._recent = (
+            0,
+            self._thresholds[0] if self._thresholds else float("inf"),
+            base,
+        )  # type: Tuple[float, float, ControlRule]
+
+    def get_rule(self, supply: float) -> Optional[ControlRule]:
+        low, high, rule = self._recent
+        if low <= supply < high:
+            return rule
+        if not supply >= 0:
+            return None
+        thresholds = self._thresholds
+        index = bisect_right(thresholds, supply)
+        rule = self._rules[index]
+        self._recent = (
+            thresholds[index - 1] if index > 0 else 0,
+            thresholds[index] if index < len(thresholds) else float("inf"),
+            rule,
+        )
+        return rule
 
     @staticmethod
-    def _compile_lookup(base, rules) -> Dict[Tuple[float, float], ControlRule]:
+    def _compile_lookup(
+        base: ControlRule, rules: Sequence[Tuple[float, ControlRule]]
+    ) -> Tuple[List[float], List[ControlRule]]:
+        """Compile ``rules`` to their sorted lower bounds and matching rules"""
         if not rules:
-            return {(0, float("inf")): base}
-        lookup = {}
-        thresholds, _rules = zip(*sorted(rules))
-        for low, high, rule in zip(
-            chain([0], thresholds),
-            chain(thresholds, [float("inf")]),
-            chain([base], _rules),
-        ):
+            return [], [base]
+        thresholds, _rules = zip(*sorted(rules, key=lambda item: item[0]))
+        for low, high in zip(chain([0], thresholds), thresholds):
             if low == high:
                 raise ValueError("Duplicate entries for threshold %s" % low)
-            lookup[low, high] = rule
-        return lookup
+        return list(thresholds), [base, *_rules]
 
 
 @service(flavour=trio)
@@ -62,6 +83,13 @@ class Stepwise(Controller):
     """
     Controller that selects from several strategies based on supply
 
+    :param target: the pool to manage
+    :param base: the rule to use for the lowest supply
+    :param rules: lower bound of supply and its control rule
+    :param interval: interval between adjustments in seconds
+    :param scheduler: a :py:class:`~.TickScheduler` or the name of a shared one
+                      to run adjustments, instead of a separate timer
+
     :see: :py:class:`UnboundStepwise` allows creating :py:class:`Stepwise` instances
           via decorators.
     """
@@ -72,19 +100,26 @@ class Stepwise(Controller):
         base: ControlRule,
         *rules: Tuple[float, ControlRule],
         interval: float = 1,
+        scheduler: Union[TickScheduler, str, None] = None,
     ):
         super().__init__(target)
         self.interval = interval
+        self.scheduler = resolve_scheduler(scheduler)
         self._selector = RangeSelector(base, *rules)
 
     async def run(self):
-        target, interval = self.target, self.interval
+        if self.scheduler is not None:
+            self.scheduler.register(self, self.interval)
+            return
         while True:
-            current_rule = self._selector.get_rule(target.supply)
-            demand = current_rule(target, interval)
-            if demand is not None:
-                self.target.demand = demand
-            await trio.sleep(interval)
+            self.regulate(self.interval)
+            await trio.sleep(self.interval)
+
+    def regulate(self, interval):
+        current_rule = self._selector.get_rule(self.target.supply)
+        demand = current_rule(self.target, interval)
+        if demand is not None:
+            self.target.demand = demand
 
 
 class UnboundStepwise(object):
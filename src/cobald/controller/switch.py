@@ -1,3 +1,4 @@
+from bisect import bisect_right
 from typing import Union
 
 import trio
@@ -5,6 +6,7 @@ import trio
 from ..interfaces import Pool, Controller
 from ..utility import enforce, InvariantError, pairwise
 from ..daemon import service
+from ..daemon.scheduler import TickScheduler, resolve_scheduler
 
 
 @service(flavour=trio)
@@ -20,6 +22,16 @@ class DemandSwitch(Controller):
     :param default: controller to use by default
     :param slaves: pairs of minimum demand to switch and corresponding controller
     :param interval: interval between adjustments in seconds
+    :param scheduler: a :py:class:`~.TickScheduler` or the name of a shared one
+                      to run adjustments, instead of a separate timer
+    :param hysteresis: how far demand must leave the range of the current
+                       controller before switching to another one
+
+    The controller for the current demand is selected by bisecting the sorted
+    minimum demands of all slaves.
+    With a ``hysteresis``, the switch keeps the current controller while the
+    demand stays within ``hysteresis`` of its range. This avoids thrashing
+    between controllers when demand fluctuates around a threshold.
     """
 
     def __init__(
@@ -28,14 +40,17 @@ class DemandSwitch(Controller):
         default: Controller,
         *slaves: Union[float, Controller],
         interval=1,
+        scheduler: Union[TickScheduler, str, None] = None,
+        hysteresis: float = 0,
     ):
         super().__init__(target)
         enforce(
             len(slaves) % 2 == 0,
             InvariantError("slaves must be paired with required demands"),
         )
+        enforce(hysteresis >= 0, InvariantError("hysteresis must not be negative"))
         self._default = default
-        self._slaves = tuple(sorted(pairwise(slaves)))
+        self._slaves = tuple(sorted(pairwise(slaves), key=lambda slave: slave[0]))
         enforce(
             all(
                 (isinstance(demand, (int, float)) and isinstance(slave, Controller))
@@ -52,15 +67,31 @@ class DemandSwitch(Controller):
         for _, slave in self._slaves:
             slave.target = target
         self.interval = interval
+        self.scheduler = resolve_scheduler(scheduler)
+        self.hysteresis = hysteresis
+        self._thresholds = [demand for demand, _ in self._slaves]
+        self._controllers = [default, *(slave for _, slave in self._slaves)]
+        #: index of the most recently selected controller
+        self._selected = 0
 
     async def run(self):
+        if self.scheduler is not None:
+            self.scheduler.register(self, self.interval)
+            return
         while True:
-            self.regulate_demand(self.interval)
+            self.regulate(self.interval)
             await trio.sleep(self.interval)
 
     def regulate(self, interval):
-        chosen = self._default
-        for demand, slave in self._slaves:
-            if demand <= self.target.demand:
-                chosen = slave
-        chosen.regulate(interval)
+        self._controllers[self._select(self.target.demand)].regulate(interval)
+
+    def _select(self, demand: float) -> int:
+        """Select the index of the controller responsible for ``demand``"""
+        thresholds, selected = self._thresholds, self._selected
+        if self.hysteresis:
+            low = thresholds[selected - 1] if selected > 0 else -float("inf")
+            high = thresholds[selected] if selected < len(thresholds) else float("inf")
+            if low - self.hysteresis <= demand < high + self.hysteresis:
+                return selected
+        self._selected = bisect_right(thresholds, demand)
+        return self._selected
@@ -1,6 +1,39 @@
-from .runners.service import ServiceRunner, service
+import sys
+import threading
+from typing import TYPE_CHECKING
 
-#: The runner invoked on daemon startup
-runtime = ServiceRunner()
+if TYPE_CHECKING:
+    from .runners.service import ServiceRunner, service
 
 __all__ = ["runtime", "service"]
+
+_runtime_lock = threading.Lock()
+
+
+def __getattr__(name: str):
+    # import and create the runtime on first use, so that importing is cheap
+    if name == "service":
+        from .runners.service import service
+
+        return service
+    elif name == "runtime":
+        from .runners.service import ServiceRunner
+
+        # __getattr__ is only called if there is no runtime yet, but several
+        # threads may get here at once and only the first may create it
+        with _runtime_lock:
+            try:
+                return globals()["runtime"]
+            except KeyError:
+                pass
+            global runtime
+            runtime = ServiceRunner()
+            return runtime
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+if sys.version_info < (3, 7):  # module __getattr__ requires PEP 562
+    from .runners.service import ServiceRunner, service  # noqa: F811
+
+    #: The runner invoked on daemon startup
+    runtime = ServiceRunner()
@@ -1,7 +1,8 @@
+import functools
 import logging
 import logging.config
 import sys
-from typing import Any, Dict, TypeVar, Callable, Tuple, Generic
+from typing import Any, Dict, TypeVar, Callable, Tuple, Generic, Iterable, List, Set
 
 from entrypoints import EntryPoint
 
@@ -87,8 +88,14 @@ class Translator(object):
         return factory(*args, **mapping)
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def load_name(absolute_name: str):
-        """Load an object based on an absolute, dotted name"""
+        """
+        Load an object based on an absolute, dotted name
+
+        Successfully loaded names are cached, to avoid repeatedly
+        looking up objects used by several configuration elements.
+        """
         path = absolute_name.split(".")
         try:
             __import__(absolute_name)
@@ -184,31 +191,58 @@ def load_configuration(
     :param plugins: all plugins that *might* apply, in order
     :return: the output of all applied plugins
     """
-    try:
-        logging_mapping = config_data.pop("logging")
-    except KeyError:
-        pass
-    else:
-        configure_logging(logging_mapping)
-    # see if there is any unexpected config content
-    unmatched = config_data.keys() - {plugin.section for plugin in plugins}
-    if unmatched:
-        raise ConfigurationError(
-            where="root", what="unknown config sections %s" % ", ".join(unmatched)
-        )
-    content = {}
-    for plugin in plugins:
+    return {
+        plugin: output
+        for plugin, (output,) in load_documents((config_data,), plugins).items()
+    }
+
+
+def load_documents(
+    documents: Iterable[Dict[str, Any]], plugins: Tuple[SectionPlugin] = ()
+) -> Dict[SectionPlugin, List[Any]]:
+    """
+    Load the configuration from several mappings, applying plugins to sections
+
+    :param documents: the raw configuration documents without any plugins applied
+    :param plugins: all plugins that *might* apply, in order
+    :return: the outputs of all applied plugins, in order of documents
+
+    Each document is digested before the next one is fetched, so that
+    ``documents`` may lazily provide documents one at a time.
+    The outputs of each plugin are always a list with one output for
+    each document containing its section, even if there is only one document.
+    """
+    outputs = {}  # type: Dict[SectionPlugin, List[Any]]
+    found = set()  # type: Set[str]
+    for config_data in documents:
+        if config_data is None:  # empty document in a multi-document stream
+            continue
         try:
-            section_data = config_data[plugin.section]
+            logging_mapping = config_data.pop("logging")
         except KeyError:
-            if plugin.required:
-                raise ConfigurationError(
-                    where="root", what="missing section %r" % plugin.section
-                ) from None
+            pass
         else:
+            configure_logging(logging_mapping)
+        # see if there is any unexpected config content
+        unmatched = config_data.keys() - {plugin.section for plugin in plugins}
+        if unmatched:
+            raise ConfigurationError(
+                where="root", what="unknown config sections %s" % ", ".join(unmatched)
+            )
+        for plugin in plugins:
+            try:
+                section_data = config_data[plugin.section]
+            except KeyError:
+                continue
+            found.add(plugin.section)
             # invoke the plugin and store possible output
             # to avoid it being garbage collected
             plugin_content = plugin.digest(section_data)
             if plugin_content is not None:
-                content[plugin] = plugin_content
-    return content
+                outputs.setdefault(plugin, []).append(plugin_content)
+    for plugin in plugins:
+        if plugin.required and plugin.section not in found:
+            raise ConfigurationError(
+                where="root", what="missing section %r" % plugin.section
+            )
+    return outputs
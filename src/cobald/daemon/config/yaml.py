@@ -1,27 +1,222 @@
-from typing import Type, Tuple, Callable, TypeVar
+from typing import Any, Type, Tuple, Callable, TypeVar, Optional, Iterator, List
+from typing import Dict
+import hashlib
+import json
+import logging
+import os
+import stat
+import sys
+import tempfile
 
+import yaml
 from yaml import SafeLoader, BaseLoader, nodes
 
+import cobald.__about__
+
 from .mapping import (
-    load_configuration as load_mapping_configuration,
+    load_documents,
     ConfigurationError,
     SectionPlugin,
 )
 
-
 R = TypeVar("R")
 
+_logger = logging.getLogger(__package__)
+
+#: version of the format of cached configurations
+_CACHE_FORMAT = "json-nodes-1"
+
 
 def load_configuration(
-    path: str, loader: Type[BaseLoader] = SafeLoader, plugins: Tuple[SectionPlugin] = ()
+    path: str,
+    loader: Type[BaseLoader] = SafeLoader,
+    plugins: Tuple[SectionPlugin] = (),
+    cache_dir: Optional[str] = None,
 ):
+    """
+    Load the YAML configuration at ``path``
+
+    :param path: path of the configuration file
+    :param loader: the PyYAML loader which constructs the configuration
+    :param plugins: all plugins that *might* apply, in order
+    :param cache_dir: directory to cache the parsed configuration in
+    :return: the outputs of all applied plugins, as a list per plugin
+
+    The configuration may consist of several YAML documents.
+    These are parsed and digested one at a time, so that only the
+    YAML nodes of one document are kept in memory at once.
+    Each plugin provides a list with one output for each document
+    containing its section, as by
+    :py:func:`~cobald.daemon.config.mapping.load_documents`.
+
+    If ``cache_dir`` is set, the composed YAML nodes are stored as JSON.
+    Subsequent loads of the same configuration skip parsing and only
+    construct objects from the cached nodes.
+    The cache is invalidated by changes to the content of the configuration,
+    the ``loader`` and its tags, the ``plugins`` and the versions of
+    Python, PyYAML and cobald.
+    Cache entries are ignored unless they are owned by the current user
+    and are not writeable by group or others.
+
+    .. warning::
+
+        Only use a ``cache_dir`` that is exclusively writeable by the daemon.
+        While cached nodes are plain data, whoever can replace them
+        controls which objects the configuration creates.
+    """
     with open(path) as yaml_stream:
-        loader_instance = loader(yaml_stream)
+        if cache_dir is None:
+            return load_documents(_load_all(yaml_stream, loader), plugins=plugins)
+        content = yaml_stream.read()
+    documents = _compose_cached(content, loader, plugins, cache_dir)
+    return load_documents(_construct_all(documents, loader), plugins=plugins)
+
+
+def _load_all(stream, loader: Type[BaseLoader]) -> Iterator[Any]:
+    """Parse and construct each document of ``stream`` one at a time"""
+    loader_instance = loader(stream)
+    try:
+        while loader_instance.check_node():
+            yield loader_instance.construct_document(loader_instance.get_node())
+    finally:
+        loader_instance.dispose()
+
+
+def _construct_all(documents: List[nodes.Node], loader: Type[BaseLoader]):
+    """Construct each document from its composed YAML nodes"""
+    loader_instance = loader("")
+    try:
+        for node in documents:
+            yield loader_instance.construct_document(node)
+    finally:
+        loader_instance.dispose()
+
+
+def _compose_all(content: str, loader: Type[BaseLoader]) -> List[nodes.Node]:
+    """Parse ``content`` to a tree of YAML nodes for each document"""
+    loader_instance = loader(content)
+    try:
+        documents = []
+        while loader_instance.check_node():
+            documents.append(loader_instance.get_node())
+        return documents
+    finally:
+        loader_instance.dispose()
+
+
+def _cache_key(
+    content: str, loader: Type[BaseLoader], plugins: Tuple[SectionPlugin]
+) -> str:
+    """Hash of everything that may change how ``content`` is loaded"""
+    digest = hashlib.sha256(content.encode())
+    for part in (
+        _CACHE_FORMAT,
+        sys.version,
+        yaml.__version__,
+        cobald.__about__.__version__,
+        "%s.%s" % (loader.__module__, loader.__qualname__),
+        *sorted(map(str, loader.yaml_constructors)),
+        *(plugin.section for plugin in plugins),
+    ):
+        digest.update(b"\0" + part.encode())
+    return digest.hexdigest()
+
+
+def _dump_nodes(documents: List[nodes.Node]) -> dict:
+    """Convert the YAML nodes of ``documents`` to plain data, keeping shared nodes"""
+    positions = {}  # type: Dict[int, int]
+    records = []  # type: List[list]
+
+    def dump(node: nodes.Node) -> int:
         try:
-            config_data = loader_instance.get_single_data()
-        finally:
-            loader_instance.dispose()
-    return load_mapping_configuration(config_data=config_data, plugins=plugins)
+            return positions[id(node)]
+        except KeyError:
+            position = positions[id(node)] = len(records)
+        # reserve our slot, since recursive nodes may refer to it
+        records.append(None)
+        if isinstance(node, nodes.ScalarNode):
+            record = ["scalar", node.tag, node.value, node.style]
+        elif isinstance(node, nodes.SequenceNode):
+            items = [dump(item) for item in node.value]
+            record = ["sequence", node.tag, items, node.flow_style]
+        elif isinstance(node, nodes.MappingNode):
+            items = [[dump(key), dump(value)] for key, value in node.value]
+            record = ["mapping", node.tag, items, node.flow_style]
+        else:
+            raise TypeError("cannot cache YAML node %r" % node)
+        records[position] = record
+        return position
+
+    return {"documents": [dump(node) for node in documents], "nodes": records}
+
+
+def _load_nodes(data: dict) -> List[nodes.Node]:
+    """Restore the YAML nodes of documents from plain data"""
+    records = data["nodes"]
+    restored = []  # type: List[nodes.Node]
+    for kind, tag, value, style in records:
+        if kind == "scalar":
+            restored.append(nodes.ScalarNode(tag, value, style=style))
+        elif kind == "sequence":
+            restored.append(nodes.SequenceNode(tag, [], flow_style=style))
+        elif kind == "mapping":
+            restored.append(nodes.MappingNode(tag, [], flow_style=style))
+        else:
+            raise ValueError("unknown YAML node kind %r" % kind)
+    # collections are filled only now, since they may refer to any node
+    for position, (kind, _, value, _) in enumerate(records):
+        if kind == "sequence":
+            restored[position].value.extend(restored[item] for item in value)
+        elif kind == "mapping":
+            restored[position].value.extend(
+                (restored[key], restored[item]) for key, item in value
+            )
+    return [restored[position] for position in data["documents"]]
+
+
+def _check_trusted(cache_stream):
+    """Ensure that nobody but the current user may have written a cache entry"""
+    cache_stat = os.fstat(cache_stream.fileno())
+    if hasattr(os, "getuid") and cache_stat.st_uid != os.getuid():
+        raise PermissionError("not owned by the current user")
+    if cache_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise PermissionError("writeable by group or others")
+
+
+def _compose_cached(
+    content: str,
+    loader: Type[BaseLoader],
+    plugins: Tuple[SectionPlugin],
+    cache_dir: str,
+) -> List[nodes.Node]:
+    """Parse ``content`` to YAML nodes for each document, using and filling a cache"""
+    cache_path = os.path.join(
+        cache_dir, "%s.json" % _cache_key(content, loader, plugins)
+    )
+    try:
+        with open(cache_path, "r") as cache_stream:
+            _check_trusted(cache_stream)
+            return _load_nodes(json.load(cache_stream))
+    except FileNotFoundError:
+        pass
+    except Exception as err:
+        _logger.warning("ignoring configuration cache %r: %s", cache_path, err)
+    documents = _compose_all(content, loader)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # write to a temporary file first, so that no reader sees a partial cache
+        with tempfile.NamedTemporaryFile(
+            "w", dir=cache_dir, suffix=".tmp", delete=False
+        ) as cache_stream:
+            try:
+                json.dump(_dump_nodes(documents), cache_stream)
+            except BaseException:
+                os.unlink(cache_stream.name)
+                raise
+        os.replace(cache_stream.name, cache_path)
+    except (OSError, TypeError, RecursionError) as err:
+        _logger.warning("failed to cache configuration in %r: %s", cache_dir, err)
+    return documents
 
 
 def yaml_constructor(
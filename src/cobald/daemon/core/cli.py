@@ -2,6 +2,13 @@ import argparse
 
 CLI = argparse.ArgumentParser(description="COBalD - the Opportunistic Balancing Daemon")
 CLI.add_argument("CONFIGURATION", help="path of the configuration to use", type=str)
+CLI.add_argument(
+    "--config-cache",
+    help="directory to cache parsed YAML configurations in, for faster restarts;"
+    " anyone who can write to it controls the configuration of the daemon",
+    default=None,
+    metavar="DIRECTORY",
+)
 CLI_LOG = CLI.add_argument_group("Startup Logging")
 CLI_LOG.add_argument(
     "--log-level",
@@ -20,3 +27,9 @@ CLI_LOG.add_argument(
     help="use short formatting suitable for journals",
     action="store_true",
 )
+CLI_TEST = CLI.add_argument_group("Testing")
+CLI_TEST.add_argument(
+    "--virtual-time",
+    help="run in virtual time that skips ahead whenever all services are idle",
+    action="store_true",
+)
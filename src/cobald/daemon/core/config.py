@@ -1,9 +1,11 @@
+import functools
 import os
+import sys
 from contextlib import contextmanager
-from typing import Type, Tuple, Dict, Set
+from typing import Callable, Type, Tuple, Dict, Optional, Set
 
-from yaml import SafeLoader, BaseLoader
-from entrypoints import get_group_all as get_entrypoints
+from yaml import SafeLoader, BaseLoader, nodes
+from entrypoints import get_group_all as get_entrypoints, EntryPoint
 from toposort import toposort_flatten
 
 from ..plugins import constraints as plugin_constraints, YAMLTagSettings
@@ -15,47 +17,118 @@ from ..config.python import load_configuration as load_python_configuration
 from ..config.mapping import Translator, SectionPlugin
 from ...interfaces._partial import Partial
 
+try:  # prefer the libyaml parser if PyYAML was built with it
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover
+    _SafeLoader = SafeLoader  # type: ignore
 
-class COBalDLoader(SafeLoader):
-    """Loader with access to COBalD configuration constructors"""
 
+class COBalDLoader(_SafeLoader):  # type: ignore
+    """
+    Loader with access to COBalD configuration constructors
 
-def add_constructor_plugins(entry_point_group: str, loader: Type[BaseLoader]) -> None:
+    This uses the fast ``libyaml`` parser if available,
+    and the pure Python parser otherwise.
+    Both use the same resolvers and constructors as :py:class:`yaml.SafeLoader`.
     """
-    Add PyYAML constructors from an entry point group to a loader
 
-    :param loader: the PyYAML loader which uses the plugins
-    :param entry_point_group: entry point group to search
 
-    .. note::
+def _installed_distributions() -> Tuple[str, ...]:
+    """
+    Metadata of the distributions installed on :py:data:`sys.path`
 
-        This directly modifies the ``loader`` by
-        calling :py:meth:`~.BaseLoader.add_constructor`.
+    Installing, upgrading or removing a distribution adds or removes its
+    versioned ``*.dist-info`` or ``*.egg-info`` metadata, which changes
+    the result.
+    """
+    distributions = []
+    for path in sys.path:
+        try:
+            entries = os.listdir(path or ".")
+        except OSError:  # not a directory, e.g. a zip archive or missing
+            distributions.append(path)
+            continue
+        distributions.extend(
+            os.path.join(path, entry)
+            for entry in sorted(entries)
+            if entry.endswith((".dist-info", ".egg-info"))
+        )
+    return tuple(distributions)
+
+
+class LazyConstructor(object):
+    """
+    PyYAML constructor for a plugin that is only loaded when first used
+
+    :param entry_point: entry point of the plugin
+
+    The plugin is imported and converted via :py:func:`~.yaml_constructor`
+    the first time a YAML document uses its tag.
     """
+
+    __slots__ = ("entry_point", "_constructor")
+
+    def __init__(self, entry_point: EntryPoint):
+        self.entry_point = entry_point
+        self._constructor = None  # type: Optional[Callable]
+
+    def __call__(self, loader: BaseLoader, node: nodes.Node):
+        if self._constructor is None:
+            plugin = self.entry_point.load()
+            try:
+                pipeline_factory = plugin.s
+            except AttributeError:
+                pipeline_factory = plugin
+            settings = YAMLTagSettings.fetch(pipeline_factory)
+            self._constructor = yaml_constructor(pipeline_factory, eager=settings.eager)
+        return self._constructor(loader, node)
+
+    def __repr__(self):
+        return "%s(%r)" % (self.__class__.__name__, self.entry_point)
+
+
+@functools.lru_cache(maxsize=16)
+def _constructor_plugins(
+    entry_point_group: str, distributions: Tuple[str, ...]
+) -> Tuple[Tuple[str, LazyConstructor]]:
+    """Find the tags and lazy constructors in an entry point group"""
+    plugins = []
     for entry in get_entrypoints(entry_point_group):
         if entry.name[0] == "!":
             raise RuntimeError(
                 "plugin name %r in entry point group %r may not start with '!'"
                 % (entry.name, entry_point_group)
             )
-        try:
-            pipeline_factory = entry.load().s
-        except AttributeError:
-            pipeline_factory = entry.load()
-        settings = YAMLTagSettings.fetch(pipeline_factory)
-        loader.add_constructor(
-            tag="!" + entry.name,
-            constructor=yaml_constructor(pipeline_factory, eager=settings.eager),
-        )
+        plugins.append(("!" + entry.name, LazyConstructor(entry)))
+    return tuple(plugins)
 
 
-def load_section_plugins(entry_point_group: str) -> Tuple[SectionPlugin]:
+def add_constructor_plugins(entry_point_group: str, loader: Type[BaseLoader]) -> None:
     """
-    Load configuration plugins from an entry point group
+    Add PyYAML constructors from an entry point group to a loader
 
+    :param loader: the PyYAML loader which uses the plugins
     :param entry_point_group: entry point group to search
-    :return: all loaded plugins
+
+    .. note::
+
+        This directly modifies the ``loader`` by
+        calling :py:meth:`~.BaseLoader.add_constructor`.
+
+    Each plugin is only imported once its tag is used.
+    The plugins found in an entry point group are cached
+    until distributions are installed, upgraded or removed.
     """
+    for tag, constructor in _constructor_plugins(
+        entry_point_group, _installed_distributions()
+    ):
+        loader.add_constructor(tag=tag, constructor=constructor)
+
+
+@functools.lru_cache(maxsize=16)
+def _section_plugins(
+    entry_point_group: str, distributions: Tuple[str, ...]
+) -> Tuple[SectionPlugin]:
     plugins: Dict[str, SectionPlugin] = {
         plugin.section: plugin
         for plugin in map(SectionPlugin.load, get_entrypoints(entry_point_group))
@@ -73,12 +146,25 @@ def load_section_plugins(entry_point_group: str) -> Tuple[SectionPlugin]:
     )
 
 
+def load_section_plugins(entry_point_group: str) -> Tuple[SectionPlugin]:
+    """
+    Load configuration plugins from an entry point group
+
+    :param entry_point_group: entry point group to search
+    :return: all loaded plugins
+
+    The plugins are cached until distributions are installed, upgraded or removed.
+    """
+    return _section_plugins(entry_point_group, _installed_distributions())
+
+
 @contextmanager
-def load(config_path: str):
+def load(config_path: str, cache_dir: Optional[str] = None):
     """
     Load a configuration and keep it alive for the given context
 
     :param config_path: path to a configuration file
+    :param cache_dir: directory to cache parsed YAML configurations in
     """
     # we bind the config to c to keep it alive
     if os.path.splitext(config_path)[1] in (".yaml", ".yml"):
@@ -90,6 +176,7 @@ def load(config_path: str):
             config_path,
             loader=COBalDLoader,  # type: ignore
             plugins=config_plugins,
+            cache_dir=cache_dir,
         )
     elif os.path.splitext(config_path)[1] == ".py":
         c = load_python_configuration(config_path)
@@ -4,17 +4,29 @@ Daemon core specific to cobald
 import sys
 import logging
 import platform
+from typing import Optional
 
 import cobald.__about__
 
-from .logger import initialise_logging
 from .cli import CLI
-from .config import load
-from .. import runtime
 
 
-def run(configuration: str, level: str, target: str, short_format: bool):
+def run(
+    configuration: str,
+    level: str,
+    target: str,
+    short_format: bool,
+    virtual_time: bool = False,
+    config_cache: Optional[str] = None,
+):
     """Run the daemon and all its services"""
+    # the runtime and configuration machinery are only imported when needed,
+    # so that parsing the command line stays fast
+    from .logger import initialise_logging
+    from .config import load
+    from .. import runtime
+    from ..runners.virtual_time import VirtualClock
+
     initialise_logging(level=level, target=target, short_format=short_format)
     logger = logging.getLogger(__package__)
     logger.info("COBalD %s", cobald.__about__.__version__)
@@ -27,9 +39,11 @@ def run(configuration: str, level: str, target: str, short_format: bool):
     )
     logger.debug(cobald.__about__.__file__)
     logger.info("Using configuration %s", configuration)
-    with load(configuration):
+    with load(configuration, cache_dir=config_cache):
         logger.info("Starting daemon services...")
-        runtime.accept()
+        if virtual_time:
+            logger.warning("Running in virtual time")
+        runtime.accept(clock=VirtualClock() if virtual_time else None)
 
 
 def cli_run():
@@ -40,4 +54,6 @@ def cli_run():
         level=options.log_level,
         target=options.log_target,
         short_format=options.log_journal,
+        virtual_time=options.virtual_time,
+        config_cache=options.config_cache,
     )
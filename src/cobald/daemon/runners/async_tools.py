@@ -1,4 +1,9 @@
-import threading
+import asyncio
+import sys
+from concurrent.futures import Future
+
+import trio
+
 from .base_runner import OrphanedReturn
 
 
@@ -9,33 +14,76 @@ async def raise_return(payload):
         raise OrphanedReturn(payload, value)
 
 
-class AsyncExecution(object):
-    def __init__(self, payload):
-        self.payload = payload
-        self._result = None
-        self._done = threading.Event()
-        self._done.clear()
+def _in_asyncio() -> bool:
+    """Whether the current thread runs an :py:mod:`asyncio` event loop"""
+    if sys.version_info < (3, 7):  # asyncio.get_running_loop is new in Python 3.7
+        return asyncio._get_running_loop() is not None
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
 
-    # explicit coroutine for libraries that type check
-    async def coroutine(self):
-        await self
+class PayloadFuture(Future):
+    """
+    Future for the output of a payload, which is available to any flavour
+
+    In addition to blocking on :py:meth:`~concurrent.futures.Future.result`,
+    the future may be awaited in :py:mod:`trio` and :py:mod:`asyncio` coroutines
+    without blocking their event loop.
+    Cancelling the awaiting coroutine does not cancel the payload.
+    """
 
     def __await__(self):
+        return self._await_result().__await__()
+
+    async def _await_result(self):
+        if _in_asyncio():
+            return await asyncio.wrap_future(self)
         try:
-            value = yield from self.payload().__await__()
-        except Exception as err:
-            self._result = None, err
-        else:
-            self._result = value, None
-        self._done.set()
-
-    def wait(self):
-        self._done.wait()
-        value, exception = self._result
-        if exception is None:
-            return value
-        else:
-            raise exception
-
-    def __repr__(self):
-        return "%s(%s)" % (self.__class__.__name__, self.payload)
+            token = trio.lowlevel.current_trio_token()
+        except RuntimeError:
+            raise RuntimeError(
+                "%s can only be awaited by trio or asyncio" % self.__class__.__name__
+            ) from None
+        done = trio.Event()
+
+        def notify(future):
+            try:
+                token.run_sync_soon(done.set)
+            except trio.RunFinishedError:
+                pass
+
+        self.add_done_callback(notify)
+        await done.wait()
+        return self.result()
+
+
+def call_into(future: Future, payload):
+    """Run a subroutine ``payload``, storing its output in ``future``"""
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        value = payload()
+    except BaseException as err:
+        future.set_exception(err)
+        if not isinstance(err, Exception):
+            raise
+    else:
+        future.set_result(value)
+
+
+async def await_into(future: Future, payload):
+    """Run a coroutine ``payload``, storing its output in ``future``"""
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        value = await payload()
+    except BaseException as err:
+        future.set_exception(err)
+        # propagate cancellation and similar signals to the runner
+        if not isinstance(err, Exception):
+            raise
+    else:
+        future.set_result(value)
@@ -1,69 +1,98 @@
+from typing import Optional
 import asyncio
 from functools import partial
 
 from .base_runner import BaseRunner
-from .async_tools import raise_return, AsyncExecution
+from .async_tools import raise_return, await_into, PayloadFuture
+from .virtual_time import VirtualClock
 
 
 class AsyncioRunner(BaseRunner):
-    """Runner for coroutines with :py:mod:`asyncio`"""
+    """
+    Runner for coroutines with :py:mod:`asyncio`
+
+    :param clock: virtual time to run payloads in instead of real time
+    """
 
     flavour = asyncio
 
-    def __init__(self):
-        super().__init__()
-        self.event_loop = asyncio.new_event_loop()
+    def __init__(self, clock: Optional[VirtualClock] = None):
+        super().__init__(clock=clock)
+        self.event_loop = (
+            asyncio.new_event_loop() if clock is None else clock.asyncio_loop()
+        )
         self._tasks = set()
+        self._failed_tasks = []
+        #: signal that a payload failed or the runner should stop
+        self._wakeup = None  # type: Optional[asyncio.Event]
 
     def register_payload(self, payload):
         super().register_payload(partial(raise_return, payload))
 
     def run_payload(self, payload):
-        execution = AsyncExecution(payload)
-        super().register_payload(execution.coroutine)
-        return execution.wait()
+        return self.submit(payload).result()
+
+    def submit(self, payload) -> PayloadFuture:
+        future = PayloadFuture()
+        super().register_payload(partial(await_into, future, payload))
+        return future
 
     def _run(self):
         asyncio.set_event_loop(self.event_loop)
         self.event_loop.run_until_complete(self._run_payloads())
 
+    def _notify(self):
+        try:
+            self.event_loop.call_soon_threadsafe(self._dispatch)
+        except RuntimeError:  # the event loop is closed
+            pass
+
+    def _dispatch(self):
+        """Start queued payloads or wake up the runner to stop"""
+        if self.running.is_set():
+            self._start_payloads()
+        elif self._wakeup is not None:
+            self._wakeup.set()
+
     async def _run_payloads(self):
         """Async component of _run"""
-        delay = 0.0
+        self._wakeup = asyncio.Event()
         try:
+            self._start_payloads()
             while self.running.is_set():
-                await self._start_payloads()
-                await self._reap_payloads()
-                await asyncio.sleep(delay)
-                delay = min(delay + 0.1, 1.0)
-        except Exception:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                for task in self._failed_tasks:
+                    raise task.exception()
+        finally:
             await self._cancel_payloads()
-            raise
+            self._wakeup = None
 
-    async def _start_payloads(self):
+    def _start_payloads(self):
         """Start all queued payloads"""
         with self._lock:
-            for coroutine in self._payloads:
-                task = self.event_loop.create_task(coroutine())
-                self._tasks.add(task)
+            payloads = self._payloads.copy()
             self._payloads.clear()
-        await asyncio.sleep(0)
+        for coroutine in payloads:
+            task = self.event_loop.create_task(coroutine())
+            task.add_done_callback(self._reap_payload)
+            self._tasks.add(task)
 
-    async def _reap_payloads(self):
-        """Clean up all finished payloads"""
-        for task in self._tasks.copy():
-            if task.done():
-                self._tasks.remove(task)
-                if task.exception() is not None:
-                    raise task.exception()
-        await asyncio.sleep(0)
+    def _reap_payload(self, task: asyncio.Task):
+        """Clean up a finished payload"""
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self._failed_tasks.append(task)
+            # payloads may still fail while they are cancelled on shutdown
+            if self._wakeup is not None:
+                self._wakeup.set()
 
     async def _cancel_payloads(self):
         """Cancel all remaining payloads"""
-        for task in self._tasks:
+        for task in self._tasks.copy():
             task.cancel()
             await asyncio.sleep(0)
-        for task in self._tasks:
+        for task in self._tasks.copy():
             while not task.done():
                 await asyncio.sleep(0.1)
                 task.cancel()
@@ -71,11 +100,8 @@ class AsyncioRunner(BaseRunner):
     def stop(self):
         if not self.running.wait(0.2):
             return
-        self._logger.debug("runner disabled: %s", self)
-        with self._lock:
-            self.running.clear()
-            for task in self._tasks:
-                task.cancel()
-        self._stopped.wait()
-        self.event_loop.stop()
+        super().stop()
+        self.event_loop.close()
+
+    def close(self):
         self.event_loop.close()
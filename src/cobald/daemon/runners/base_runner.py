@@ -1,14 +1,25 @@
 import logging
 import threading
-from typing import Any
+from typing import Any, Optional, TYPE_CHECKING
 
 from cobald.daemon.debug import NameRepr
 
+if TYPE_CHECKING:
+    from .async_tools import PayloadFuture
+    from .virtual_time import VirtualClock
+
 
 class BaseRunner(object):
+    """
+    Runner for payloads of a specific flavour
+
+    :param clock: virtual time to run payloads in, if supported by the flavour
+    """
+
     flavour = None  # type: Any
 
-    def __init__(self):
+    def __init__(self, clock: "Optional[VirtualClock]" = None):
+        self.clock = clock
         self._logger = logging.getLogger(
             "cobald.runtime.runner.%s" % NameRepr(self.flavour)
         )
@@ -34,6 +45,7 @@ class BaseRunner(object):
         """
         with self._lock:
             self._payloads.append(payload)
+        self._notify()
 
     def run_payload(self, payload):
         """
@@ -44,6 +56,15 @@ class BaseRunner(object):
         """
         raise NotImplementedError
 
+    def submit(self, payload) -> "PayloadFuture":
+        """
+        Register ``payload`` for asynchronous execution with a result
+
+        This runs ``payload`` as soon as possible, without blocking.
+        Should ``payload`` return or raise anything, it is stored in the future.
+        """
+        raise NotImplementedError
+
     def run(self):
         """
         Execute all current and future payloads
@@ -73,6 +94,13 @@ class BaseRunner(object):
     def _run(self):
         raise NotImplementedError
 
+    def _notify(self):
+        """
+        Notify the runner that payloads are queued or that it should stop
+
+        This may be called from any thread, and before or after the runner runs.
+        """
+
     def stop(self):
         """Stop execution of all current and future payloads"""
         if not self.running.wait(0.2):
@@ -80,8 +108,12 @@ class BaseRunner(object):
         self._logger.debug("runner disabled: %s", self)
         with self._lock:
             self.running.clear()
+        self._notify()
         self._stopped.wait()
 
+    def close(self):
+        """Release any resources of a runner that does not run anymore"""
+
 
 class OrphanedReturn(Exception):
     """A runnable returned a value without anyone to receive it"""
@@ -1,3 +1,4 @@
+from typing import Optional, Type
 import logging
 import threading
 import trio
@@ -5,10 +6,12 @@ import trio
 from types import ModuleType
 
 from .base_runner import BaseRunner
+from .async_tools import PayloadFuture
 from .trio_runner import TrioRunner
 from .asyncio_runner import AsyncioRunner
 from .thread_runner import ThreadRunner
 from .asyncio_watcher import asyncio_main_run
+from .virtual_time import VirtualClock
 
 
 from cobald.daemon.debug import NameRepr
@@ -17,21 +20,45 @@ from cobald.daemon.debug import NameRepr
 class MetaRunner(object):
     """
     Unified interface to schedule subroutines and coroutines for concurrent execution
+
+    :param clock: virtual time to run payloads in instead of real time
+
+    The runner of each flavour is only created once a payload of its flavour
+    is scheduled. Flavours without payloads never start an event loop or thread.
     """
 
     runner_types = (TrioRunner, AsyncioRunner, ThreadRunner)
 
-    def __init__(self):
+    def __init__(self, clock: Optional[VirtualClock] = None):
         self._logger = logging.getLogger("cobald.runtime.runner.meta")
-        self.runners = {
-            runner.flavour: runner() for runner in self.runner_types
-        }  # type: dict[ModuleType, BaseRunner]
+        self.clock = clock
+        self._runner_types = {
+            runner.flavour: runner for runner in self.runner_types
+        }  # type: dict[ModuleType, Type[BaseRunner]]
+        #: runners of all flavours used so far
+        self.runners = {}  # type: dict[ModuleType, BaseRunner]
         self._lock = threading.Lock()
         self.running = threading.Event()
         self.running.clear()
 
     def __bool__(self):
-        return any(bool(runner) for runner in self.runners.values())
+        return any(bool(runner) for runner in list(self.runners.values()))
+
+    def _runner(self, flavour: ModuleType) -> BaseRunner:
+        """Get the runner for ``flavour``, creating and starting it if needed"""
+        try:
+            return self.runners[flavour]
+        except KeyError:
+            pass
+        with self._lock:
+            if flavour not in self.runners:
+                self._logger.debug("creating runner for %s", NameRepr(flavour))
+                runner = self.runners[flavour] = self._runner_types[flavour](
+                    clock=self.clock
+                )
+                if self.running.is_set() and flavour is not threading:
+                    self.runners[threading].register_payload(runner.run)
+            return self.runners[flavour]
 
     def register_payload(self, *payloads, flavour: ModuleType):
         """Queue one or more payload for execution after its runner is started"""
@@ -39,23 +66,27 @@ class MetaRunner(object):
             self._logger.debug(
                 "registering payload %s (%s)", NameRepr(payload), NameRepr(flavour)
             )
-            self.runners[flavour].register_payload(payload)
+            self._runner(flavour).register_payload(payload)
 
     def run_payload(self, payload, *, flavour: ModuleType):
         """Execute one payload after its runner is started and return its output"""
-        return self.runners[flavour].run_payload(payload)
+        return self._runner(flavour).run_payload(payload)
+
+    def submit(self, payload, *, flavour: ModuleType) -> PayloadFuture:
+        """Execute one payload after its runner is started and provide its output"""
+        return self._runner(flavour).submit(payload)
 
     def run(self):
         """Run all runners, blocking until completion or error"""
         self._logger.info("starting all runners")
         try:
+            thread_runner = self._runner(threading)
             with self._lock:
                 assert not self.running.set(), "cannot re-run: %s" % self
                 self.running.set()
-            thread_runner = self.runners[threading]
-            for runner in self.runners.values():
-                if runner is not thread_runner:
-                    thread_runner.register_payload(runner.run)
+                for runner in self.runners.values():
+                    if runner is not thread_runner:
+                        thread_runner.register_payload(runner.run)
             if threading.current_thread() == threading.main_thread():
                 asyncio_main_run(root_runner=thread_runner)
             else:
@@ -74,12 +105,23 @@ class MetaRunner(object):
         """Stop all runners"""
         self._stop_runners()
 
+    def close(self):
+        """Release the resources of all runners, which must not run anymore"""
+        with self._lock:
+            runners = list(self.runners.values())
+        for runner in runners:
+            runner.close()
+
     def _stop_runners(self):
-        for runner in self.runners.values():
+        with self._lock:
+            runners = list(self.runners.values())
+        for runner in runners:
             if runner.flavour == threading:
                 continue
             runner.stop()
-        self.runners[threading].stop()
+        for runner in runners:
+            if runner.flavour == threading:
+                runner.stop()
 
 
 if __name__ == "__main__":
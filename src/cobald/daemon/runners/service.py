@@ -1,14 +1,18 @@
-from typing import TypeVar, Set
+from typing import TypeVar, Set, Callable, Optional
+from collections import deque
 import logging
 import weakref
 import trio
 import gc
 import functools
 import threading
+import warnings
 
 from types import ModuleType
 
 from .meta_runner import MetaRunner
+from .virtual_time import VirtualClock
+from .async_tools import PayloadFuture
 from .guard import exclusive
 from ..debug import NameRepr
 
@@ -35,6 +39,8 @@ class ServiceUnit(object):
     """
 
     __active_units__ = weakref.WeakSet()  # type: weakref.WeakSet[ServiceUnit]
+    #: callback notified of every new unit, used by an accepting ServiceRunner
+    __unit_listener__ = None  # type: Optional[Callable[[ServiceUnit], None]]
 
     def __init__(self, service, flavour):
         assert hasattr(service, "run"), "service must implement a 'run' method"
@@ -48,6 +54,12 @@ class ServiceUnit(object):
         self._started = False
         ServiceUnit.__active_units__.add(self)
 
+    def _announce(self):
+        """Notify an accepting runner that this unit is ready to start"""
+        listener = ServiceUnit.__unit_listener__
+        if listener is not None:
+            listener(self)
+
     @classmethod
     def units(cls) -> "Set[ServiceUnit]":
         """Container of all currently defined units"""
@@ -89,6 +101,7 @@ def service(flavour):
 
     def service_unit_decorator(raw_cls):
         __new__ = raw_cls.__new__
+        __init__ = raw_cls.__init__
 
         def __new_service__(cls, *args, **kwargs):
             if __new__ is object.__new__:
@@ -97,9 +110,20 @@ def service(flavour):
                 self = __new__(cls, *args, **kwargs)
             service_unit = ServiceUnit(self, flavour)
             self.__service_unit__ = service_unit
+            # subclasses with their own __init__ may not be ready after ours
+            if cls.__init__ is not __init_service__:
+                service_unit._announce()
             return self
 
+        @functools.wraps(__init__)
+        def __init_service__(self, *args, **kwargs):
+            __init__(self, *args, **kwargs)
+            # only announce fully initialised services to avoid running them early
+            if type(self).__init__ is __init_service__:
+                self.__service_unit__._announce()
+
         raw_cls.__new__ = __new_service__
+        raw_cls.__init__ = __init_service__
         if raw_cls.run.__doc__ is None:
             raw_cls.run.__doc__ = "Service entry point"
         return raw_cls
@@ -110,15 +134,32 @@ def service(flavour):
 class ServiceRunner(object):
     """
     Runner for coroutines, subroutines and services
+
+    :param accept_delay: deprecated and unused,
+                         services are adopted as soon as they are created
+
+    .. deprecated:: 0.12.4
+        Services are adopted when created, without polling every ``accept_delay``.
     """
 
-    def __init__(self, accept_delay: float = 1):
+    def __init__(self, accept_delay: Optional[float] = None):
+        if accept_delay is not None:
+            warnings.warn(
+                "ServiceRunner 'accept_delay' is deprecated and has no effect",
+                DeprecationWarning,
+                stacklevel=2,
+            )
         self._logger = logging.getLogger("cobald.runtime.daemon.services")
         self._meta_runner = MetaRunner()
         self._must_shutdown = False
         self._is_shutdown = threading.Event()
         self.running = threading.Event()
         self.accept_delay = accept_delay
+        #: token to reach the accept loop from other threads while it runs
+        self._trio_token = None  # type: Optional[trio.lowlevel.TrioToken]
+        #: signal that new units are queued or the accept loop should stop
+        self._wakeup = None  # type: Optional[trio.Event]
+        self._queued_units = deque()
 
     def execute(self, payload, *args, flavour: ModuleType, **kwargs):
         """
@@ -131,6 +172,19 @@ class ServiceRunner(object):
             payload = functools.partial(payload, *args, **kwargs)
         return self._meta_runner.run_payload(payload, flavour=flavour)
 
+    def submit(self, payload, *args, flavour: ModuleType, **kwargs) -> PayloadFuture:
+        """
+        Concurrently run ``payload`` and provide a future for its output
+
+        If ``*args*`` and/or ``**kwargs`` are provided, pass them to ``payload``
+        upon execution.
+        The future can be awaited by coroutines of any flavour without blocking
+        their event loop, or used to block the current thread for the output.
+        """
+        if args or kwargs:
+            payload = functools.partial(payload, *args, **kwargs)
+        return self._meta_runner.submit(payload, flavour=flavour)
+
     def adopt(self, payload, *args, flavour: ModuleType, **kwargs):
         """
         Concurrently run ``payload`` in the background
@@ -143,15 +197,21 @@ class ServiceRunner(object):
         self._meta_runner.register_payload(payload, flavour=flavour)
 
     @exclusive()
-    def accept(self):
+    def accept(self, clock: Optional[VirtualClock] = None):
         """
         Start accepting synchronous, asynchronous and service payloads
 
+        :param clock: virtual time to run payloads in instead of real time
+
         Since services are globally defined, only one :py:class:`ServiceRunner`
         may :py:meth:`accept` payloads at any time.
         """
         if self._meta_runner:
             raise RuntimeError("payloads scheduled for %s before being started" % self)
+        if clock is not None or self._meta_runner.clock is not None:
+            # runners created for the previous clock may hold an event loop
+            self._meta_runner.close()
+            self._meta_runner = MetaRunner(clock=clock)
         self._must_shutdown = False
         self._logger.info("%s starting", self.__class__.__name__)
         # force collecting objects so that defunct,
@@ -164,31 +224,64 @@ class ServiceRunner(object):
     def shutdown(self):
         """Shutdown the accept loop and stop running payloads"""
         self._must_shutdown = True
+        self._notify()
         self._is_shutdown.wait()
         self._meta_runner.stop()
 
+    def _queue_unit(self, unit: ServiceUnit):
+        """Queue a new ``unit`` for adoption, from any thread"""
+        self._queued_units.append(unit)
+        self._notify()
+
+    def _notify(self):
+        """Wake up the accept loop, from any thread"""
+        token = self._trio_token
+        if token is not None:
+            try:
+                token.run_sync_soon(self._wake)
+            except trio.RunFinishedError:
+                pass
+
+    def _wake(self):
+        if self._wakeup is not None:
+            self._wakeup.set()
+
     async def _accept_services(self):
-        delay, max_delay, increase = 0.0, self.accept_delay, self.accept_delay / 10
         self._is_shutdown.clear()
         self.running.set()
+        self._trio_token = trio.lowlevel.current_trio_token()
+        ServiceUnit.__unit_listener__ = self._queue_unit
         try:
             self._logger.info("%s started", self.__class__.__name__)
+            # adopt units created before we were notified about new ones
+            self._adopt_services()
             while not self._must_shutdown:
-                self._adopt_services()
-                await trio.sleep(delay)
-                delay = min(delay + increase, max_delay)
+                self._wakeup = trio.Event()
+                self._adopt_queued_services()
+                await self._wakeup.wait()
         except Exception:
             self._logger.exception("%s aborted", self.__class__.__name__)
             raise
         else:
             self._logger.info("%s stopped", self.__class__.__name__)
         finally:
+            if ServiceUnit.__unit_listener__ == self._queue_unit:
+                ServiceUnit.__unit_listener__ = None
+            self._queued_units.clear()
+            self._trio_token = self._wakeup = None
             self.running.clear()
             self._is_shutdown.set()
 
     def _adopt_services(self):
         for unit in ServiceUnit.units():  # type: ServiceUnit
-            if unit.running:
-                continue
-            self._logger.info("%s adopts %s", self.__class__.__name__, NameRepr(unit))
-            unit.start(self._meta_runner)
+            self._adopt_service(unit)
+
+    def _adopt_queued_services(self):
+        while self._queued_units:
+            self._adopt_service(self._queued_units.popleft())
+
+    def _adopt_service(self, unit: ServiceUnit):
+        if unit.running:
+            return
+        self._logger.info("%s adopts %s", self.__class__.__name__, NameRepr(unit))
+        unit.start(self._meta_runner)
@@ -1,19 +1,28 @@
+from typing import Callable, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import threading
-import time
 
 from ..debug import NameRepr
 from .base_runner import BaseRunner, OrphanedReturn
+from .async_tools import PayloadFuture, call_into
+from .virtual_time import VirtualClock
 
 
 class CapturingThread(threading.Thread):
     """
     Daemonic threads that capture any return value or exception from their ``target``
+
+    :param on_exit: callback receiving the thread after its ``target`` is done
     """
 
-    def __init__(self, **kwargs):
+    def __init__(
+        self, *, on_exit: Optional[Callable[["CapturingThread"], None]] = None, **kwargs
+    ):
         super().__init__(**kwargs, daemon=True)
         self._exception = None
         self._name = str(NameRepr(self._target))
+        self._on_exit = on_exit
 
     def join(self, timeout=None):
         super().join(timeout=timeout)
@@ -35,16 +44,33 @@ class CapturingThread(threading.Thread):
             # Avoid a refcycle if the thread is running a function with
             # an argument that has a member that points to the thread.
             del self._target, self._args, self._kwargs
+            if self._on_exit is not None:
+                self._on_exit(self)
 
 
 class ThreadRunner(BaseRunner):
-    """Runner for subroutines with :py:mod:`threading`"""
+    r"""
+    Runner for subroutines with :py:mod:`threading`
+
+    :param max_workers: maximum number of threads for :py:meth:`submit`\ ted payloads
+    :param clock: ignored, threads always run in real time
+
+    Every payload registered for background execution receives a dedicated thread.
+    Short-lived payloads should be :py:meth:`submit`\ ted instead,
+    which executes them on a bounded pool of reusable threads.
+    """
 
     flavour = threading
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, max_workers: int = 16, clock: Optional[VirtualClock] = None):
+        super().__init__(clock=clock)
+        self.max_workers = max_workers
         self._threads = set()
+        #: threads whose payload is done and which must be reaped
+        self._exited_threads = deque()
+        #: signal that payloads are queued, threads exited or the runner should stop
+        self._wakeup = threading.Event()
+        self._executor = None  # type: Optional[ThreadPoolExecutor]
 
     def run_payload(self, payload):
         # - run_payload has to block until payload is done
@@ -52,13 +78,36 @@ class ThreadRunner(BaseRunner):
         # we just block this thread by running payload directly
         return payload()
 
+    def submit(self, payload) -> PayloadFuture:
+        """
+        Run a short-lived ``payload`` on a pool of worker threads
+
+        :return: future providing the output of ``payload``
+        """
+        future = PayloadFuture()
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="cobald.runtime.runner.threading",
+                )
+            self._executor.submit(call_into, future, payload)
+        return future
+
+    def _notify(self):
+        self._wakeup.set()
+
     def _run(self):
-        delay = 0.0
-        while self.running.is_set():
-            self._start_payloads()
-            self._reap_payloads()
-            time.sleep(delay)
-            delay = min(delay + 0.1, 1.0)
+        try:
+            while self.running.is_set():
+                self._wakeup.clear()
+                self._start_payloads()
+                self._reap_payloads()
+                self._wakeup.wait()
+        finally:
+            with self._lock:
+                if self._executor is not None:
+                    self._executor.shutdown(wait=False)
 
     def _start_payloads(self):
         """Start all queued payloads"""
@@ -66,16 +115,21 @@ class ThreadRunner(BaseRunner):
             payloads = self._payloads.copy()
             self._payloads.clear()
         for subroutine in payloads:
-            thread = CapturingThread(target=subroutine)
+            thread = CapturingThread(target=subroutine, on_exit=self._exit_payload)
             thread.start()
             self._threads.add(thread)
             self._logger.debug("booted thread %s", thread)
-        time.sleep(0)
+
+    def _exit_payload(self, thread: CapturingThread):
+        """Mark the payload ``thread`` as exited"""
+        self._exited_threads.append(thread)
+        self._wakeup.set()
 
     def _reap_payloads(self):
         """Clean up all finished payloads"""
-        for thread in self._threads.copy():
+        while self._exited_threads:
+            thread = self._exited_threads.popleft()
+            self._threads.discard(thread)
             # CapturingThread.join will throw
-            if thread.join(timeout=0):
-                self._threads.remove(thread)
-                self._logger.debug("reaped thread %s", thread)
+            thread.join()
+            self._logger.debug("reaped thread %s", thread)
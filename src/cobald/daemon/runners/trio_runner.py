@@ -1,42 +1,76 @@
+from typing import Optional
+
 import trio
 from functools import partial
 
 
 from .base_runner import BaseRunner
-from .async_tools import raise_return, AsyncExecution
+from .async_tools import raise_return, await_into, PayloadFuture
+from .virtual_time import VirtualClock
 
 
 class TrioRunner(BaseRunner):
-    """Runner for coroutines with :py:mod:`trio`"""
+    """
+    Runner for coroutines with :py:mod:`trio`
+
+    :param clock: virtual time to run payloads in instead of real time
+    """
 
     flavour = trio
 
-    def __init__(self):
+    def __init__(self, clock: Optional[VirtualClock] = None):
         self._nursery = None
-        super().__init__()
+        #: token to reach the event loop from other threads while it runs
+        self._trio_token = None  # type: Optional[trio.lowlevel.TrioToken]
+        #: signal that payloads are queued or the runner should stop
+        self._wakeup = None  # type: Optional[trio.Event]
+        super().__init__(clock=clock)
 
     def register_payload(self, payload):
         super().register_payload(partial(raise_return, payload))
 
     def run_payload(self, payload):
-        execution = AsyncExecution(payload)
-        super().register_payload(execution.coroutine)
-        return execution.wait()
+        return self.submit(payload).result()
+
+    def submit(self, payload) -> PayloadFuture:
+        future = PayloadFuture()
+        super().register_payload(partial(await_into, future, payload))
+        return future
 
     def _run(self):
+        if self.clock is not None:
+            return trio.run(self._await_all, clock=self.clock.trio_clock())
         return trio.run(self._await_all)
 
+    def _notify(self):
+        token = self._trio_token
+        if token is not None:
+            try:
+                token.run_sync_soon(self._wake)
+            except trio.RunFinishedError:
+                pass
+
+    def _wake(self):
+        """Wake up the payload loop from inside the event loop"""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
     async def _await_all(self):
         """Async component of _run"""
-        delay = 0.0
-        # we run a top-level nursery that automatically reaps/cancels for us
-        async with trio.open_nursery() as nursery:
-            while self.running.is_set():
-                await self._start_payloads(nursery=nursery)
-                await trio.sleep(delay)
-                delay = min(delay + 0.1, 1.0)
-            # cancel the scope to cancel all payloads
-            nursery.cancel_scope.cancel()
+        # payloads queued before this point are started by the first iteration,
+        # payloads queued after this point notify the loop to start them
+        self._trio_token = trio.lowlevel.current_trio_token()
+        try:
+            # we run a top-level nursery that automatically reaps/cancels for us
+            async with trio.open_nursery() as nursery:
+                while self.running.is_set():
+                    self._wakeup = trio.Event()
+                    await self._start_payloads(nursery=nursery)
+                    await self._wakeup.wait()
+                # cancel the scope to cancel all payloads
+                nursery.cancel_scope.cancel()
+        finally:
+            self._trio_token = self._wakeup = None
 
     async def _start_payloads(self, nursery):
         """Start all queued payloads"""
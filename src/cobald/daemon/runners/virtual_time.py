@@ -0,0 +1,127 @@
+"""
+Virtual time for running the daemon faster or slower than real time
+
+A :py:class:`VirtualClock` provides event loops whose time is decoupled from
+the time of the system. Each event loop keeps its own virtual time, which
+starts at zero when the loop is created.
+"""
+import asyncio
+import selectors
+import time
+
+import trio
+import trio.testing
+
+
+class VirtualTime(object):
+    """
+    Source of virtual time that advances with real time and via jumps
+
+    :param rate: virtual seconds that pass per real second
+    """
+
+    def __init__(self, rate: float = 0.0):
+        self.rate = rate
+        self._offset = 0.0
+        self._real_start = time.monotonic()
+
+    def time(self) -> float:
+        """The current virtual time"""
+        return self._offset + self.rate * (time.monotonic() - self._real_start)
+
+    def advance_to(self, when: float):
+        """Jump forward to the virtual time ``when``, unless it already passed"""
+        now = self.time()
+        if when > now:
+            self._offset += when - now
+
+
+class AutojumpSelector(selectors.DefaultSelector):
+    """
+    Selector that skips waiting by advancing virtual time
+
+    :param virtual_time: the virtual time to advance
+    :param autojump_threshold: real seconds to wait for I/O before advancing
+
+    When asked to wait for I/O with a timeout, the selector waits at most
+    ``autojump_threshold`` real seconds. If no I/O is ready in this time,
+    the ``virtual_time`` jumps to the end of the timeout instead.
+    """
+
+    def __init__(self, virtual_time: VirtualTime, autojump_threshold: float = 0.0):
+        super().__init__()
+        self.virtual_time = virtual_time
+        self.autojump_threshold = autojump_threshold
+
+    def select(self, timeout=None):
+        if timeout is None or timeout <= 0:
+            return super().select(timeout)
+        deadline = self.virtual_time.time() + timeout
+        ready = super().select(min(timeout, self.autojump_threshold))
+        if not ready:
+            self.virtual_time.advance_to(deadline)
+        return ready
+
+
+class VirtualTimeEventLoop(asyncio.SelectorEventLoop):
+    """
+    :py:mod:`asyncio` event loop running in virtual time
+
+    :param rate: virtual seconds that pass per real second
+    :param autojump_threshold: real seconds the loop must be idle before
+                               virtual time jumps to the next scheduled callback
+    """
+
+    def __init__(self, rate: float = 0.0, autojump_threshold: float = 0.0):
+        self.virtual_time = VirtualTime(rate=rate)
+        super().__init__(
+            selector=AutojumpSelector(
+                self.virtual_time, autojump_threshold=autojump_threshold
+            )
+        )
+
+    def time(self) -> float:
+        return self.virtual_time.time()
+
+
+class VirtualClock(object):
+    """
+    Virtual time for the event loops of the daemon runtime
+
+    :param rate: virtual seconds that pass per real second
+    :param autojump_threshold: real seconds an event loop must be idle before
+                               its virtual time jumps to the next deadline
+
+    With the defaults, virtual time only passes while event loops are idle
+    and then immediately jumps ahead. For example, ``await trio.sleep(3600)``
+    completes without any delay, as long as no other task is ready.
+
+    The ``trio`` runner uses a :py:class:`trio.testing.MockClock` and the
+    ``asyncio`` runner a :py:class:`VirtualTimeEventLoop`.
+    Each event loop jumps ahead on its own; as a result, the virtual times
+    of different flavours progress independently.
+    Payloads of the ``threading`` flavour always run in real time.
+    """
+
+    def __init__(self, rate: float = 0.0, autojump_threshold: float = 0.0):
+        self.rate = rate
+        self.autojump_threshold = autojump_threshold
+
+    def trio_clock(self) -> trio.abc.Clock:
+        """Create a clock for running a new ``trio`` event loop"""
+        return trio.testing.MockClock(
+            rate=self.rate, autojump_threshold=self.autojump_threshold
+        )
+
+    def asyncio_loop(self) -> asyncio.AbstractEventLoop:
+        """Create a new ``asyncio`` event loop"""
+        return VirtualTimeEventLoop(
+            rate=self.rate, autojump_threshold=self.autojump_threshold
+        )
+
+    def __repr__(self):
+        return "%s(rate=%r, autojump_threshold=%r)" % (
+            self.__class__.__name__,
+            self.rate,
+            self.autojump_threshold,
+        )
@@ -0,0 +1,167 @@
+"""
+Shared timer for periodically regulating many controllers
+
+Instead of running one timer per controller, any number of controllers may
+be registered with a :py:class:`TickScheduler`. The scheduler keeps all
+deadlines in a single queue and wakes up only when the next one is due.
+"""
+from typing import Dict, List, Optional, Union
+from typing_extensions import Protocol
+import heapq
+import itertools
+import math
+
+import trio
+
+from .runners.service import service
+
+
+class Regulated(Protocol):
+    """Any object adjusting itself on a periodic tick"""
+
+    def regulate(self, interval: float) -> None:
+        ...
+
+
+class Tick(object):
+    """
+    Registration of a :py:class:`Regulated` object in a :py:class:`TickScheduler`
+
+    :param regulated: the object whose ``regulate`` method to call
+    :param interval: the nominal interval between calls in seconds
+    """
+
+    __slots__ = ("regulated", "interval", "last", "active")
+
+    def __init__(self, regulated: Regulated, interval: float):
+        assert interval > 0, "interval must be positive"
+        self.regulated = regulated
+        self.interval = interval
+        #: the time of the previous tick, if any
+        self.last = None  # type: Optional[float]
+        self.active = True
+
+    def cancel(self):
+        """Stop ticking the ``regulated`` object"""
+        self.active = False
+
+    def __repr__(self):
+        return "%s(%r, interval=%r)" % (
+            self.__class__.__name__,
+            self.regulated,
+            self.interval,
+        )
+
+
+@service(flavour=trio)
+class TickScheduler(object):
+    """
+    Service calling ``regulate(interval)`` of many objects from a single task
+
+    :param align: whether ticks with the same interval happen at the same time
+
+    Every registered object is regulated every ``interval`` seconds, receiving
+    the actual time elapsed since its previous tick. Deadlines are derived from
+    the first deadline, not from the time a tick finished; a slow tick delays
+    subsequent ticks, but does not shift them permanently. If a tick is delayed
+    by more than its ``interval``, missed ticks are skipped.
+
+    If ``align`` is set, deadlines are multiples of the ``interval``
+    relative to the start of the scheduler. This batches the ticks of
+    all objects with the same or multiple intervals, such as the controller,
+    decorators and pools of a pipeline.
+    Otherwise, the first tick of an object is due one ``interval`` after
+    the scheduler picks it up.
+
+    Use :py:meth:`shared` to fetch a named instance shared by several objects.
+    """
+
+    _shared = {}  # type: Dict[str, TickScheduler]
+
+    def __init__(self, align: bool = True):
+        self.align = align
+        #: deadline, insertion order and registration of upcoming ticks
+        self._queue = []  # type: List[List]
+        #: registrations not yet scheduled
+        self._pending = []  # type: List[Tick]
+        self._counter = itertools.count()
+        self._epoch = None  # type: Optional[float]
+        self._wakeup = None  # type: Optional[trio.Event]
+
+    @classmethod
+    def shared(cls, name: str = "default") -> "TickScheduler":
+        """Get the scheduler named ``name``, creating it if needed"""
+        try:
+            return cls._shared[name]
+        except KeyError:
+            scheduler = cls._shared[name] = cls()
+            return scheduler
+
+    def register(self, regulated: Regulated, interval: float) -> Tick:
+        """
+        Periodically call ``regulated.regulate`` every ``interval`` seconds
+
+        :return: the registration, which can be used to ``cancel`` ticking
+
+        This method is not thread-safe, and must be called either before
+        the scheduler runs or from the ``trio`` event loop of the scheduler.
+        """
+        tick = Tick(regulated, interval)
+        self._pending.append(tick)
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return tick
+
+    async def run(self):
+        self._epoch = trio.current_time()
+        while True:
+            self._schedule_pending(trio.current_time())
+            self._run_due(trio.current_time())
+            self._wakeup = trio.Event()
+            if self._pending:
+                continue
+            deadline = self._queue[0][0] if self._queue else math.inf
+            with trio.move_on_at(deadline):
+                await self._wakeup.wait()
+
+    def _schedule_pending(self, now: float):
+        for tick in self._pending:
+            if self.align:
+                deadline = self._next_deadline(self._epoch, tick.interval, now)
+            else:
+                deadline = now + tick.interval
+            heapq.heappush(self._queue, [deadline, next(self._counter), tick])
+        self._pending.clear()
+
+    def _run_due(self, now: float):
+        queue = self._queue
+        while queue and queue[0][0] <= now:
+            deadline, _, tick = heapq.heappop(queue)
+            if not tick.active:
+                continue
+            # earlier ticks of the batch may have been slow, so use the actual time
+            current = trio.current_time()
+            elapsed = tick.interval if tick.last is None else current - tick.last
+            tick.last = current
+            tick.regulated.regulate(elapsed)
+            # a regulated object may cancel itself or the time may have jumped
+            if tick.active:
+                deadline = self._next_deadline(
+                    deadline, tick.interval, trio.current_time()
+                )
+                heapq.heappush(queue, [deadline, next(self._counter), tick])
+
+    @staticmethod
+    def _next_deadline(deadline: float, interval: float, now: float) -> float:
+        """Get the first deadline of a ``deadline + n * interval`` grid after ``now``"""
+        missed = max(math.floor((now - deadline) / interval), 0)
+        return deadline + (missed + 1) * interval
+
+
+def resolve_scheduler(
+    scheduler: Union[TickScheduler, str, None]
+) -> Optional[TickScheduler]:
+    """Get a :py:class:`TickScheduler` from an instance or name of a shared one"""
+    if isinstance(scheduler, str):
+        return TickScheduler.shared(scheduler)
+    return scheduler
@@ -0,0 +1,108 @@
+"""
+Adapters between :py:class:`~.Pool`\\ s and :py:class:`~.AsyncPool`\\ s
+
+Controllers and composites read the metrics of their pools synchronously
+on every tick. An :py:class:`~.AsyncPool` instead requires its metrics to be
+refreshed asynchronously, for example by querying a remote service.
+A :py:class:`SyncAdapter` bridges the two by periodically refreshing all
+:py:class:`~.AsyncPool`\\ s it decorates, in parallel and in the background.
+Conversely, an :py:class:`AsyncAdapter` allows a slow, blocking pool to be
+refreshed like an :py:class:`~.AsyncPool`.
+"""
+from typing import Optional
+
+import trio
+
+from cobald.interfaces import Pool, PoolDecorator, AsyncPool, PoolState, refresh_pool
+
+from cobald.daemon import service
+
+
+@service(flavour=trio)
+class SyncAdapter(PoolDecorator):
+    """
+    Periodically refresh all :py:class:`~.AsyncPool`\\ s of the ``target``
+
+    :param target: the pool to refresh, including all pools it contains
+    :param interval: interval in seconds between refreshing the ``target``
+    :param concurrency: maximum number of pools refreshed at the same time
+    :param timeout: maximum seconds to wait for the refresh of each pool
+
+    Metrics are provided as of the most recent refresh, which allows
+    regular controllers, decorators and composites to use the ``target``.
+    A refresh is started every ``interval`` seconds, but only after
+    the previous refresh has finished.
+    Pools which fail to refresh or exceed the ``timeout`` keep their
+    stale metrics until the next refresh.
+    """
+
+    def __init__(
+        self,
+        target: Pool,
+        interval: float = 5.0,
+        concurrency: int = 16,
+        timeout: Optional[float] = None,
+    ):
+        super().__init__(target=target)
+        self.interval = interval
+        self.concurrency = concurrency
+        self.timeout = timeout
+        #: number of pools that failed to refresh in the latest refresh
+        self.stale = 0
+        self._limiter = trio.CapacityLimiter(concurrency)
+
+    async def run(self):
+        while True:
+            async with trio.open_nursery() as nursery:
+                nursery.start_soon(trio.sleep, self.interval)
+                self.stale = await refresh_pool(
+                    self.target, self._limiter, self.timeout
+                )
+
+
+class AsyncAdapter(PoolDecorator, AsyncPool):
+    """
+    Provide the metrics of a blocking ``target`` as of its last refresh
+
+    :param target: the pool whose metrics are slow to read
+
+    Each :py:meth:`refresh` takes a :py:meth:`~.Pool.snapshot` of the ``target``
+    in a worker thread, without blocking the event loop.
+    If the refresh is cancelled, the snapshot is abandoned.
+    Until the first refresh, the metrics of the ``target`` are read directly.
+    Setting :py:attr:`demand` is applied to the ``target`` immediately.
+    """
+
+    @property
+    def demand(self):
+        return self.target.demand if self._state is None else self._state.demand
+
+    @demand.setter
+    def demand(self, value):
+        self.target.demand = value
+        if self._state is not None:
+            self._state = self._state._replace(demand=value)
+
+    @property
+    def supply(self):
+        return self.snapshot().supply
+
+    @property
+    def utilisation(self):
+        return self.snapshot().utilisation
+
+    @property
+    def allocation(self):
+        return self.snapshot().allocation
+
+    def __init__(self, target: Pool):
+        super().__init__(target=target)
+        self._state = None  # type: Optional[PoolState]
+
+    async def refresh(self):
+        self._state = await trio.to_thread.run_sync(
+            self.target.snapshot, cancellable=True
+        )
+
+    def snapshot(self) -> PoolState:
+        return self.target.snapshot() if self._state is None else self._state
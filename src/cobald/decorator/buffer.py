@@ -1,8 +1,11 @@
+from typing import Union
+
 import trio
 
 from cobald.interfaces import Pool, PoolDecorator
 
 from cobald.daemon import service
+from cobald.daemon.scheduler import TickScheduler, resolve_scheduler
 
 
 @service(flavour=trio)
@@ -12,6 +15,8 @@ class Buffer(PoolDecorator):
 
     :param target: the pool to which changes are applied
     :param window: interval after which changes are applied
+    :param scheduler: a :py:class:`~.TickScheduler` or the name of a shared one
+                      to apply changes, instead of a separate timer
 
     Any changes made to :py:attr:`demand` are stored internally.
     Every ``window`` seconds, the final demand is applied to ``target``.
@@ -19,13 +24,26 @@ class Buffer(PoolDecorator):
 
     demand = 0.0
 
-    def __init__(self, target: Pool, window: float = 10.0):
+    def __init__(
+        self,
+        target: Pool,
+        window: float = 10.0,
+        scheduler: Union[TickScheduler, str, None] = None,
+    ):
         super().__init__(target=target)
         self.window = window
+        self.scheduler = resolve_scheduler(scheduler)
         self.demand = target.demand
 
     async def run(self):
+        if self.scheduler is not None:
+            self.scheduler.register(self, self.window)
+            return
         while True:
-            if self.demand != self.target.demand:
-                self.target.demand = self.demand
+            self.regulate(self.window)
             await trio.sleep(self.window)
+
+    def regulate(self, interval):
+        """Apply the final demand to ``target``"""
+        if self.demand != self.target.demand:
+            self.target.demand = self.demand
@@ -0,0 +1,101 @@
+import math
+from typing import Optional
+
+import trio
+
+from cobald.interfaces import Pool, PoolDecorator
+
+from cobald.daemon import service
+
+
+@service(flavour=trio)
+class Coalescer(PoolDecorator):
+    """
+    Debounce bursts of changes to the demand of a pool
+
+    :param target: the pool to which changes are applied
+    :param window: seconds without changes after which a burst ends
+    :param leading: whether to apply the first change of a burst immediately
+    :param trailing: whether to apply the final change of a burst at its end
+    :param max_latency: maximum seconds a burst may delay a change,
+                        or :py:const:`None` to wait for a pause indefinitely
+
+    Setting :py:attr:`demand` to the value last applied to ``target`` is
+    suppressed. Any other change starts or extends a burst of changes,
+    which ends after ``window`` seconds without changes, or
+    ``max_latency`` seconds after it started.
+    Only the first and final demand of each burst is applied to ``target``,
+    depending on ``leading`` and ``trailing``.
+    Note that without ``trailing``, the final demand of a burst is discarded.
+
+    The counters :py:attr:`writes`, :py:attr:`suppressed` and :py:attr:`coalesced`
+    track how many changes were applied to ``target`` or avoided.
+    """
+
+    @property
+    def demand(self):
+        return self._demand
+
+    @demand.setter
+    def demand(self, value):
+        self._demand = value
+        if value == self._applied:
+            self.suppressed += 1
+            if self._pending:
+                self._pending = False
+                self.coalesced += 1
+            return
+        if self._pending:
+            self.coalesced += 1
+        if self.leading and not self._burst:
+            self._apply(value)
+        else:
+            self._pending = True
+        self._burst = True
+        self._changed.set()
+
+    def __init__(
+        self,
+        target: Pool,
+        window: float = 1.0,
+        leading: bool = False,
+        trailing: bool = True,
+        max_latency: Optional[float] = 10.0,
+    ):
+        super().__init__(target=target)
+        self.window = window
+        self.leading = leading
+        self.trailing = trailing
+        self.max_latency = max_latency
+        #: number of changes applied to ``target``
+        self.writes = 0
+        #: number of changes which did not alter the demand of ``target``
+        self.suppressed = 0
+        #: number of changes replaced by a later change of the same burst
+        self.coalesced = 0
+        self._demand = self._applied = target.demand
+        self._pending = False
+        self._burst = False
+        self._changed = trio.Event()
+
+    def _apply(self, value):
+        self.target.demand = self._applied = value
+        self.writes += 1
+
+    async def run(self):
+        while True:
+            await self._changed.wait()
+            max_latency = math.inf if self.max_latency is None else self.max_latency
+            deadline = trio.current_time() + max_latency
+            # extend the burst until there is a pause of ``window`` seconds
+            while self._changed.is_set():
+                self._changed = trio.Event()
+                with trio.move_on_at(min(trio.current_time() + self.window, deadline)):
+                    await self._changed.wait()
+            if self._pending:
+                if self.trailing:
+                    self._apply(self._demand)
+                else:
+                    self.coalesced += 1
+                self._pending = False
+            self._burst = False
@@ -87,19 +87,21 @@ class Logger(PoolDecorator):
 
     @demand.setter
     def demand(self, value):
-        self._logger.log(
-            self.level,
-            self.message,
-            {
-                "value": value,
-                "demand": self.target.demand,
-                "supply": self.target.supply,
-                "utilisation": self.target.utilisation,
-                "allocation": self.target.allocation,
-                "consumption": self.target.allocation,
-                "target": self.target,
-            },
-        )
+        if self._logger.isEnabledFor(self.level):
+            state = self.target.snapshot()
+            self._logger.log(
+                self.level,
+                self.message,
+                {
+                    "value": value,
+                    "demand": state.demand,
+                    "supply": state.supply,
+                    "utilisation": state.utilisation,
+                    "allocation": state.allocation,
+                    "consumption": state.allocation,
+                    "target": self.target,
+                },
+            )
         self.target.demand = value
 
     @property
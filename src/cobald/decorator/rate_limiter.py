@@ -0,0 +1,135 @@
+import math
+from typing import Optional
+
+import trio
+
+from cobald.interfaces import Pool, PoolDecorator
+from cobald.utility import enforce
+
+from cobald.daemon import service
+
+
+class _TokenBucket(object):
+    """Budget of ``rate`` tokens per second, of which up to ``capacity`` accumulate"""
+
+    __slots__ = ("rate", "capacity", "tokens", "_last")
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._last = None  # type: Optional[float]
+
+    def refill(self, now: float):
+        if self._last is not None and now > self._last:
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self._last) * self.rate
+            )
+        self._last = now
+
+    def delay(self, amount: float) -> float:
+        """Seconds until ``amount`` tokens are available"""
+        if amount <= self.tokens:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def take(self, amount: float):
+        self.tokens -= amount
+
+
+@service(flavour=trio)
+class RateLimiter(PoolDecorator):
+    """
+    Limit the rate at which changes of demand are applied to a pool
+
+    :param target: the pool to which changes are applied
+    :param rate: maximum changes per second applied to ``target``
+    :param delta: maximum change of demand per second applied to ``target``
+    :param burst: seconds of unused budget that may be accumulated
+
+    Changes to :py:attr:`demand` are applied to ``target`` as fast as a
+    token bucket budget for ``rate`` and ``delta`` allows.
+    Every change applied to ``target`` uses one write and the absolute
+    change of demand from the budget; without budget left, the change is
+    delayed until the budget refills, and intermediate changes are merged.
+    Large changes of demand are applied in steps of the accumulated
+    ``delta`` budget.
+
+    Either limit can be disabled by setting it to :py:const:`None`.
+    The ``burst`` allows for an initial burst of changes, and always permits
+    at least one write at a time.
+
+    The counters :py:attr:`writes` and :py:attr:`coalesced` track how many
+    changes were applied to ``target`` or replaced before being applied.
+    """
+
+    @property
+    def demand(self):
+        return self._demand
+
+    @demand.setter
+    def demand(self, value):
+        if self._demand != self._applied:
+            self.coalesced += 1
+        self._demand = value
+        self._changed.set()
+
+    def __init__(
+        self,
+        target: Pool,
+        rate: Optional[float] = 1.0,
+        delta: Optional[float] = None,
+        burst: float = 1.0,
+    ):
+        enforce(rate is None or rate > 0, ValueError("rate must be positive"))
+        enforce(delta is None or delta > 0, ValueError("delta must be positive"))
+        enforce(burst > 0, ValueError("burst must be positive"))
+        super().__init__(target=target)
+        self.rate = rate
+        self.delta = delta
+        self.burst = burst
+        #: number of changes applied to ``target``
+        self.writes = 0
+        #: number of changes replaced by a later change before being applied
+        self.coalesced = 0
+        self._write_budget = _TokenBucket(
+            rate if rate is not None else math.inf,
+            max(1.0, rate * burst) if rate is not None else math.inf,
+        )
+        self._delta_budget = _TokenBucket(
+            delta if delta is not None else math.inf,
+            delta * burst if delta is not None else math.inf,
+        )
+        self._demand = self._applied = target.demand
+        self._changed = trio.Event()
+
+    async def run(self):
+        write_budget, delta_budget = self._write_budget, self._delta_budget
+        while True:
+            if self._demand == self._applied:
+                await self._changed.wait()
+                self._changed = trio.Event()
+                continue
+            now = trio.current_time()
+            write_budget.refill(now)
+            delta_budget.refill(now)
+            change = abs(self._demand - self._applied)
+            delay = max(
+                write_budget.delay(1),
+                delta_budget.delay(min(change, delta_budget.capacity)),
+            )
+            if delay > 0:
+                await trio.sleep(delay)
+                continue
+            step = min(change, delta_budget.tokens)
+            write_budget.take(1)
+            delta_budget.take(step)
+            self._apply(
+                self._demand
+                if step == change
+                else self._applied + math.copysign(step, self._demand - self._applied)
+            )
+
+    def _apply(self, value):
+        self.target.demand = self._applied = value
+        self.writes += 1
@@ -23,12 +23,23 @@ any number of :py:class:`~.PoolDecorator` may proceed it.
     }
 
 """
+from ._async import AsyncPool, refresh_pool
 from ._composite import CompositePool
 from ._controller import Controller
-from ._pool import Pool
+from ._pool import Pool, PoolState
 from ._proxy import PoolDecorator
 from ._partial import Partial
 
 __all__ = [
-    cls.__name__ for cls in (Pool, PoolDecorator, Controller, CompositePool, Partial)
+    cls.__name__
+    for cls in (
+        Pool,
+        PoolState,
+        AsyncPool,
+        PoolDecorator,
+        Controller,
+        CompositePool,
+        Partial,
+        refresh_pool,
+    )
 ]
@@ -0,0 +1,87 @@
+import abc
+import logging
+import math
+from typing import Optional, TYPE_CHECKING
+
+from ._pool import Pool
+from ._proxy import PoolDecorator
+from ._composite import CompositePool
+
+if TYPE_CHECKING:
+    import trio
+
+
+_logger = logging.getLogger(__package__)
+
+
+class AsyncPool(Pool):
+    """
+    Individual provider for resources whose state is updated asynchronously
+
+    Pools backed by remote services should not block when reading their metrics.
+    Instead, an :py:class:`~.AsyncPool` updates its metrics in :py:meth:`refresh`,
+    and its properties provide the state of the most recent refresh.
+
+    A :py:class:`~cobald.decorator.adapter.SyncAdapter` periodically refreshes
+    all :py:class:`~.AsyncPool`\\ s it decorates.
+    """
+
+    @abc.abstractmethod
+    async def refresh(self) -> None:
+        """
+        Update the metrics of this pool, e.g. by querying a remote service
+
+        A refresh may be cancelled or fail at any point. It should replace
+        the previous metrics only once all new metrics are available,
+        so that the pool otherwise keeps providing its previous metrics.
+        """
+        raise NotImplementedError
+
+
+async def refresh_pool(
+    pool: Pool,
+    limiter: "Optional[trio.CapacityLimiter]" = None,
+    timeout: Optional[float] = None,
+) -> int:
+    """
+    Refresh all :py:class:`~.AsyncPool`\\ s making up ``pool``
+
+    :param pool: the pool to refresh, including all pools it decorates or contains
+    :param limiter: limit on the number of pools refreshed at the same time
+    :param timeout: maximum seconds to wait for the refresh of each pool
+    :return: the number of pools whose refresh failed or timed out
+
+    The children of a :py:class:`~.CompositePool` are refreshed concurrently
+    via :py:meth:`~.CompositePool.refresh_children`.
+    If the refresh of a pool fails or times out, the pool keeps its stale metrics.
+    """
+    import trio
+
+    limiter = limiter if limiter is not None else trio.CapacityLimiter(math.inf)
+    if isinstance(pool, AsyncPool):
+        return await _refresh_leaf(pool, limiter, timeout)
+    elif isinstance(pool, PoolDecorator):
+        return await refresh_pool(pool.target, limiter, timeout)
+    elif isinstance(pool, CompositePool):
+        return await pool.refresh_children(limiter, timeout)
+    return 0
+
+
+async def _refresh_leaf(
+    pool: AsyncPool, limiter: "trio.CapacityLimiter", timeout: Optional[float]
+) -> int:
+    import trio
+
+    async with limiter:
+        with trio.move_on_after(math.inf if timeout is None else timeout) as scope:
+            try:
+                await pool.refresh()
+            except Exception:
+                _logger.exception("failed to refresh %r, keeping stale metrics", pool)
+                return 1
+    if scope.cancelled_caught:
+        _logger.warning(
+            "timeout refreshing %r after %ss, keeping stale metrics", pool, timeout
+        )
+        return 1
+    return 0
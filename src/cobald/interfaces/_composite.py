@@ -1,15 +1,31 @@
 import abc
-from typing import List
+import math
+import sys
+from typing import Callable, List, Optional, TYPE_CHECKING
 
+from ._pool import Pool, PoolState
 
-from ._pool import Pool
+if TYPE_CHECKING:
+    import trio
 
 
 class CompositePool(Pool):
     """
     Concatenation of multiple providers for a number of indistinguishable resources
+
+    Since the metrics of a composite depend on all its children, they are
+    gathered in one pass by :py:meth:`snapshot`. Inside the :py:mod:`trio`
+    event loop, the result is reused for the current tick: until the ``demand``
+    is set or the active task yields to the event loop.
+    Outside of the event loop, every :py:meth:`snapshot` inspects all children.
+
+    Children that must refresh their metrics asynchronously, such as
+    an :py:class:`~.AsyncPool`, are refreshed concurrently by
+    :py:meth:`refresh_children`.
     """
 
+    _snapshot_cache = None  # type: Optional[PoolState]
+
     @property
     @abc.abstractmethod
     def supply(self):
@@ -49,3 +65,72 @@ class CompositePool(Pool):
     @abc.abstractmethod
     def children(self, value: List[Pool]):
         raise NotImplementedError
+
+    def snapshot(self) -> PoolState:
+        cached = self._snapshot_cache
+        if cached is None:
+            cached = self._aggregate()
+            if _call_next_tick(self._invalidate_snapshot):
+                self._snapshot_cache = cached
+        return cached
+
+    def _aggregate(self) -> PoolState:
+        """Gather the current metrics from all children"""
+        return super().snapshot()
+
+    def _invalidate_snapshot(self):
+        """Discard any cached :py:meth:`snapshot`, e.g. after changing ``demand``"""
+        self._snapshot_cache = None
+
+    async def refresh_children(
+        self,
+        limiter: "Optional[trio.CapacityLimiter]" = None,
+        timeout: Optional[float] = None,
+    ) -> int:
+        """
+        Refresh all :py:attr:`children` concurrently
+
+        :param limiter: limit on the number of pools refreshed at the same time
+        :param timeout: maximum seconds to wait for the refresh of each pool
+        :return: the number of pools whose refresh failed or timed out
+
+        Refreshing takes as long as the slowest child, not the sum of all
+        children. Children that fail or time out keep their stale metrics.
+        See :py:func:`~.refresh_pool` for details.
+        """
+        # trio is only needed once pools are refreshed, not to define them
+        import trio
+        from ._async import refresh_pool
+
+        limiter = limiter if limiter is not None else trio.CapacityLimiter(math.inf)
+        stale = 0
+
+        async def refresh_child(child: Pool):
+            nonlocal stale
+            failed = await refresh_pool(child, limiter, timeout)
+            stale += failed
+
+        async with trio.open_nursery() as nursery:
+            for child in self.children:
+                nursery.start_soon(refresh_child, child)
+        self._invalidate_snapshot()
+        return stale
+
+
+def _call_next_tick(callback: Callable[[], None]) -> bool:
+    """
+    Call ``callback`` once the current :py:mod:`trio` task yields
+
+    :return: whether ``callback`` was scheduled,
+             which requires to run inside the :py:mod:`trio` event loop
+    """
+    # a pool that is not used from trio should not load it
+    trio = sys.modules.get("trio")
+    if trio is None:
+        return False
+    try:
+        trio_token = trio.lowlevel.current_trio_token()
+    except RuntimeError:
+        return False
+    trio_token.run_sync_soon(callback)
+    return True
@@ -1,5 +1,5 @@
 import abc
-from typing import TypeVar, Type, TYPE_CHECKING
+from typing import TypeVar, Type, NamedTuple, TYPE_CHECKING
 
 from ._partial import Partial
 
@@ -10,6 +10,15 @@ if TYPE_CHECKING:
 C = TypeVar("C", bound="Controller")
 
 
+class PoolState(NamedTuple):
+    """Consistent view on the state of a :py:class:`~.Pool` at one point in time"""
+
+    supply: float
+    demand: float
+    utilisation: float
+    allocation: float
+
+
 class Pool(metaclass=abc.ABCMeta):
     """
     Individual provider for a number of indistinguishable resources
@@ -44,6 +53,23 @@ class Pool(metaclass=abc.ABCMeta):
         """Fraction of the provided resources which are assigned for usage"""
         raise NotImplementedError
 
+    def snapshot(self) -> PoolState:
+        """
+        Fetch :py:attr:`supply`, :py:attr:`demand`, :py:attr:`utilisation`
+        and :py:attr:`allocation` at once
+
+        Consumers that require several metrics of a pool should prefer a single
+        snapshot over individual property reads. Pools that must inspect other
+        pools or external resources to provide their metrics should override this
+        method to gather all metrics in one pass.
+        """
+        return PoolState(
+            supply=self.supply,
+            demand=self.demand,
+            utilisation=self.utilisation,
+            allocation=self.allocation,
+        )
+
     @classmethod
     def s(cls: Type[C], *args, **kwargs) -> Partial[C]:
         """
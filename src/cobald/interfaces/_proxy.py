@@ -1,4 +1,4 @@
-from ._pool import Pool
+from ._pool import Pool, PoolState
 from typing import TypeVar, Type
 
 
@@ -54,3 +54,14 @@ class PoolDecorator(Pool):
     def allocation(self) -> float:
         """Fraction of the provided resources which is assigned for usage"""
         return self.target.allocation
+
+    def snapshot(self) -> PoolState:
+        cls = type(self)
+        if (
+            cls.supply is PoolDecorator.supply
+            and cls.utilisation is PoolDecorator.utilisation
+            and cls.allocation is PoolDecorator.allocation
+        ):
+            # only the demand may be modified, take everything else from the target
+            return self.target.snapshot()._replace(demand=self.demand)
+        return super().snapshot()
@@ -0,0 +1,33 @@
+r"""
+Offline simulation of pipelines in accelerated, simulated time
+
+A :py:class:`~.Simulation` replays a trace of :py:class:`~.Job`\ s against
+a pipeline ending in a :py:class:`~.SimulatedPool`.
+Instead of waiting, a discrete-event :py:class:`~.SimulationClock` regulates
+the controllers of the pipeline and jumps directly to the next event.
+The resulting :py:class:`~.SimulationReport` helps to tune controllers,
+such as their ``rate`` and ``interval``, before deploying them.
+
+Simulations of YAML configurations can also be run from the command line:
+
+.. code:: bash
+
+    python -m cobald.simulation config.yaml trace.csv
+"""
+from .clock import SimulationClock
+from .metrics import MetricsRecorder, SimulationReport
+from .pool import SimulatedPool
+from .simulator import Simulation, simulate
+from .trace import Job, read_trace, poisson_trace
+
+__all__ = [
+    "SimulationClock",
+    "MetricsRecorder",
+    "SimulationReport",
+    "SimulatedPool",
+    "Simulation",
+    "simulate",
+    "Job",
+    "read_trace",
+    "poisson_trace",
+]
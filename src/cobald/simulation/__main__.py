@@ -0,0 +1,3 @@
+from .cli import cli_run
+
+cli_run()
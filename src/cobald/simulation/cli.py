@@ -0,0 +1,38 @@
+import argparse
+import time
+
+from .simulator import Simulation, load_pipeline
+from .trace import read_trace
+
+CLI = argparse.ArgumentParser(
+    description="Simulate a COBalD pipeline against a trace of jobs"
+)
+CLI.add_argument("CONFIGURATION", help="path of the YAML configuration to use")
+CLI.add_argument("TRACE", help="path of the CSV trace of jobs to replay")
+CLI.add_argument(
+    "--until",
+    help="simulated seconds to run; defaults to the end of the trace",
+    type=float,
+    default=None,
+)
+CLI.add_argument(
+    "--resolution",
+    help="simulated seconds between samples of metrics",
+    type=float,
+    default=1.0,
+)
+
+
+def cli_run(args=None):
+    """Run a simulation from a command line interface"""
+    options = CLI.parse_args(args)
+    simulation = Simulation(
+        load_pipeline(options.CONFIGURATION),
+        read_trace(options.TRACE),
+        resolution=options.resolution,
+    )
+    start = time.perf_counter()
+    report = simulation.run(options.until)
+    elapsed = time.perf_counter() - start
+    print(report.format())
+    print("simulated %.4g s in %.4g s" % (report.duration, elapsed))
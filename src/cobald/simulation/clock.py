@@ -0,0 +1,96 @@
+from typing import Callable, List, Optional
+import heapq
+import itertools
+import math
+
+from ..daemon.scheduler import Regulated
+
+
+class Event(object):
+    """
+    Callback scheduled to run at a specific time of a :py:class:`SimulationClock`
+
+    :param when: the simulated time at which to run ``callback``
+    :param callback: the callable to run
+    :param args: positional arguments for ``callback``
+    """
+
+    __slots__ = ("when", "callback", "args", "active")
+
+    def __init__(self, when: float, callback: Callable, *args):
+        self.when = when
+        self.callback = callback
+        self.args = args
+        self.active = True
+
+    def cancel(self):
+        """Do not run the callback of this event"""
+        self.active = False
+
+
+class SimulationClock(object):
+    """
+    Discrete-event clock running scheduled callbacks in simulated time
+
+    :param start: the initial simulated time
+
+    Time only advances by running events: the :py:attr:`time` jumps directly
+    to the next scheduled event without waiting.
+    Events scheduled for the same time run in the order they were scheduled.
+    """
+
+    def __init__(self, start: float = 0.0):
+        #: the current simulated time
+        self.time = start
+        self._queue = []  # type: List[List]
+        self._counter = itertools.count()
+
+    def schedule(self, when: float, callback: Callable, *args) -> Event:
+        """Run ``callback(*args)`` at the simulated time ``when``"""
+        assert when >= self.time, "cannot schedule events in the past"
+        event = Event(when, callback, *args)
+        heapq.heappush(self._queue, [when, next(self._counter), event])
+        return event
+
+    def delay(self, delay: float, callback: Callable, *args) -> Event:
+        """Run ``callback(*args)`` after ``delay`` simulated seconds"""
+        return self.schedule(self.time + delay, callback, *args)
+
+    def every(self, interval: float, regulated: Regulated) -> Event:
+        """
+        Call ``regulated.regulate(interval)`` every ``interval`` simulated seconds
+
+        The first call happens one ``interval`` from now.
+        Cancelling the returned event stops all further calls.
+        """
+        assert interval > 0, "interval must be positive"
+
+        def tick():
+            regulated.regulate(interval)
+            if ticker.active:
+                ticker.when += interval
+                heapq.heappush(self._queue, [ticker.when, next(self._counter), ticker])
+
+        ticker = self.schedule(self.time + interval, tick)
+        return ticker
+
+    def run(self, until: Optional[float] = None) -> float:
+        """
+        Run all events scheduled until the simulated time ``until``
+
+        :return: the simulated time after running all events
+
+        If ``until`` is :py:const:`None`, run until no events are left.
+        Otherwise, the :py:attr:`time` is ``until`` afterwards.
+        """
+        until = math.inf if until is None else until
+        queue = self._queue
+        while queue and queue[0][0] <= until:
+            when, _, event = heapq.heappop(queue)
+            if not event.active:
+                continue
+            self.time = when
+            event.callback(*event.args)
+        if until != math.inf:
+            self.time = max(self.time, until)
+        return self.time
@@ -0,0 +1,102 @@
+from typing import NamedTuple, Optional
+
+from .pool import SimulatedPool
+
+
+class SimulationReport(NamedTuple):
+    """Summary of how well a pipeline served a trace"""
+
+    #: simulated seconds covered by the report
+    duration: float
+    #: number of jobs that completed
+    completed: int
+    #: completed jobs per simulated hour
+    throughput: float
+    #: average simulated seconds started jobs waited for a resource
+    mean_wait: float
+    #: average number of resources providing supply
+    mean_supply: float
+    #: largest number of resources providing supply
+    peak_supply: float
+    #: average number of jobs waiting for a resource
+    mean_queued: float
+    #: fraction of supply that was not allocated to any job
+    over_provisioning: float
+    #: number of reversals between increasing and decreasing demand per hour
+    oscillation: float
+    #: total absolute change of demand per simulated hour
+    demand_variation: float
+
+    def format(self) -> str:
+        """Format the report as human readable lines of ``name: value``"""
+        width = max(map(len, self._fields))
+        return "\n".join(
+            "%-*s %s" % (width + 1, name + ":", _format_value(value))
+            for name, value in zip(self._fields, self)
+        )
+
+
+def _format_value(value) -> str:
+    return ("%.4g" % value) if isinstance(value, float) else str(value)
+
+
+class MetricsRecorder(object):
+    """
+    Sample the state of a :py:class:`~.SimulatedPool` on every tick
+
+    :param pool: the pool to sample
+
+    The recorder is meant to be regulated periodically by a
+    :py:class:`~.SimulationClock`; every sample is weighted
+    by the interval since the previous one.
+    """
+
+    def __init__(self, pool: SimulatedPool):
+        self.pool = pool
+        self.duration = 0.0
+        self._supply = 0.0
+        self._allocated = 0.0
+        self._queued = 0.0
+        self._peak_supply = 0.0
+        self._reversals = 0
+        self._variation = 0.0
+        self._last_demand = pool.demand
+        #: direction of the last change of demand, if any
+        self._direction = None  # type: Optional[bool]
+
+    def regulate(self, interval: float):
+        pool = self.pool
+        supply = pool.supply
+        self.duration += interval
+        self._supply += supply * interval
+        self._allocated += supply * pool.allocation * interval
+        self._queued += pool.queued * interval
+        self._peak_supply = max(self._peak_supply, supply)
+        demand = pool.demand
+        if demand != self._last_demand:
+            direction = demand > self._last_demand
+            if self._direction is not None and direction != self._direction:
+                self._reversals += 1
+            self._direction = direction
+            self._variation += abs(demand - self._last_demand)
+            self._last_demand = demand
+
+    def report(self) -> SimulationReport:
+        """Summarise all samples taken so far"""
+        pool, hours = self.pool, self.duration / 3600
+        try:
+            over_provisioning = 1 - self._allocated / self._supply
+        except ZeroDivisionError:
+            over_provisioning = 0.0
+        return SimulationReport(
+            duration=self.duration,
+            completed=pool.completed,
+            throughput=pool.completed / hours if hours else 0.0,
+            mean_wait=pool.wait_time / pool.started if pool.started else 0.0,
+            mean_supply=self._supply / self.duration if self.duration else 0.0,
+            peak_supply=float(self._peak_supply),
+            mean_queued=self._queued / self.duration if self.duration else 0.0,
+            over_provisioning=over_provisioning,
+            oscillation=self._reversals / hours if hours else 0.0,
+            demand_variation=self._variation / hours if hours else 0.0,
+        )
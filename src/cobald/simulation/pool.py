@@ -0,0 +1,153 @@
+from typing import Deque, Optional
+from collections import deque
+
+from ..interfaces import Pool
+from .clock import SimulationClock, Event
+from .trace import Job
+
+
+class SimulatedPool(Pool):
+    """
+    Synthetic pool of resources that each run one job at a time
+
+    :param spawn_latency: simulated seconds from requesting a resource
+                          until it provides supply
+    :param demand: the initial demand
+
+    The :py:attr:`demand` is rounded to a whole number of resources.
+    Increasing the demand boots new resources, which provide supply after
+    ``spawn_latency``. Decreasing the demand first cancels booting resources,
+    then shuts down idle resources, and finally drains busy resources:
+    these run their current job to completion and then shut down.
+
+    Submitted jobs run on idle resources, or wait in a queue for the next
+    resource to become idle.
+    The :py:attr:`allocation` is the fraction of resources running a job,
+    and the :py:attr:`utilisation` is the fraction of resources actually used
+    according to the ``cpu`` of jobs.
+    Without any resources, both are 1.
+
+    The pool must be bound to a :py:class:`~.SimulationClock` via :py:meth:`bind`
+    before it can boot resources or run jobs.
+    """
+
+    @property
+    def demand(self):
+        return self._demand
+
+    @demand.setter
+    def demand(self, value):
+        self._demand = value
+        if self.clock is not None:
+            self._reconcile()
+
+    @property
+    def supply(self):
+        return self._idle + self._busy
+
+    @property
+    def allocation(self):
+        try:
+            return self._busy / self.supply
+        except ZeroDivisionError:
+            return 1.0
+
+    @property
+    def utilisation(self):
+        try:
+            return self._cpu / self.supply
+        except ZeroDivisionError:
+            return 1.0
+
+    @property
+    def booting(self) -> int:
+        """Number of resources that are not yet available"""
+        return len(self._booting)
+
+    @property
+    def queued(self) -> int:
+        """Number of jobs waiting for a resource"""
+        return len(self._queue)
+
+    def __init__(self, spawn_latency: float = 0.0, demand: float = 0):
+        self.spawn_latency = spawn_latency
+        self.clock = None  # type: Optional[SimulationClock]
+        self._demand = demand
+        #: boot events of resources not yet available, oldest first
+        self._booting = deque()  # type: Deque[Event]
+        self._idle = 0
+        self._busy = 0
+        #: busy resources to shut down once their job completes
+        self._draining = 0
+        #: total cpu used by running jobs
+        self._cpu = 0.0
+        self._queue = deque()  # type: Deque[Job]
+        #: number of jobs that started and completed
+        self.started, self.completed = 0, 0
+        #: total simulated time started jobs waited for a resource
+        self.wait_time = 0.0
+
+    def bind(self, clock: SimulationClock):
+        """Use ``clock`` to simulate booting resources and running jobs"""
+        self.clock = clock
+        self._reconcile()
+
+    def submit(self, job: Job):
+        """Submit a ``job`` to run on the next idle resource"""
+        self._queue.append(job)
+        self._start_jobs()
+
+    def _reconcile(self):
+        """Boot or shut down resources to match the demand"""
+        target = round(self._demand)
+        provided = self.supply - self._draining + len(self._booting)
+        if provided < target and self._draining:
+            kept = min(target - provided, self._draining)
+            self._draining -= kept
+            provided += kept
+        while provided < target:
+            self._booting.append(self.clock.delay(self.spawn_latency, self._booted))
+            provided += 1
+        while provided > target and self._booting:
+            self._booting.pop().cancel()
+            provided -= 1
+        released = min(provided - target, self._idle) if provided > target else 0
+        self._idle -= released
+        provided -= released
+        if provided > target:
+            self._draining += provided - target
+
+    def _booted(self):
+        self._booting.popleft()
+        self._idle += 1
+        self._start_jobs()
+
+    def _start_jobs(self):
+        queue, clock = self._queue, self.clock
+        while queue and self._idle:
+            job = queue.popleft()
+            self._idle -= 1
+            self._busy += 1
+            self._cpu += job.cpu
+            self.started += 1
+            self.wait_time += clock.time - job.submit
+            clock.delay(job.duration, self._completed, job)
+
+    def _completed(self, job: Job):
+        self._busy -= 1
+        self._cpu -= job.cpu
+        self.completed += 1
+        if self._draining:
+            self._draining -= 1
+        else:
+            self._idle += 1
+            self._start_jobs()
+
+    def __repr__(self):
+        return "<%s demand=%s, supply=%s, booting=%s, queued=%s>" % (
+            self.__class__.__name__,
+            self.demand,
+            self.supply,
+            self.booting,
+            self.queued,
+        )
@@ -0,0 +1,96 @@
+from typing import Iterable, List, Optional, Sequence
+
+from ..daemon.core.config import load
+from .clock import SimulationClock
+from .metrics import MetricsRecorder, SimulationReport
+from .pool import SimulatedPool
+from .trace import Job
+
+
+def regulate_interval(item) -> Optional[float]:
+    """Get the interval at which ``item`` must be regulated, if at all"""
+    if not callable(getattr(item, "regulate", None)):
+        return None
+    for name in ("interval", "window"):
+        interval = getattr(item, name, None)
+        if isinstance(interval, (int, float)):
+            return interval
+    return None
+
+
+class Simulation(object):
+    """
+    Replay a ``trace`` of jobs against a ``pipeline`` in simulated time
+
+    :param pipeline: the items of a pipeline, from the controller to a
+                     :py:class:`~.SimulatedPool`
+    :param trace: the jobs to submit to the :py:class:`~.SimulatedPool`
+    :param resolution: simulated seconds between samples of metrics
+
+    Every item of the ``pipeline`` with a ``regulate`` method is regulated
+    at its ``interval`` (or ``window`` for buffers).
+    Note that items which require a running daemon to ``regulate``,
+    such as a :py:class:`~.FactoryPool`, cannot be simulated.
+    """
+
+    def __init__(
+        self, pipeline: Sequence, trace: Iterable[Job], resolution: float = 1.0
+    ):
+        pool = pipeline[-1]
+        if not isinstance(pool, SimulatedPool):
+            raise TypeError(
+                "pipeline must end with a %s, not %r" % (SimulatedPool.__name__, pool)
+            )
+        self.clock = SimulationClock()
+        self.pool = pool
+        self.metrics = MetricsRecorder(pool)
+        #: simulated time at which the last job of the trace ends
+        self.end = 0.0
+        pool.bind(self.clock)
+        for job in trace:
+            self.clock.schedule(job.submit, pool.submit, job)
+            self.end = max(self.end, job.submit + job.duration)
+        for item in pipeline:
+            interval = regulate_interval(item)
+            if interval is not None:
+                self.clock.every(interval, item)
+        self.clock.every(resolution, self.metrics)
+
+    def run(self, until: Optional[float] = None) -> SimulationReport:
+        """
+        Run the simulation until the simulated time ``until``
+
+        :return: a report on the simulation so far
+
+        If ``until`` is :py:const:`None`, run until the last job of the trace
+        would end if it started immediately.
+        """
+        self.clock.run(self.end if until is None else until)
+        return self.metrics.report()
+
+
+def load_pipeline(config_path: str) -> List:
+    """Load the pipeline from the YAML configuration at ``config_path``"""
+    with load(config_path) as config:
+        try:
+            pipelines = next(
+                content
+                for plugin, content in config.items()
+                if plugin.section == "pipeline"
+            )
+        except StopIteration:
+            raise ValueError("no pipeline in configuration %r" % config_path) from None
+    if len(pipelines) != 1:
+        raise ValueError("several pipelines in configuration %r" % config_path)
+    return pipelines[0]
+
+
+def simulate(
+    config_path: str,
+    trace: Iterable[Job],
+    until: Optional[float] = None,
+    resolution: float = 1.0,
+) -> SimulationReport:
+    """Replay a ``trace`` against the pipeline of a YAML configuration"""
+    simulation = Simulation(load_pipeline(config_path), trace, resolution=resolution)
+    return simulation.run(until)
@@ -0,0 +1,56 @@
+"""
+Job arrival traces to replay against a :py:class:`~.SimulatedPool`
+
+A trace is any iterable of :py:class:`Job` instances ordered by submission time.
+Traces can be read from CSV files with the columns ``submit``, ``duration``
+and optionally ``cpu``, or generated synthetically.
+"""
+from typing import Iterator, NamedTuple, Optional
+import csv
+import random
+
+
+class Job(NamedTuple):
+    """Single job occupying one resource for a fixed ``duration``"""
+
+    #: simulated time at which the job arrives
+    submit: float
+    #: simulated time the job runs once started
+    duration: float
+    #: fraction of its resource the job actually uses
+    cpu: float = 1.0
+
+
+def read_trace(path: str) -> Iterator[Job]:
+    """Read a trace from the CSV file at ``path``"""
+    with open(path, newline="") as trace_file:
+        for row in csv.DictReader(trace_file):
+            yield Job(
+                submit=float(row["submit"]),
+                duration=float(row["duration"]),
+                cpu=float(row.get("cpu") or 1.0),
+            )
+
+
+def poisson_trace(
+    rate: float,
+    until: float,
+    mean_duration: float,
+    cpu: float = 1.0,
+    seed: Optional[int] = None,
+) -> Iterator[Job]:
+    """
+    Generate a trace of jobs arriving at random
+
+    :param rate: average number of jobs arriving per second
+    :param until: simulated time after which no more jobs arrive
+    :param mean_duration: average duration of jobs,
+                          which is exponentially distributed
+    :param cpu: fraction of its resource each job uses
+    :param seed: seed for the random number generator to reproduce a trace
+    """
+    rng = random.Random(seed)
+    submit = rng.expovariate(rate)
+    while submit < until:
+        yield Job(submit=submit, duration=rng.expovariate(1 / mean_duration), cpu=cpu)
+        submit += rng.expovariate(rate)